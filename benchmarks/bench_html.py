@@ -0,0 +1,76 @@
+"""Compare HTML-to-paragraph backends against the original BeautifulSoup implementation.
+
+Run from the repository root::
+
+    python benchmarks/bench_html.py --repeat 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+from typing import Callable, List
+
+from bs4 import BeautifulSoup
+
+from moledao_spider.clients import HarCareerDetailsClient
+from moledao_spider.html_text import HtmlConverter, _available
+from moledao_spider.models import extract_content
+
+DETAIL_HARS = sorted(Path("har").glob("moledao.io_api_career_details*.har"))
+
+
+def legacy_html_to_lines(html: str) -> List[str]:
+    """The exporter's pre-``html_text`` implementation, kept as the baseline."""
+    if not html:
+        return ["N/A"]
+    soup = BeautifulSoup(html, "html.parser")
+    for tag in soup(["script", "style"]):
+        tag.decompose()
+    lines: List[str] = []
+    for block in soup.find_all(["p", "li", "div"]):
+        text = block.get_text(" ", strip=True)
+        if text:
+            lines.append(text)
+    if not lines:
+        text = soup.get_text(" ", strip=True)
+        if text:
+            lines.append(text)
+    return lines or ["N/A"]
+
+
+def _time(convert: Callable[[str], List[str]], htmls: List[str], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for html in htmls:
+            convert(html)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=100, help="Passes over the fixtures.")
+    args = parser.parse_args()
+
+    client = HarCareerDetailsClient(DETAIL_HARS)
+    htmls = [extract_content(detail) for detail in client._cache.values()]
+    conversions = len(htmls) * args.repeat
+
+    rows = [("bs4 (legacy)", _time(legacy_html_to_lines, htmls, args.repeat))]
+    for backend in ("html.parser", "lxml", "selectolax"):
+        if not _available(backend):
+            continue
+        uncached = HtmlConverter(backend, memo_size=0)
+        rows.append((backend, _time(uncached, htmls, args.repeat)))
+        rows.append((f"{backend} + memo", _time(HtmlConverter(backend), htmls, args.repeat)))
+
+    baseline = rows[0][1]
+    print(f"{conversions} conversions of {len(htmls)} fixture descriptions")
+    for name, elapsed in rows:
+        per_call = elapsed / conversions * 1e6
+        print(f"{name:<24} {per_call:9.1f} us/call  {baseline / elapsed:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
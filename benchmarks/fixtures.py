@@ -0,0 +1,67 @@
+"""Synthesize large HAR captures by scaling the bundled fixtures."""
+
+from __future__ import annotations
+
+import copy
+import json
+import uuid
+from pathlib import Path
+from typing import List, Tuple
+
+from moledao_spider.har import extract_entry_json, iter_har_entries
+
+FIXTURES = Path("har")
+LIST_HAR = FIXTURES / "moledao.io_api_career_list.har"
+DETAIL_HARS = sorted(FIXTURES.glob("moledao.io_api_career_details*.har"))
+
+
+def _template_entries() -> Tuple[dict, List[dict], List[dict]]:
+    list_entry = next(iter_har_entries(LIST_HAR))
+    summaries = extract_entry_json(list_entry)["data"]["list"]
+    detail_entries = [next(iter_har_entries(path)) for path in DETAIL_HARS]
+    return list_entry, summaries, detail_entries
+
+
+def _with_body(entry: dict, payload: dict) -> dict:
+    entry = copy.deepcopy(entry)
+    content = entry["response"]["content"]
+    content.pop("encoding", None)
+    content["text"] = json.dumps(payload, ensure_ascii=False)
+    return entry
+
+
+def synthesize(size: int, directory: Path) -> Tuple[Path, Path]:
+    """Write a list HAR and a detail HAR holding ``size`` jobs; return their paths.
+
+    Ids are fresh UUIDs and every description gets a unique trailing paragraph
+    so memoized HTML conversion cannot short-circuit the measurement.
+    """
+    list_entry, summaries, detail_entries = _template_entries()
+    detail_payloads = [extract_entry_json(entry) for entry in detail_entries]
+
+    jobs: List[dict] = []
+    details: List[dict] = []
+    for idx in range(size):
+        job_id = str(uuid.UUID(int=idx))
+        summary = {**summaries[idx % len(summaries)], "id": job_id}
+        jobs.append(summary)
+
+        template_idx = idx % len(detail_entries)
+        payload = copy.deepcopy(detail_payloads[template_idx])
+        payload["data"]["id"] = job_id
+        content = payload["data"].get("content") or {}
+        content["content"] = f"{content.get('content') or ''}<p>Reference {idx}</p>"
+        payload["data"]["content"] = content
+        entry = _with_body(detail_entries[template_idx], payload)
+        entry["request"]["url"] = f"https://api.moledao.io/api/career/details?id={job_id}"
+        details.append(entry)
+
+    list_payload = extract_entry_json(list_entry)
+    list_payload["data"] = {"list": jobs, "total": size}
+    list_path = directory / f"list-{size}.har"
+    detail_path = directory / f"details-{size}.har"
+    list_path.write_text(
+        json.dumps({"log": {"entries": [_with_body(list_entry, list_payload)]}}), "utf-8"
+    )
+    detail_path.write_text(json.dumps({"log": {"entries": details}}), "utf-8")
+    return list_path, detail_path
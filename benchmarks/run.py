@@ -0,0 +1,174 @@
+"""Benchmark suite for the replay pipeline stages.
+
+Synthesizes HAR captures of the requested sizes from the bundled fixtures, then
+times each stage separately and records throughput and peak traced memory::
+
+    python benchmarks/run.py --sizes 1000 10000 --output baseline.json
+    python benchmarks/run.py --sizes 1000 10000 --compare baseline.json
+
+``--compare`` exits non-zero when any stage is slower than the baseline by more
+than ``--threshold`` (default 20%).
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from fixtures import synthesize
+
+from moledao_spider import __version__
+from moledao_spider.clients import (
+    HarCareerDetailsClient,
+    HarCareerListClient,
+    _load_har_entries,
+)
+from moledao_spider.exporter import DocxExporter, _html_to_lines
+from moledao_spider.html_text import get_converter
+from moledao_spider.models import build_career_record
+from moledao_spider.record_batch import CareerRecordBatch
+
+STAGES = (
+    "har_load",
+    "detail_index",
+    "build_records",
+    "record_batch",
+    "html_to_lines",
+    "docx_export",
+    "docx_template",
+)
+
+
+def _measure(stage: Callable[[], int], memory: bool) -> Dict[str, float]:
+    gc.collect()
+    start = time.perf_counter()
+    items = stage()
+    seconds = time.perf_counter() - start
+    result = {"items": items, "seconds": seconds, "items_per_sec": items / seconds}
+    if memory:
+        # A second, traced pass so tracing overhead does not skew the timing.
+        gc.collect()
+        tracemalloc.start()
+        stage()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        result["peak_mb"] = peak / 2**20
+    return result
+
+
+def run_size(size: int, workdir: Path, stages: List[str], memory: bool) -> Dict[str, dict]:
+    list_har, detail_har = synthesize(size, workdir)
+    summaries = HarCareerListClient(list_har, use_index=False).fetch()
+    details = HarCareerDetailsClient([detail_har], use_index=False)
+    pairs = [(summary, details.fetch(summary["id"])) for summary in summaries]
+    records = [build_career_record(summary, detail) for summary, detail in pairs]
+    converter = get_converter()
+
+    def har_load() -> int:
+        return len(_load_har_entries(detail_har))
+
+    def detail_index() -> int:
+        return len(HarCareerDetailsClient([detail_har], use_index=False)._cache)
+
+    def build_records() -> int:
+        return len([build_career_record(summary, detail) for summary, detail in pairs])
+
+    def record_batch() -> int:
+        summaries, details = zip(*pairs) if pairs else ((), ())
+        return len(CareerRecordBatch.from_pairs(summaries, details))
+
+    def html_to_lines() -> int:
+        converter._memo.clear()
+        for record in records:
+            _html_to_lines(record.html_content)
+        return len(records)
+
+    def docx_export(engine: str = "python-docx") -> int:
+        with tempfile.TemporaryDirectory() as output_dir:
+            DocxExporter(Path(output_dir), engine=engine).export(records)
+        return len(records)
+
+    available = {
+        "har_load": har_load,
+        "detail_index": detail_index,
+        "build_records": build_records,
+        "record_batch": record_batch,
+        "html_to_lines": html_to_lines,
+        "docx_export": docx_export,
+        "docx_template": lambda: docx_export("template"),
+    }
+    results = {}
+    for name in stages:
+        results[name] = _measure(available[name], memory)
+        print(_format_row(size, name, results[name]), flush=True)
+    return results
+
+
+def _format_row(size: int, name: str, result: dict) -> str:
+    peak = f"{result['peak_mb']:9.1f} MB" if "peak_mb" in result else ""
+    return (
+        f"{size:>8} {name:<14} {result['seconds']:9.3f} s "
+        f"{result['items_per_sec']:12.0f} items/s {peak}"
+    )
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> List[str]:
+    regressions = []
+    for size, stages in current["results"].items():
+        for name, result in stages.items():
+            base = baseline.get("results", {}).get(size, {}).get(name)
+            if not base:
+                continue
+            ratio = result["seconds"] / base["seconds"]
+            marker = "REGRESSION" if ratio > 1 + threshold else ""
+            print(f"{size:>8} {name:<14} {ratio:6.2f}x baseline time {marker}")
+            if marker:
+                regressions.append(f"{name}@{size}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000])
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=list(STAGES))
+    parser.add_argument("--no-memory", action="store_true", help="Skip the traced pass.")
+    parser.add_argument("--output", type=Path, help="Write results as JSON.")
+    parser.add_argument("--compare", type=Path, help="Baseline JSON to diff against.")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    args = parser.parse_args()
+
+    report = {
+        "meta": {
+            "version": __version__,
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "html_backend": get_converter().backend,
+        },
+        "results": {},
+    }
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in args.sizes:
+            report["results"][str(size)] = run_size(
+                size, Path(workdir), args.stages, memory=not args.no_memory
+            )
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+    if args.compare:
+        regressions = compare(report, json.loads(args.compare.read_text()), args.threshold)
+        if regressions:
+            print(f"Regressed stages: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,216 @@
+"""Adaptive concurrency for the live clients: AIMD limits, Retry-After and a circuit breaker.
+
+One :class:`AdaptiveController` is shared by every live request to the API
+host. It starts with a single request in flight and doubles the limit each
+time a full window of requests succeeds (slow start). After the first
+backoff it adds one slot per window instead. A 429, a 5xx, a transport error
+or latency well above the fastest seen so far halves the limit. A
+``Retry-After`` pauses every caller, not just the one that got it. Too many
+consecutive failures open the circuit, which pauses traffic for
+``reset_timeout`` seconds before a single probe request is let through.
+After ``max_trips`` openings in a row without a success, callers get
+:class:`CircuitOpenError` instead of waiting again.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Callable, Mapping
+
+if TYPE_CHECKING:
+    from .metrics import RunMetrics
+
+logger = logging.getLogger(__name__)
+
+MAX_RETRY_AFTER = 300.0
+# Poll interval for callers waiting on a free slot; slots free up as responses arrive.
+_SLOT_POLL = 0.01
+
+
+class RateLimitedError(RuntimeError):
+    """The API answered 429 (or 503 with ``Retry-After``); ``retry_after`` is in seconds."""
+
+    def __init__(self, status: int, retry_after: float | None = None) -> None:
+        detail = f", retry after {retry_after:g}s" if retry_after is not None else ""
+        super().__init__(f"Rate limited by the API (HTTP {status}{detail})")
+        self.status = status
+        self.retry_after = retry_after
+
+
+class CircuitOpenError(Exception):
+    """The API kept failing after repeated circuit-breaker pauses; the run should stop."""
+
+
+def parse_retry_after(
+    value: str | None, now: Callable[[], float] = time.time
+) -> float | None:
+    """Seconds to wait from a ``Retry-After`` header (delta-seconds or HTTP-date)."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - now()
+        except (TypeError, ValueError):
+            return None
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
+
+
+def retry_after_of(status: int, headers: Mapping[str, str]) -> float | None:
+    """The ``Retry-After`` delay of a throttling response, ``None`` for other responses."""
+    if status not in (429, 503):
+        return None
+    return parse_retry_after(headers.get("Retry-After"))
+
+
+def is_overload(status: int | None) -> bool:
+    """Whether a response status (``None`` for a transport error) signals an overloaded API."""
+    return status is None or status == 429 or status >= 500
+
+
+class AdaptiveController:
+    """Thread-safe AIMD limit on in-flight requests with ``Retry-After`` and a circuit breaker."""
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        min_concurrency: int = 1,
+        decrease: float = 0.5,
+        latency_factor: float = 3.0,
+        failure_threshold: int = 10,
+        reset_timeout: float = 30.0,
+        max_trips: int = 3,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        metrics: RunMetrics | None = None,
+    ) -> None:
+        if not 1 <= min_concurrency <= max_concurrency:
+            raise ValueError("need 1 <= min_concurrency <= max_concurrency")
+        if not 0 < decrease < 1:
+            raise ValueError("decrease must be between 0 and 1")
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.decrease = decrease
+        self.latency_factor = latency_factor
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.max_trips = max_trips
+        self.metrics = metrics
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self.limit = min_concurrency
+        self.in_flight = 0
+        self._slow_start = True
+        self._window = 0
+        self._latency: float | None = None
+        self._fastest: float | None = None
+        self._last_backoff = float("-inf")
+        self._resume_at = float("-inf")
+        self._failures = 0
+        self._trips = 0
+        self._probing = False
+
+    @property
+    def circuit_open(self) -> bool:
+        return self._trips > 0
+
+    def try_acquire(self) -> float:
+        """Take a slot if one is free, else return the seconds to wait before trying again.
+
+        Raises :class:`CircuitOpenError` once the circuit has opened ``max_trips`` times
+        in a row.
+        """
+        with self._lock:
+            if self._trips >= self.max_trips:
+                raise CircuitOpenError(
+                    f"API still failing after {self.max_trips} circuit-breaker pauses"
+                )
+            pause = self._resume_at - self._clock()
+            if pause > 0:
+                return pause
+            if self._trips:
+                # Half-open: one probe decides whether the circuit closes again.
+                if self._probing:
+                    return _SLOT_POLL
+                self._probing = True
+            elif self.in_flight >= self.limit:
+                return _SLOT_POLL
+            self.in_flight += 1
+            return 0.0
+
+    def acquire(self) -> None:
+        """Block until a slot is free, then take it."""
+        while (wait := self.try_acquire()) > 0:
+            self._sleep(wait)
+
+    def release(
+        self, latency: float, status: int | None, retry_after: float | None = None
+    ) -> None:
+        """Return a slot and adapt to the response: ``status`` is ``None`` for a transport error."""
+        with self._lock:
+            self.in_flight = max(0, self.in_flight - 1)
+            self._probing = False
+            now = self._clock()
+            paused = now < self._resume_at
+            if retry_after:
+                self._resume_at = max(self._resume_at, now + retry_after)
+            if is_overload(status):
+                self._on_failure(now, paused)
+            elif status < 400:
+                self._on_success(latency, now)
+
+    def _on_success(self, latency: float, now: float) -> None:
+        if self._trips:
+            logger.info("Circuit closed: the API is answering again")
+        self._failures = 0
+        self._trips = 0
+        self._fastest = latency if self._fastest is None else min(self._fastest, latency)
+        self._latency = latency if self._latency is None else 0.8 * self._latency + 0.2 * latency
+        if self._latency > self._fastest * self.latency_factor:
+            if self.limit <= self.min_concurrency:
+                # Already at the floor: the API got slower, so slower becomes the baseline.
+                self._fastest = self._latency
+            self._backoff(now, f"latency {self._latency:.3f}s")
+            return
+        self._window += 1
+        if self._window >= self.limit:
+            self._window = 0
+            grown = self.limit * 2 if self._slow_start else self.limit + 1
+            self.limit = min(self.max_concurrency, grown)
+
+    def _on_failure(self, now: float, paused: bool) -> None:
+        self._failures += 1
+        self._backoff(now, "failed request")
+        if self._trips and paused:
+            return  # Sent before the circuit opened; only the probe decides.
+        if self._trips or self._failures >= self.failure_threshold:
+            self._trips += 1
+            self._failures = 0
+            self._resume_at = max(self._resume_at, now + self.reset_timeout)
+            if self.metrics:
+                self.metrics.incr("circuit_trips")
+            if self._trips >= self.max_trips:
+                logger.error("Circuit open %s times in a row: giving up on the API", self._trips)
+                return
+            logger.warning(
+                "Circuit open (%s/%s): pausing live requests for %.0fs",
+                self._trips,
+                self.max_trips,
+                self.reset_timeout,
+            )
+
+    def _backoff(self, now: float, reason: str) -> None:
+        self._window = 0
+        self._slow_start = False
+        # Responses to requests sent before the last backoff reflect the old limit.
+        if now - self._last_backoff < (self._latency or 0.0):
+            return
+        self._last_backoff = now
+        self.limit = max(self.min_concurrency, int(self.limit * self.decrease))
+        logger.debug("Backing off to %s in-flight requests after %s", self.limit, reason)
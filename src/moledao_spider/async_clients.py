@@ -0,0 +1,279 @@
+"""Asyncio-native live clients for the Moledao career APIs (requires ``httpx``)."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import AsyncIterator, Callable, Deque, Iterable, Iterator, List, Protocol, Tuple
+
+try:
+    import httpx
+except ImportError as exc:  # pragma: no cover - exercised only without the extra
+    raise ImportError(
+        "Async clients require httpx; install with `pip install moledao-spider[async]`"
+    ) from exc
+from tenacity import retry, retry_if_exception_type, stop_after_attempt
+
+from .adaptive import AdaptiveController, CircuitOpenError, retry_after_of
+from .clients import (
+    DEFAULT_BASE_URL,
+    DEFAULT_PAGE_SIZE,
+    RETRY_ATTEMPTS,
+    RateLimiter,
+    _count_retry,
+    _handle_response,
+    _has_next_page,
+    _list_params,
+    _retry_wait,
+)
+from .filters import JobFilter
+from .jsonio import loads_detail
+from .metrics import RunMetrics, maybe_stage
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
+
+class AsyncCareerListClient(Protocol):
+    """Async twin of :class:`~moledao_spider.clients.CareerListClient`."""
+
+    async def fetch(self) -> List[dict]:
+        """Return the raw list payload."""
+
+    def aiter_summaries(self) -> AsyncIterator[dict]:
+        """Yield list entries page by page as they become available."""
+
+
+class AsyncCareerDetailsClient(Protocol):
+    """Async twin of :class:`~moledao_spider.clients.CareerDetailsClient`."""
+
+    async def fetch(self, job_id: str) -> dict:
+        """Return the detail payload for ``job_id``."""
+
+
+def _ensure_client(client: httpx.AsyncClient | None) -> httpx.AsyncClient:
+    return client or httpx.AsyncClient(limits=DEFAULT_LIMITS, timeout=15)
+
+
+async def _throttled_get(
+    client: httpx.AsyncClient,
+    rate_limiter: RateLimiter | None,
+    url: str,
+    params: dict,
+    controller: AdaptiveController | None = None,
+) -> httpx.Response:
+    if controller:
+        while (wait := controller.try_acquire()) > 0:
+            await asyncio.sleep(wait)
+    if rate_limiter:
+        while (wait := rate_limiter.try_acquire()) > 0:
+            await asyncio.sleep(wait)
+    started = time.monotonic()
+    status = retry_after = None
+    try:
+        resp = await client.get(url, params=params)
+        status = resp.status_code
+        retry_after = retry_after_of(status, resp.headers)
+        return resp
+    finally:
+        if controller:
+            controller.release(time.monotonic() - started, status, retry_after)
+
+
+@dataclass
+class _AsyncLiveClient:
+    base_url: str = DEFAULT_BASE_URL
+    client: httpx.AsyncClient | None = None
+    rate_limiter: RateLimiter | None = None
+    metrics: RunMetrics | None = None
+    controller: AdaptiveController | None = None
+
+    def __post_init__(self) -> None:
+        self.client = _ensure_client(self.client)
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+
+@dataclass
+class AsyncLiveCareerListClient(_AsyncLiveClient):
+    """Hits the live career list endpoint with retries over a pooled httpx client."""
+
+    page_size: int = DEFAULT_PAGE_SIZE
+    max_pages: int | None = None
+    job_filter: JobFilter | None = None
+
+    @retry(
+        stop=stop_after_attempt(RETRY_ATTEMPTS),
+        wait=_retry_wait,
+        retry=retry_if_exception_type((httpx.HTTPError, RuntimeError)),
+        before_sleep=_count_retry,
+        reraise=True,
+    )
+    async def fetch_page(self, current: int) -> Tuple[List[dict], int | None]:
+        url = f"{self.base_url}/career/list"
+        logger.debug("Requesting career list page %s from %s", current, url)
+        params = _list_params(current, self.page_size, self.job_filter)
+        resp = await _throttled_get(
+            self.client, self.rate_limiter, url, params, self.controller
+        )
+        data = _handle_response(resp)
+        list_data = data.get("list") or []
+        total = data.get("total")
+        logger.info("Fetched %s jobs from live list API page %s", len(list_data), current)
+        return list_data, int(total) if total is not None else None
+
+    async def aiter_summaries(self) -> AsyncIterator[dict]:
+        current = 1
+        seen = 0
+        while True:
+            page, total = await self.fetch_page(current)
+            seen += len(page)
+            for summary in page:
+                yield summary
+            if not _has_next_page(page, self.page_size, seen, total, self.job_filter) or (
+                self.max_pages and current >= self.max_pages
+            ):
+                return
+            current += 1
+
+    async def fetch(self) -> List[dict]:
+        return [summary async for summary in self.aiter_summaries()]
+
+
+@dataclass
+class AsyncLiveCareerDetailsClient(_AsyncLiveClient):
+    """Hits the live career detail endpoint with retries over a pooled httpx client."""
+
+    @retry(
+        stop=stop_after_attempt(RETRY_ATTEMPTS),
+        wait=_retry_wait,
+        retry=retry_if_exception_type((httpx.HTTPError, RuntimeError)),
+        before_sleep=_count_retry,
+        reraise=True,
+    )
+    async def fetch(self, job_id: str) -> dict:
+        url = f"{self.base_url}/career/details"
+        resp = await _throttled_get(
+            self.client, self.rate_limiter, url, {"id": job_id}, self.controller
+        )
+        data = _handle_response(resp, loads_detail)
+        logger.info("Fetched job details for %s", job_id)
+        return data
+
+
+async def _fetch_one(
+    detail_client: AsyncCareerDetailsClient, job_id: str, metrics: RunMetrics | None = None
+) -> dict | None:
+    try:
+        with maybe_stage(metrics, "detail_fetch"):
+            return await detail_client.fetch(job_id)
+    except CircuitOpenError:
+        raise
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("Failed to fetch detail for %s: %s", job_id, exc)
+        if metrics:
+            metrics.incr("detail_failures")
+        return None
+
+
+_DONE = object()
+
+
+async def afetch_details(
+    detail_client: AsyncCareerDetailsClient,
+    summaries: Iterable[dict],
+    concurrency: int = 50,
+    metrics: RunMetrics | None = None,
+) -> AsyncIterator[Tuple[dict, dict]]:
+    """Async counterpart of :func:`moledao_spider.pipeline.fetch_details`.
+
+    Summaries are pulled in a worker thread: list paging, state lookups and journal
+    reads would otherwise block the loop and stall every in-flight detail fetch.
+    """
+    pending: Deque[Tuple[dict, asyncio.Task]] = deque()
+    summaries = iter(summaries)
+    try:
+        while (summary := await asyncio.to_thread(next, summaries, _DONE)) is not _DONE:
+            job_id = summary.get("id")
+            if not job_id:
+                logger.warning("Skipping list entry without id: %s", summary)
+                continue
+            task = asyncio.create_task(_fetch_one(detail_client, job_id, metrics))
+            pending.append((summary, task))
+            if len(pending) >= concurrency:
+                summary, task = pending.popleft()
+                detail = await task
+                if detail is not None:
+                    yield summary, detail
+        while pending:
+            summary, task = pending.popleft()
+            detail = await task
+            if detail is not None:
+                yield summary, detail
+    finally:
+        for _, task in pending:
+            task.cancel()
+
+
+def iter_details_async(
+    make_client: Callable[[], AsyncLiveCareerDetailsClient],
+    summaries: Iterable[dict],
+    concurrency: int = 50,
+    metrics: RunMetrics | None = None,
+) -> Iterator[Tuple[dict, dict]]:
+    """Run :func:`afetch_details` on a background event loop and yield pairs synchronously.
+
+    ``make_client`` is called inside the loop so the pooled httpx client is bound to it.
+    """
+    results: queue.Queue = queue.Queue(maxsize=concurrency)
+    stop = threading.Event()
+
+    def _put(item: object) -> bool:
+        while not stop.is_set():
+            try:
+                results.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    async def _produce() -> None:
+        async with make_client() as client:
+            async for pair in afetch_details(client, summaries, concurrency, metrics):
+                if not await asyncio.to_thread(_put, pair):
+                    return
+
+    def _run() -> None:
+        try:
+            asyncio.run(_produce())
+        except BaseException as exc:  # noqa: BLE001
+            _put(exc)
+        else:
+            _put(_DONE)
+
+    worker = threading.Thread(target=_run, name="async-details", daemon=True)
+    worker.start()
+    try:
+        while True:
+            item = results.get()
+            if item is _DONE:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        worker.join()
@@ -0,0 +1,140 @@
+"""Persistent cache for live career detail payloads."""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict
+
+from .jsonio import loads
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILENAME = "details.sqlite"
+DEFAULT_TTL = 24 * 3600
+DEFAULT_MAX_ENTRIES = 10_000
+
+
+@dataclass
+class CacheEntry:
+    data: dict
+    etag: str | None
+    last_modified: str | None
+    stored_at: float
+
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers for revalidating this entry."""
+        headers: Dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class DetailCache:
+    """SQLite-backed ``job_id -> detail`` cache with a TTL and LRU eviction.
+
+    Shared between detail worker threads, so every statement runs under a lock.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        ttl: float = DEFAULT_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        directory.mkdir(parents=True, exist_ok=True)
+        self.path = directory / CACHE_FILENAME
+        self.ttl = ttl
+        self.max_entries = max(1, max_entries)
+        self._clock = clock
+        self._lock = threading.Lock()
+        import sqlite3  # Deferred so importing the CLI stays cheap.
+
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS details ("
+            " job_id TEXT PRIMARY KEY,"
+            " data TEXT NOT NULL,"
+            " etag TEXT,"
+            " last_modified TEXT,"
+            " stored_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS details_accessed ON details (accessed_at)"
+        )
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+
+    def get(self, job_id: str) -> CacheEntry | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data, etag, last_modified, stored_at FROM details WHERE job_id = ?",
+                (job_id,),
+            ).fetchone()
+            if row is None:
+                return None
+            with self._conn:
+                self._conn.execute(
+                    "UPDATE details SET accessed_at = ? WHERE job_id = ?", (self._clock(), job_id)
+                )
+        data, etag, last_modified, stored_at = row
+        return CacheEntry(loads(data), etag, last_modified, stored_at)
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        return self._clock() - entry.stored_at < self.ttl
+
+    def put(
+        self, job_id: str, data: dict, etag: str | None = None, last_modified: str | None = None
+    ) -> None:
+        now = self._clock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO details VALUES (?, ?, ?, ?, ?, ?)",
+                (job_id, json.dumps(data, ensure_ascii=False), etag, last_modified, now, now),
+            )
+            self._evict()
+
+    def refresh(self, job_id: str) -> None:
+        """Restart the TTL of an entry the server confirmed as unchanged."""
+        now = self._clock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE details SET stored_at = ?, accessed_at = ? WHERE job_id = ?",
+                (now, now, job_id),
+            )
+
+    def _evict(self) -> None:
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM details").fetchone()
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                "DELETE FROM details WHERE job_id IN ("
+                " SELECT job_id FROM details ORDER BY accessed_at LIMIT ?)",
+                (overflow,),
+            )
+            logger.debug("Evicted %s cached details", overflow)
+
+    def record_hit(self, revalidated: bool = False) -> None:
+        with self._lock:
+            self.hits += 1
+            self.revalidated += int(revalidated)
+
+    def record_miss(self) -> None:
+        with self._lock:
+            self.misses += 1
+
+    def stats(self) -> str:
+        return f"{self.hits} hits ({self.revalidated} revalidated), {self.misses} misses"
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
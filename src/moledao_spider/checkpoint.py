@@ -0,0 +1,156 @@
+"""Append-only checkpoint journal that lets an interrupted run resume.
+
+The journal lives next to the output as JSON lines: one per fetched detail
+payload and one per completed DOCX batch. A resumed run skips jobs that are
+already in a written batch, serves journaled details without a request and
+numbers new files after the last journaled batch. Completed runs delete it.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import BinaryIO, Callable, Dict, Iterable, Iterator, List, Set
+
+from .clients import CareerDetailsClient
+from .exporter import file_index
+from .jsonio import loads
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_FILENAME = ".moledao-checkpoint.jsonl"
+
+
+class CheckpointJournal:
+    """Journal of fetched details and written batches; payloads stay on disk.
+
+    With ``resume`` an existing journal is loaded and extended, otherwise it is
+    truncated. Only byte offsets of detail lines are kept in memory.
+    """
+
+    def __init__(self, path: Path, resume: bool = False) -> None:
+        self.path = path
+        self.written_ids: Set[str] = set()
+        self.last_index = 0
+        self.batches = 0
+        self._details: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._reader: BinaryIO | None = None
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if resume and path.exists():
+            self._load()
+        self._handle = path.open("ab" if resume else "wb")
+
+    @property
+    def resumed(self) -> bool:
+        return bool(self.batches or self._details)
+
+    def _load(self) -> None:
+        offset = 0
+        with self.path.open("rb+") as handle:
+            for line in handle:
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("unterminated entry")
+                    entry = loads(line)
+                except ValueError:
+                    # A killed run can leave a torn last line; drop it before appending.
+                    logger.warning("Dropping incomplete checkpoint entry at byte %s", offset)
+                    handle.truncate(offset)
+                    break
+                if "detail" in entry:
+                    self._details[entry["detail"]] = offset
+                elif "batch" in entry:
+                    self.written_ids.update(entry["ids"])
+                    self.last_index = max(self.last_index, file_index(Path(entry["batch"])) or 0)
+                    self.batches += 1
+                offset += len(line)
+
+    def _append(self, entry: dict) -> int:
+        line = json.dumps(entry, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        with self._lock:
+            offset = self._handle.tell()
+            # Flushed per entry so a killed process loses at most the line in flight.
+            self._handle.write(line + b"\n")
+            self._handle.flush()
+        return offset
+
+    def detail(self, job_id: str) -> dict | None:
+        offset = self._details.get(job_id)
+        if offset is None:
+            return None
+        with self._lock:
+            if self._reader is None:
+                self._reader = self.path.open("rb")
+            self._reader.seek(offset)
+            line = self._reader.readline()
+        return loads(line)["payload"]
+
+    def record_detail(self, job_id: str, payload: dict) -> None:
+        self._details[job_id] = self._append({"detail": job_id, "payload": payload})
+
+    def record_batch(self, filename: Path, job_ids: List[str]) -> None:
+        self._append({"batch": filename.name, "ids": job_ids})
+        self.written_ids.update(job_ids)
+        self.last_index = max(self.last_index, file_index(filename) or 0)
+        self.batches += 1
+
+    def pending(
+        self, summaries: Iterable[dict], on_skip: Callable[[dict], None] | None = None
+    ) -> Iterator[dict]:
+        """Yield the summaries whose job is not in a written batch yet."""
+        for summary in summaries:
+            if summary.get("id") not in self.written_ids:
+                yield summary
+            elif on_skip:
+                on_skip(summary)
+
+    def close(self) -> None:
+        self._handle.close()
+        if self._reader:
+            self._reader.close()
+            self._reader = None
+
+    def discard(self) -> None:
+        """Close and delete the journal once the run has completed."""
+        self.close()
+        self.path.unlink(missing_ok=True)
+
+
+class CheckpointDetailsClient:
+    """Serves journaled details and journals every detail it fetches."""
+
+    def __init__(self, client: CareerDetailsClient, journal: CheckpointJournal) -> None:
+        self.client = client
+        self.journal = journal
+
+    def fetch(self, job_id: str) -> dict:
+        payload = self.journal.detail(job_id)
+        if payload is None:
+            payload = self.client.fetch(job_id)
+            self.journal.record_detail(job_id, payload)
+        return payload
+
+
+class AsyncCheckpointDetailsClient:
+    """Async counterpart of :class:`CheckpointDetailsClient` for the httpx backend."""
+
+    def __init__(self, client, journal: CheckpointJournal) -> None:
+        self.client = client
+        self.journal = journal
+
+    async def fetch(self, job_id: str) -> dict:
+        payload = self.journal.detail(job_id)
+        if payload is None:
+            payload = await self.client.fetch(job_id)
+            self.journal.record_detail(job_id, payload)
+        return payload
+
+    async def __aenter__(self) -> AsyncCheckpointDetailsClient:
+        await self.client.__aenter__()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.client.__aexit__(*exc_info)
@@ -3,22 +3,45 @@
 from __future__ import annotations
 
 import logging
+import os
+import socket
+import time
+from datetime import datetime
+from itertools import chain
 from pathlib import Path
-from typing import Iterable, Sequence
+from typing import TYPE_CHECKING, Callable, Iterable, Sequence, Tuple
 
 import click
 
+from .adaptive import AdaptiveController, CircuitOpenError
+from .cache import DEFAULT_MAX_ENTRIES, DEFAULT_TTL
 from .clients import (
+    DEFAULT_BASE_URL,
+    DEFAULT_PAGE_SIZE,
     CareerDetailsClient,
     CareerListClient,
     HarCareerDetailsClient,
     HarCareerListClient,
-    LiveCareerDetailsClient,
-    LiveCareerListClient,
+    RateLimiter,
 )
-from .exporter import DocxExporter
+from .dedupe import Deduplicator
+from .exporter import DOCX_ENGINES
+from .filters import JobFilter, resolve_code, resolve_country
+from .formats import FORMATS, create_exporter
+from .har_index import build_har_index
+from .html_text import BACKENDS
 from .logging_utils import configure_logging
-from .models import CareerRecord, build_career_record
+from .metrics import RunMetrics
+from .models import EXPERIENCE_LOOKUP, PREFERENCE_LOOKUP, TYPE_LOOKUP, CareerRecord
+from .pipeline import build_records, fetch_details
+from .sharding import DEFAULT_SHARD_SIZE, QUEUE_FILENAME
+
+if TYPE_CHECKING:
+    from .cache import DetailCache
+    from .checkpoint import CheckpointJournal
+    from .mock_server import MockCareerApi
+    from .sharding import WorkQueue
+    from .state import IncrementalFilter, StateStore
 
 logger = logging.getLogger(__name__)
 
@@ -29,87 +52,991 @@ DEFAULT_DETAIL_HARS = (
 )
 
 
-@click.command()
-@click.option(
+class _DefaultCommandGroup(click.Group):
+    """Group that falls back to ``default_command`` when no sub-command is named.
+
+    Keeps ``moledao-spider --output-dir ...`` working alongside sub-commands.
+    """
+
+    def __init__(self, *args, default_command: str, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.default_command = default_command
+
+    def parse_args(self, ctx: click.Context, args: list[str]) -> list[str]:
+        if not args or (args[0] not in self.commands and args[0] != "--help"):
+            args = [self.default_command, *args]
+        return super().parse_args(ctx, args)
+
+
+@click.group(cls=_DefaultCommandGroup, default_command="run")
+def main() -> None:
+    """Replay moledao.io job data and export DOCX bundles (runs `run` by default)."""
+
+
+def _with_options(options: Sequence[Callable]) -> Callable:
+    """Apply click options shared between commands, keeping their listed order."""
+
+    def decorate(command: Callable) -> Callable:
+        for option in reversed(options):
+            command = option(command)
+        return command
+
+    return decorate
+
+
+_OUTPUT_DIR_OPTION = click.option(
     "--output-dir",
     type=click.Path(file_okay=False, dir_okay=True, path_type=Path),
     default=Path("./output"),
     show_default=True,
     help="Directory where DOCX files will be saved.",
 )
-@click.option("--batch-size", type=int, default=10, show_default=True, help="Jobs per DOCX file.")
-@click.option(
-    "--live/--har",
+_EXPORT_OPTIONS = (
+    click.option(
+        "--format",
+        "formats",
+        type=click.Choice(FORMATS),
+        multiple=True,
+        default=("docx",),
+        show_default=True,
+        help="Output format; repeat to write several formats from a single fetch.",
+    ),
+    click.option(
+        "--batch-size", type=int, default=10, show_default=True, help="Jobs per DOCX file."
+    ),
+)
+_SOURCE_OPTIONS = (
+    click.option(
+        "--live/--har",
+        default=False,
+        show_default=True,
+        help="Pull data from the live API instead of HAR fixtures.",
+    ),
+    click.option(
+        "--api-url",
+        default=DEFAULT_BASE_URL,
+        show_default=True,
+        help="Base URL of the live API, e.g. a local `mock-api` server.",
+    ),
+    click.option(
+        "--list-har",
+        type=click.Path(exists=True, dir_okay=False, path_type=Path),
+        default=DEFAULT_LIST_HAR,
+        show_default=True,
+        help="HAR file used for the career list when not running with --live.",
+    ),
+    click.option(
+        "--detail-har",
+        type=click.Path(exists=True, dir_okay=False, path_type=Path),
+        multiple=True,
+        default=DEFAULT_DETAIL_HARS,
+        show_default=True,
+        help="HAR files used for career details when not running with --live.",
+    ),
+    click.option(
+        "--lazy-har/--eager-har",
+        default=False,
+        show_default=True,
+        help="Index detail HARs by byte offset and decode each detail only when it is used.",
+    ),
+    click.option(
+        "--page-size",
+        type=click.IntRange(min=1),
+        default=DEFAULT_PAGE_SIZE,
+        show_default=True,
+        help="Jobs requested per live list page.",
+    ),
+    click.option(
+        "--max-pages",
+        type=click.IntRange(min=1),
+        default=None,
+        help="Stop after this many list pages (default: until the list runs dry).",
+    ),
+)
+_APPEND_OPTION = click.option(
+    "--append/--overwrite",
     default=False,
+    help="Append numbering instead of overwriting existing DOCX files.",
+)
+_RENDER_OPTIONS = (
+    click.option(
+        "--render-workers",
+        type=click.IntRange(min=1),
+        default=1,
+        show_default=True,
+        help="Processes used to render DOCX batches in parallel.",
+    ),
+    click.option(
+        "--html-backend",
+        type=click.Choice(BACKENDS),
+        default="auto",
+        show_default=True,
+        help="Parser used to turn job HTML into paragraphs (auto picks the fastest installed).",
+    ),
+    click.option(
+        "--docx-engine",
+        type=click.Choice(DOCX_ENGINES),
+        default="python-docx",
+        show_default=True,
+        help="DOCX renderer: python-docx objects, or the template writer "
+        "(same layout, much faster).",
+    ),
+)
+_FETCH_OPTIONS = (
+    click.option(
+        "--concurrency",
+        type=click.IntRange(min=1),
+        default=1,
+        show_default=True,
+        help="Number of detail requests fetched in parallel.",
+    ),
+    click.option(
+        "--rate-limit",
+        type=click.FloatRange(min=0),
+        default=5.0,
+        show_default=True,
+        help="Maximum live API requests per second (0 disables throttling).",
+    ),
+    click.option(
+        "--adaptive/--fixed-concurrency",
+        default=False,
+        show_default=True,
+        help="Grow live requests in flight up to --concurrency while the API keeps up, "
+        "halving on 429/5xx, slow responses or errors.",
+    ),
+)
+_DEDUPE_OPTION = click.option(
+    "--dedupe/--no-dedupe",
+    default=True,
     show_default=True,
-    help="Pull data from the live API instead of HAR fixtures.",
+    help="Skip duplicate job ids (keeping the newest updateDate) and reposted identical jobs.",
+)
+_CACHE_OPTIONS = (
+    click.option(
+        "--cache-dir",
+        type=click.Path(file_okay=False, dir_okay=True, path_type=Path),
+        default=None,
+        help="Cache live detail payloads in this directory across runs.",
+    ),
+    click.option(
+        "--cache-ttl",
+        type=click.FloatRange(min=0),
+        default=DEFAULT_TTL,
+        show_default=True,
+        help="Seconds a cached detail is served before it is revalidated.",
+    ),
+    click.option(
+        "--cache-max-entries",
+        type=click.IntRange(min=1),
+        default=DEFAULT_MAX_ENTRIES,
+        show_default=True,
+        help="Least recently used details are evicted beyond this many entries.",
+    ),
+)
+_VERBOSE_OPTION = click.option(
+    "--verbose/--quiet", default=False, help="Enable verbose logging output."
+)
+
+
+def _resolved(resolver: Callable[[str], object]) -> Callable:
+    """Click callback mapping each value of a multiple option through ``resolver``."""
+
+    def callback(ctx: click.Context, param: click.Parameter, values: Sequence[str]) -> tuple:
+        try:
+            return tuple(resolver(value) for value in values)
+        except ValueError as exc:
+            raise click.BadParameter(str(exc), ctx=ctx, param=param) from exc
+
+    return callback
+
+
+_FILTER_OPTIONS = (
+    click.option(
+        "--tag",
+        "tags",
+        multiple=True,
+        help="Only jobs with this tag (case-insensitive); repeat to accept several.",
+    ),
+    click.option(
+        "--country",
+        "countries",
+        multiple=True,
+        callback=_resolved(resolve_country),
+        help="Only jobs based in this country, by name or two-letter code; repeatable.",
+    ),
+    click.option(
+        "--type",
+        "types",
+        multiple=True,
+        callback=_resolved(lambda value: resolve_code(value, TYPE_LOOKUP)),
+        help="Only this job type, e.g. Full-time or Internship; repeatable.",
+    ),
+    click.option(
+        "--preference",
+        "preferences",
+        multiple=True,
+        callback=_resolved(lambda value: resolve_code(value, PREFERENCE_LOOKUP)),
+        help="Only this work preference, e.g. 'Fully Remote' or Hybrid; repeatable.",
+    ),
+    click.option(
+        "--experience",
+        "experiences",
+        multiple=True,
+        callback=_resolved(lambda value: resolve_code(value, EXPERIENCE_LOOKUP)),
+        help="Only this experience level, e.g. '1-3 Yrs Exp'; repeatable.",
+    ),
+    click.option(
+        "--updated-since",
+        type=click.DateTime(),
+        default=None,
+        help="Only jobs updated at or after this date/time (UTC unless an offset is given).",
+    ),
 )
+
+
+def _make_clients(
+    live: bool,
+    api_url: str,
+    list_har: Path,
+    detail_har: Sequence[Path],
+    lazy_har: bool,
+    page_size: int,
+    max_pages: int | None,
+    concurrency: int,
+    rate_limit: float,
+    adaptive: bool,
+    cache: DetailCache | None,
+    metrics: RunMetrics,
+    job_filter: JobFilter | None = None,
+) -> Tuple[CareerListClient, CareerDetailsClient, RateLimiter | None, AdaptiveController | None]:
+    """Build the list and detail clients for live or HAR mode.
+
+    Live clients share one rate limiter and, with ``adaptive``, one concurrency controller.
+    """
+    if live:
+        from .live_clients import LiveCareerDetailsClient, LiveCareerListClient
+
+        rate_limiter = RateLimiter(rate_limit, burst=concurrency) if rate_limit else None
+        controller = AdaptiveController(concurrency, metrics=metrics) if adaptive else None
+        list_client = LiveCareerListClient(
+            base_url=api_url,
+            rate_limiter=rate_limiter,
+            page_size=page_size,
+            max_pages=max_pages,
+            metrics=metrics,
+            job_filter=job_filter,
+            controller=controller,
+        )
+        detail_client = LiveCareerDetailsClient(
+            base_url=api_url,
+            rate_limiter=rate_limiter,
+            cache=cache,
+            metrics=metrics,
+            controller=controller,
+        )
+        logger.info("Running in LIVE mode%s", " with adaptive concurrency" if adaptive else "")
+        return list_client, detail_client, rate_limiter, controller
+    detail_paths = detail_har or DEFAULT_DETAIL_HARS
+    har_details = HarCareerDetailsClient(detail_paths, lazy=lazy_har)
+    logger.info("Running in HAR mode with %s and %s", list_har, detail_paths)
+    if har_details.duplicates:
+        logger.info("Kept the newest of %s duplicate HAR detail(s)", har_details.duplicates)
+    return HarCareerListClient(list_har, max_pages=max_pages), har_details, None, None
+
+
+@main.command()
+@_OUTPUT_DIR_OPTION
+@_with_options(_EXPORT_OPTIONS)
+@_with_options(_SOURCE_OPTIONS)
+@_APPEND_OPTION
+@_with_options(_RENDER_OPTIONS)
+@_with_options(_FETCH_OPTIONS)
 @click.option(
-    "--list-har",
-    type=click.Path(exists=True, dir_okay=False, path_type=Path),
-    default=DEFAULT_LIST_HAR,
+    "--http-backend",
+    type=click.Choice(["requests", "httpx"]),
+    default="requests",
     show_default=True,
-    help="HAR file used for the career list when not running with --live.",
+    help="Live detail backend: threaded requests or asyncio httpx (needs the async extra).",
 )
 @click.option(
-    "--detail-har",
-    type=click.Path(exists=True, dir_okay=False, path_type=Path),
-    multiple=True,
-    default=DEFAULT_DETAIL_HARS,
+    "--incremental/--full",
+    default=False,
     show_default=True,
-    help="HAR files used for career details when not running with --live.",
+    help="Only fetch and export jobs that are new or changed since the previous run.",
 )
+@_DEDUPE_OPTION
+@_with_options(_FILTER_OPTIONS)
 @click.option(
-    "--append/--overwrite",
+    "--resume",
+    is_flag=True,
     default=False,
-    help="Append numbering instead of overwriting existing DOCX files.",
+    help="Continue an interrupted run from the checkpoint journal in the output directory.",
+)
+@_with_options(_CACHE_OPTIONS)
+@click.option(
+    "--metrics-out",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Write a JSON run report with per-stage latencies and counters.",
+)
+@click.option(
+    "--prometheus-out",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Write the run metrics as a Prometheus node-exporter textfile.",
+)
+@click.option(
+    "--profile",
+    "profile_out",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Write cProfile stats here and sampled stacks (all threads) next to it as .collapsed.",
+)
+@click.option(
+    "--profile-stages/--no-profile-stages",
+    default=False,
+    show_default=True,
+    help="Root each sampled stack at the pipeline stage its thread was running.",
 )
-@click.option("--verbose/--quiet", default=False, help="Enable verbose logging output.")
-def main(
+@click.option(
+    "--profile-memory",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Trace allocations and write the top sites in the record/export hot paths here.",
+)
+@_VERBOSE_OPTION
+def run(
     output_dir: Path,
+    formats: Sequence[str],
     batch_size: int,
     live: bool,
+    api_url: str,
     list_har: Path,
     detail_har: Sequence[Path],
+    lazy_har: bool,
+    page_size: int,
+    max_pages: int | None,
     append: bool,
+    render_workers: int,
+    html_backend: str,
+    docx_engine: str,
+    concurrency: int,
+    rate_limit: float,
+    adaptive: bool,
+    http_backend: str,
+    incremental: bool,
+    dedupe: bool,
+    tags: Tuple[str, ...],
+    countries: Tuple[str, ...],
+    types: Tuple[int, ...],
+    preferences: Tuple[int, ...],
+    experiences: Tuple[int, ...],
+    updated_since: datetime | None,
+    resume: bool,
+    cache_dir: Path | None,
+    cache_ttl: float,
+    cache_max_entries: int,
+    metrics_out: Path | None,
+    prometheus_out: Path | None,
+    profile_out: Path | None,
+    profile_stages: bool,
+    profile_memory: Path | None,
     verbose: bool,
 ) -> None:
-    """Entry point invoked by the console script."""
+    """Fetch jobs from HAR fixtures or the live API and export DOCX bundles or data files."""
     configure_logging(verbose=verbose)
 
-    list_client: CareerListClient
-    detail_client: CareerDetailsClient
+    cache: DetailCache | None = None
+    metrics = RunMetrics()
+    if profile_out or profile_memory:
+        from .profiling import RunProfiler
 
-    if live:
-        list_client = LiveCareerListClient()
-        detail_client = LiveCareerDetailsClient()
-        logger.info("Running in LIVE mode")
+        # Closed with the click context, so client setup and teardown are profiled too.
+        click.get_current_context().with_resource(
+            RunProfiler(profile_out, profile_memory, metrics, by_stage=profile_stages)
+        )
+
+    # Only DOCX batches are journaled, so only DOCX-only runs can be resumed.
+    resumable = set(formats) == {"docx"}
+    if resume and not resumable:
+        raise click.UsageError("--resume only supports --format docx")
+    if cache_dir and http_backend == "httpx":
+        raise click.UsageError("--cache-dir is only supported with --http-backend requests")
+
+    job_filter = JobFilter(tags, countries, types, preferences, experiences, updated_since)
+    if job_filter:
+        logger.info("Filtering jobs by %s", job_filter)
+    if live and cache_dir:
+        from .cache import DetailCache
+
+        cache = DetailCache(cache_dir, ttl=cache_ttl, max_entries=cache_max_entries)
+    list_client, detail_client, rate_limiter, controller = _make_clients(
+        live,
+        api_url,
+        list_har,
+        detail_har,
+        lazy_har,
+        page_size,
+        max_pages,
+        concurrency,
+        rate_limit,
+        adaptive,
+        cache,
+        metrics,
+        job_filter,
+    )
+
+    summaries = metrics.time_iter("list_fetch", list_client.iter_summaries())
+    deduplicator = Deduplicator() if dedupe else None
+    if deduplicator:
+        # Before incremental filtering and fetching, so each job is classified and fetched once.
+        summaries = deduplicator.summaries(summaries, newest_first=live)
+    if job_filter:
+        # Live lists are already narrowed by the API; this also covers HAR replay.
+        summaries = job_filter.summaries(summaries)
+    state: StateStore | None = None
+    changes: IncrementalFilter | None = None
+    if incremental:
+        from .state import STATE_FILENAME, IncrementalFilter, StateStore
+
+        state = StateStore(output_dir / STATE_FILENAME)
+        if len(state):
+            # Earlier bundles stay in place; changed jobs go into new files.
+            append = True
+        changes = IncrementalFilter(state)
+        summaries = changes(summaries)
+
+    journal: CheckpointJournal | None = None
+    start_index: int | None = None
+    if resumable:
+        from .checkpoint import CHECKPOINT_FILENAME, CheckpointDetailsClient, CheckpointJournal
+
+        # DOCX runs journal their progress; --resume picks up where the last one stopped.
+        journal = CheckpointJournal(output_dir / CHECKPOINT_FILENAME, resume=resume)
+        if journal.resumed:
+            start_index = journal.last_index + 1 if journal.last_index else None
+            logger.info(
+                "Resuming: %s job(s) already written in %s batch(es)",
+                len(journal.written_ids),
+                journal.batches,
+            )
+            on_skip = state.mark if state is not None else None
+            summaries = journal.pending(summaries, on_skip=on_skip)
+        elif resume:
+            logger.warning("No checkpoint in %s; starting from the beginning", output_dir)
+        if live:
+            detail_client = CheckpointDetailsClient(detail_client, journal)
+
+    if live and http_backend == "httpx":
+        from .async_clients import AsyncLiveCareerDetailsClient, iter_details_async
+        from .checkpoint import AsyncCheckpointDetailsClient
+
+        def make_async_client() -> AsyncLiveCareerDetailsClient | AsyncCheckpointDetailsClient:
+            client = AsyncLiveCareerDetailsClient(
+                base_url=api_url,
+                rate_limiter=rate_limiter,
+                metrics=metrics,
+                controller=controller,
+            )
+            return client if journal is None else AsyncCheckpointDetailsClient(client, journal)
+
+        pairs = iter_details_async(
+            make_async_client,
+            summaries,
+            concurrency=concurrency,
+            metrics=metrics,
+        )
     else:
-        detail_paths = detail_har or DEFAULT_DETAIL_HARS
-        list_client = HarCareerListClient(list_har)
-        detail_client = HarCareerDetailsClient(detail_paths)
-        logger.info("Running in HAR mode with %s and %s", list_har, detail_paths)
-
-    summaries = list_client.fetch()
-    logger.info("Processing %s jobs", len(summaries))
-    jobs: list[CareerRecord] = []
-    for summary in summaries:
-        job_id = summary.get("id")
-        if not job_id:
-            logger.warning("Skipping list entry without id: %s", summary)
-            continue
-        try:
-            detail = detail_client.fetch(job_id)
-        except Exception as exc:  # noqa: BLE001
-            logger.warning("Failed to fetch detail for %s: %s", job_id, exc)
-            continue
-        record = build_career_record(summary, detail)
-        logger.info(record.log_stub())
-        jobs.append(record)
-
-    exporter = DocxExporter(output_dir=output_dir, batch_size=batch_size, append=append)
-    written = exporter.export(jobs)
-    logger.info("Generated %s document(s)", len(written))
+        pairs = fetch_details(detail_client, summaries, concurrency=concurrency, metrics=metrics)
+    if job_filter:
+        # Tags (and experience missing from a summary) are only known once the detail is in.
+        pairs = job_filter.pairs(pairs)
+
+    processed = 0
+
+    def on_record(summary: dict, record: CareerRecord) -> None:
+        nonlocal processed
+        processed += 1
+        if state is not None:
+            state.mark(summary)
+
+    try:
+        exporter = create_exporter(
+            formats,
+            output_dir,
+            append=append,
+            metrics=metrics,
+            batch_size=batch_size,
+            render_workers=render_workers,
+            html_backend=html_backend,
+            docx_engine=docx_engine,
+            start_index=start_index,
+            on_batch=journal.record_batch if journal is not None else None,
+        )
+    except ImportError as exc:
+        if journal is not None:
+            journal.close()
+        raise click.UsageError(str(exc)) from exc
+    try:
+        # Summaries -> details -> records -> every output format, one job at a time.
+        records = build_records(pairs, on_record, metrics)
+        if deduplicator:
+            records = deduplicator.records(records)
+        written = exporter.export(records)
+        logger.info("Processed %s jobs", processed)
+        if deduplicator:
+            metrics.incr("duplicate_ids", deduplicator.report.duplicate_ids)
+            metrics.incr("reposts_skipped", deduplicator.report.reposts)
+            logger.info("Dedupe: %s", deduplicator.report.summary())
+        if cache:
+            logger.info("Generated %s file(s); detail cache %s", len(written), cache.stats())
+        else:
+            logger.info("Generated %s file(s)", len(written))
+        if controller:
+            logger.info("Adaptive concurrency settled at %s request(s) in flight", controller.limit)
+
+        if state is not None and changes is not None:
+            # A capped or filtered listing cannot tell removed jobs apart from unlisted ones.
+            complete = max_pages is None and not job_filter
+            removed = state.missing(changes.seen_ids) if complete else set()
+            changes.report.removed = len(removed)
+            state.commit(removed)
+            for name, count in vars(changes.report).items():
+                metrics.incr(f"jobs_{name}", count)
+            logger.info("Incremental run: %s", changes.report.summary())
+        if journal is not None:
+            journal.discard()
+    except CircuitOpenError as exc:
+        metrics.incr("run_failures")
+        hint = f"; rerun with --resume to continue from {journal.path}" if journal else ""
+        raise click.ClickException(f"{exc}{hint}") from exc
+    except Exception:
+        metrics.incr("run_failures")
+        if journal is not None:
+            logger.warning("Run failed; rerun with --resume to continue from %s", journal.path)
+        raise
+    finally:
+        if journal is not None:
+            journal.close()
+        # Reports are written even for failed runs so batch health stays visible.
+        if cache:
+            metrics.incr("cache_hits", cache.hits)
+            metrics.incr("cache_revalidated", cache.revalidated)
+            metrics.incr("cache_misses", cache.misses)
+            cache.close()
+        if state is not None:
+            state.close()
+        if metrics_out:
+            metrics.write_json(metrics_out)
+        if prometheus_out:
+            metrics.write_prometheus(prometheus_out)
+
+
+@main.command("har-index")
+@click.argument(
+    "har_paths",
+    nargs=-1,
+    required=True,
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+)
+@_VERBOSE_OPTION
+def har_index(har_paths: Sequence[Path], verbose: bool) -> None:
+    """Compile HAR captures into sidecar <har>.idx files for fast replay."""
+    configure_logging(verbose=verbose)
+    for har_path in har_paths:
+        build_har_index(har_path)
+
+
+_QUEUE_OPTION = click.option(
+    "--queue",
+    "queue_location",
+    default=None,
+    help="Work queue: a SQLite file path or a scheme://location URL "
+    f"(default: <output-dir>/{QUEUE_FILENAME}).",
+)
+
+
+_MOCK_OPTIONS = (
+    click.option(
+        "--synthetic",
+        type=click.IntRange(min=0),
+        default=0,
+        show_default=True,
+        help="Serve this many generated jobs instead of the HAR fixtures (0 uses the HARs).",
+    ),
+    click.option(
+        "--latency", type=click.FloatRange(min=0), default=0.0, help="Seconds added per response."
+    ),
+    click.option(
+        "--jitter",
+        type=click.FloatRange(min=0),
+        default=0.0,
+        help="Up to this many random extra seconds per response.",
+    ),
+    click.option(
+        "--error-rate",
+        type=click.FloatRange(0, 1),
+        default=0.0,
+        help="Fraction of requests answered with HTTP 500.",
+    ),
+    click.option(
+        "--throttle-rate",
+        type=click.FloatRange(0, 1),
+        default=0.0,
+        help="Fraction of requests answered with HTTP 429.",
+    ),
+    click.option(
+        "--retry-after",
+        type=click.FloatRange(min=0),
+        default=1.0,
+        show_default=True,
+        help="Retry-After seconds sent with each 429.",
+    ),
+    click.option(
+        "--max-page-size",
+        type=click.IntRange(min=1),
+        default=None,
+        help="Largest list page the server returns, whatever pageSize asks for.",
+    ),
+    click.option("--seed", type=int, default=None, help="Seed for reproducible faults and data."),
+)
+
+
+def _mock_api(
+    synthetic: int,
+    latency: float,
+    jitter: float,
+    error_rate: float,
+    throttle_rate: float,
+    retry_after: float,
+    max_page_size: int | None,
+    seed: int | None,
+    **kwargs: object,
+) -> MockCareerApi:
+    from .mock_server import MockBehavior, MockCareerApi
+
+    behavior = MockBehavior(
+        latency, jitter, error_rate, throttle_rate, retry_after, max_page_size, seed
+    )
+    if synthetic:
+        return MockCareerApi.synthetic(synthetic, behavior=behavior, **kwargs)
+    return MockCareerApi.from_har(
+        DEFAULT_LIST_HAR, DEFAULT_DETAIL_HARS, behavior=behavior, **kwargs
+    )
+
+
+@main.command("mock-api")
+@click.option("--host", default="127.0.0.1", show_default=True, help="Interface to listen on.")
+@click.option("--port", type=int, default=8765, show_default=True, help="Port to listen on.")
+@_with_options(_MOCK_OPTIONS)
+@_VERBOSE_OPTION
+def mock_api(host: str, port: int, verbose: bool, **mock_options: object) -> None:
+    """Serve a local stand-in for the career API until interrupted."""
+    configure_logging(verbose=verbose)
+    api = _mock_api(**mock_options, host=host, port=port).start()
+    click.echo(f"Serving {len(api.summaries)} jobs; use --live --api-url {api.base_url}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        api.stop()
+
+
+@main.command("load-test")
+@click.option(
+    "--api-url",
+    default=None,
+    help="Load-test this API instead of an in-process mock server.",
+)
+@_with_options(_MOCK_OPTIONS)
+@click.option(
+    "--http-backend",
+    "http_backends",
+    type=click.Choice(["requests", "httpx"]),
+    multiple=True,
+    default=("requests",),
+    show_default=True,
+    help="Client to drive; repeat to compare several in one run.",
+)
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=8,
+    show_default=True,
+    help="Detail requests in flight (the ceiling with --adaptive).",
+)
+@click.option(
+    "--rate-limit",
+    type=click.FloatRange(min=0),
+    default=0.0,
+    show_default=True,
+    help="Maximum requests per second (0 disables throttling).",
+)
+@click.option(
+    "--adaptive/--fixed-concurrency",
+    default=False,
+    show_default=True,
+    help="Drive the clients through the adaptive concurrency controller.",
+)
+@click.option(
+    "--page-size",
+    type=click.IntRange(min=1),
+    default=DEFAULT_PAGE_SIZE,
+    show_default=True,
+    help="Jobs requested per list page.",
+)
+@_VERBOSE_OPTION
+def load_test(
+    api_url: str | None,
+    http_backends: Sequence[str],
+    concurrency: int,
+    rate_limit: float,
+    adaptive: bool,
+    page_size: int,
+    verbose: bool,
+    **mock_options: object,
+) -> None:
+    """Measure requests/sec, latency percentiles and retries of the live clients."""
+    from .loadtest import run_load_test
+
+    configure_logging(verbose=verbose)
+    api = None if api_url else _mock_api(**mock_options).start()
+    try:
+        for backend in http_backends:
+            report = run_load_test(
+                api_url or api.base_url, backend, concurrency, rate_limit, adaptive, page_size
+            )
+            click.echo(report.summary())
+    finally:
+        if api:
+            api.stop()
+            click.echo(f"Mock API responses by status: {dict(sorted(api.served.items()))}")
+
+
+def _open_queue(queue_location: str | None, output_dir: Path) -> WorkQueue:
+    from .sharding import open_queue
+
+    try:
+        return open_queue(queue_location or str(output_dir / QUEUE_FILENAME))
+    except ValueError as exc:
+        raise click.UsageError(str(exc)) from exc
+
+
+@main.group()
+def shard() -> None:
+    """Split a scrape across machines: publish shards, run workers, merge outputs."""
+
+
+@shard.command("publish")
+@_OUTPUT_DIR_OPTION
+@_QUEUE_OPTION
+@_with_options(_SOURCE_OPTIONS)
+@_with_options(_FETCH_OPTIONS)
+@click.option(
+    "--shard-size",
+    type=click.IntRange(min=1),
+    default=DEFAULT_SHARD_SIZE,
+    show_default=True,
+    help="Jobs per shard handed to one worker at a time.",
+)
+@_DEDUPE_OPTION
+@_VERBOSE_OPTION
+def shard_publish(
+    output_dir: Path,
+    queue_location: str | None,
+    live: bool,
+    api_url: str,
+    list_har: Path,
+    detail_har: Sequence[Path],
+    lazy_har: bool,
+    page_size: int,
+    max_pages: int | None,
+    concurrency: int,
+    rate_limit: float,
+    adaptive: bool,
+    shard_size: int,
+    dedupe: bool,
+    verbose: bool,
+) -> None:
+    """Fetch the job list and publish it to the work queue in shards."""
+    from .sharding import chunk_summaries
+
+    configure_logging(verbose=verbose)
+    metrics = RunMetrics()
+    list_client, _, _, _ = _make_clients(
+        live,
+        api_url,
+        list_har,
+        detail_har,
+        lazy_har,
+        page_size,
+        max_pages,
+        concurrency,
+        rate_limit,
+        adaptive,
+        None,
+        metrics,
+    )
+    queue = _open_queue(queue_location, output_dir)
+    try:
+        if queue.status():
+            raise click.UsageError("The work queue already holds shards; use a fresh queue")
+        summaries = list_client.iter_summaries()
+        if dedupe:
+            # Once here, so no two shards ever fetch the same job.
+            summaries = Deduplicator().summaries(summaries, newest_first=live)
+        published = queue.publish(chunk_summaries(summaries, shard_size))
+    finally:
+        queue.close()
+    logger.info("Published %s shard(s) of up to %s job(s)", published, shard_size)
+
+
+@shard.command("work")
+@_OUTPUT_DIR_OPTION
+@_QUEUE_OPTION
+@_with_options(_SOURCE_OPTIONS)
+@_with_options(_FETCH_OPTIONS)
+@_with_options(_CACHE_OPTIONS)
+@click.option(
+    "--worker-id",
+    default=None,
+    help="Name recorded on claimed shards (default: <hostname>-<pid>).",
+)
+@click.option(
+    "--retry-failed",
+    is_flag=True,
+    default=False,
+    help="Return failed shards to the queue before claiming.",
+)
+@_VERBOSE_OPTION
+def shard_work(
+    output_dir: Path,
+    queue_location: str | None,
+    live: bool,
+    api_url: str,
+    list_har: Path,
+    detail_har: Sequence[Path],
+    lazy_har: bool,
+    page_size: int,
+    max_pages: int | None,
+    concurrency: int,
+    rate_limit: float,
+    adaptive: bool,
+    cache_dir: Path | None,
+    cache_ttl: float,
+    cache_max_entries: int,
+    worker_id: str | None,
+    retry_failed: bool,
+    verbose: bool,
+) -> None:
+    """Claim shards until the queue is drained, writing each shard's records."""
+    from .sharding import run_worker
+
+    configure_logging(verbose=verbose)
+    metrics = RunMetrics()
+    cache = None
+    if live and cache_dir:
+        from .cache import DetailCache
+
+        cache = DetailCache(cache_dir, ttl=cache_ttl, max_entries=cache_max_entries)
+    _, detail_client, _, _ = _make_clients(
+        live,
+        api_url,
+        list_har,
+        detail_har,
+        lazy_har,
+        page_size,
+        max_pages,
+        concurrency,
+        rate_limit,
+        adaptive,
+        cache,
+        metrics,
+    )
+    worker = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+    queue = _open_queue(queue_location, output_dir)
+    try:
+        if retry_failed:
+            logger.info("Requeued %s failed shard(s)", queue.retry_failed())
+        report = run_worker(
+            queue, detail_client, output_dir.resolve(), worker, concurrency, metrics
+        )
+    finally:
+        queue.close()
+        if cache:
+            cache.close()
+    logger.info(
+        "Worker %s: %s shard(s), %s record(s), %s failed, %s lost to expired leases",
+        worker,
+        report.shards,
+        report.records,
+        report.failed,
+        report.lost,
+    )
+    if report.failed:
+        raise click.ClickException(f"{report.failed} shard(s) failed; rerun with --retry-failed")
+
+
+@shard.command("merge")
+@_OUTPUT_DIR_OPTION
+@_QUEUE_OPTION
+@_with_options(_EXPORT_OPTIONS)
+@_APPEND_OPTION
+@_with_options(_RENDER_OPTIONS)
+@_DEDUPE_OPTION
+@_VERBOSE_OPTION
+def shard_merge(
+    output_dir: Path,
+    queue_location: str | None,
+    formats: Sequence[str],
+    batch_size: int,
+    append: bool,
+    render_workers: int,
+    html_backend: str,
+    docx_engine: str,
+    dedupe: bool,
+    verbose: bool,
+) -> None:
+    """Export every finished shard in shard order as globally numbered files."""
+    from .sharding import iter_merged_records
+
+    configure_logging(verbose=verbose)
+    queue = _open_queue(queue_location, output_dir)
+    try:
+        records = iter_merged_records(queue)
+        # Fail before any file is written when a shard is unfinished.
+        first = next(records, None)
+    except RuntimeError as exc:
+        queue.close()
+        raise click.ClickException(str(exc)) from exc
+    try:
+        exporter = create_exporter(
+            formats,
+            output_dir,
+            append=append,
+            metrics=RunMetrics(),
+            batch_size=batch_size,
+            render_workers=render_workers,
+            html_backend=html_backend,
+            docx_engine=docx_engine,
+        )
+    except ImportError as exc:
+        queue.close()
+        raise click.UsageError(str(exc)) from exc
+    try:
+        merged = chain([first], records) if first else iter(())
+        deduplicator = Deduplicator() if dedupe else None
+        if deduplicator:
+            # Ids were deduplicated at publish time; reposts can still span shards.
+            merged = deduplicator.records(merged)
+        written = exporter.export(merged)
+    finally:
+        queue.close()
+    if deduplicator:
+        logger.info("Dedupe: %s", deduplicator.report.summary())
+    logger.info("Generated %s file(s)", len(written))
 
 
 if __name__ == "__main__":
@@ -1,21 +1,57 @@
-"""HTTP and HAR-backed clients for the Moledao career APIs."""
+"""HAR-backed clients and shared helpers for the Moledao career APIs.
+
+The live HTTP clients live in :mod:`.live_clients` so HAR replay never imports
+``requests`` or ``tenacity``; they are still importable from here.
+"""
 
 from __future__ import annotations
 
-import base64
-import json
 import logging
+import threading
+import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Iterable, List, MutableMapping, Protocol, Sequence
-
-import requests
-from requests import Response, Session
-from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    MutableMapping,
+    Protocol,
+    Sequence,
+)
+
+from .adaptive import RateLimitedError, retry_after_of
+from .dedupe import is_newer
+from .filters import JobFilter
+from .har import (
+    DETAIL_PATH,
+    LIST_PATH,
+    EntrySpan,
+    is_endpoint,
+    iter_entry_spans,
+    iter_har_entries,
+    request_job_id,
+)
+from .har import extract_entry_json as _extract_entry_json
+from .har_index import HarIndex, load_index_for
+from .jsonio import loads, loads_detail
+
+if TYPE_CHECKING:
+    from requests import Response
+    from tenacity import RetryCallState
+
+    from .live_clients import LiveCareerDetailsClient, LiveCareerListClient
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_BASE_URL = "https://api.moledao.io/api"
+DEFAULT_PAGE_SIZE = 300
+RETRY_ATTEMPTS = 3
+RETRY_MAX_WAIT = 4.0
 
 
 class CareerListClient(Protocol):
@@ -24,6 +60,9 @@ class CareerListClient(Protocol):
     def fetch(self) -> List[dict]:
         """Return the raw list payload."""
 
+    def iter_summaries(self) -> Iterator[dict]:
+        """Yield list entries page by page as they become available."""
+
 
 class CareerDetailsClient(Protocol):
     """Fetches an individual career detail payload."""
@@ -33,84 +72,255 @@ class CareerDetailsClient(Protocol):
 
 
 def _load_har_entries(path: Path) -> List[dict]:
-    if not path.exists():
-        raise FileNotFoundError(f"HAR file not found: {path}")
-    data = json.loads(path.read_text())
-    return data.get("log", {}).get("entries", [])
-
-
-def _extract_entry_json(entry: dict) -> dict | None:
-    content = entry.get("response", {}).get("content", {})
-    text = content.get("text")
-    if not text:
-        return None
-
-    if content.get("encoding") == "base64":
-        text_bytes = base64.b64decode(text)
-        text = text_bytes.decode("utf-8")
-
-    try:
-        return json.loads(text)
-    except json.JSONDecodeError:
-        logger.debug("Skipping non-JSON HAR entry")
-        return None
+    return list(iter_har_entries(path))
 
 
 @dataclass
 class HarCareerListClient:
-    """Reads the career list from a captured HAR file."""
+    """Reads the career list from a captured HAR file, one list page per entry."""
 
     har_path: Path
-
-    def fetch(self) -> List[dict]:
-        for entry in _load_har_entries(self.har_path):
+    max_pages: int | None = None
+    use_index: bool = True
+
+    def _iter_pages(self) -> Iterator[List[dict]]:
+        index = load_index_for(self.har_path) if self.use_index else None
+        if index is not None:
+            yield from index.list_pages()
+            return
+        for entry in iter_har_entries(self.har_path):
+            if not is_endpoint(entry, LIST_PATH):
+                continue
             payload = _extract_entry_json(entry)
             if not payload:
                 continue
             data = payload.get("data") or {}
             list_data = data.get("list")
             if list_data:
-                logger.debug("Loaded %s jobs from %s", len(list_data), self.har_path)
-                return list_data
+                yield list_data
+
+    def iter_summaries(self) -> Iterator[dict]:
+        pages = 0
+        for list_data in self._iter_pages():
+            if self.max_pages and pages >= self.max_pages:
+                return
+            pages += 1
+            logger.debug("Loaded %s jobs from page %s of %s", len(list_data), pages, self.har_path)
+            yield from list_data
+
+        if not pages:
+            raise RuntimeError(f"No list payload found in HAR {self.har_path}")
+
+    def fetch(self) -> List[dict]:
+        return list(self.iter_summaries())
 
-        raise RuntimeError(f"No list payload found in HAR {self.har_path}")
+
+def _entry_job(entry: dict) -> dict | None:
+    # Captures also hold pages, scripts and other API calls; skip them undecoded.
+    if not is_endpoint(entry, DETAIL_PATH):
+        return None
+    payload = _extract_entry_json(entry, loads_detail)
+    if not payload:
+        return None
+    job = payload.get("data")
+    return job if isinstance(job, dict) and job.get("id") else None
 
 
 @dataclass
 class HarCareerDetailsClient:
-    """Reads career details from one or more HAR files."""
+    """Reads career details from one or more HAR files.
+
+    With ``lazy=True`` only the byte span of each detail entry is kept, keyed by
+    the request's ``id`` parameter, and the body is decoded on ``fetch``. A HAR
+    with an up-to-date compiled index (see :mod:`moledao_spider.har_index`) is
+    served from that index instead of being parsed. On duplicate ids the entry
+    with the newest ``updateDate`` wins, the later HAR on ties.
+    """
 
     har_paths: Sequence[Path]
+    lazy: bool = False
+    use_index: bool = True
 
     def __post_init__(self) -> None:
         self._cache: Dict[str, dict] = {}
+        self._spans: Dict[str, EntrySpan] = {}
+        self._indexed: Dict[str, HarIndex] = {}
+        self.duplicates = 0
         for path in self.har_paths:
-            for entry in _load_har_entries(path):
-                payload = _extract_entry_json(entry)
-                if not payload:
-                    continue
-                job = payload.get("data")
-                job_id = (job or {}).get("id")
+            index = load_index_for(path) if self.use_index else None
+            if index is not None:
+                for job_id in index.job_ids():
+                    self._store(job_id, index=index)
+                continue
+            for entry, span in iter_entry_spans(path):
+                job_id = request_job_id(entry) if self.lazy else None
                 if job_id:
-                    self._cache[job_id] = job
+                    self._store(job_id, span=span)
+                    continue
+                job = _entry_job(entry)
+                if not job:
+                    continue
+                if self.lazy:
+                    self._store(job["id"], span=span)
+                else:
+                    self._store(job["id"], job=job)
         logger.debug(
-            "Indexed %s job details from %s HAR files", len(self._cache), len(self.har_paths)
+            "Indexed %s job details from %s HAR files",
+            len(self._cache) + len(self._spans) + len(self._indexed),
+            len(self.har_paths),
         )
 
+    def _store(
+        self,
+        job_id: str,
+        job: dict | None = None,
+        span: EntrySpan | None = None,
+        index: HarIndex | None = None,
+    ) -> None:
+        if job_id in self._cache or job_id in self._spans or job_id in self._indexed:
+            # Duplicates are rare, so decoding both payloads to compare them is cheap.
+            self.duplicates += 1
+            incoming = job
+            if incoming is None:
+                incoming = _entry_job(span.load()) if span else index.detail(job_id)
+            if not is_newer(incoming or {}, self.fetch(job_id)):
+                logger.debug("Keeping newer detail for duplicate job %s", job_id)
+                return
+        self._cache.pop(job_id, None)
+        self._spans.pop(job_id, None)
+        self._indexed.pop(job_id, None)
+        if job is not None:
+            self._cache[job_id] = job
+        elif span is not None:
+            self._spans[job_id] = span
+        elif index is not None:
+            self._indexed[job_id] = index
+
     def fetch(self, job_id: str) -> dict:
         job = self._cache.get(job_id)
+        if not job and job_id in self._spans:
+            job = _entry_job(self._spans[job_id].load())
+        if not job and job_id in self._indexed:
+            job = self._indexed[job_id].detail(job_id)
         if not job:
             raise KeyError(f"Job id {job_id} not found in HAR cache")
         return job
 
 
-def _ensure_session(session: Session | None) -> Session:
-    return session or requests.Session()
-
-
-def _handle_response(response: Response) -> dict:
+class RateLimiter:
+    """Thread-safe token bucket shared by every request sent to one host."""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> float:
+        """Consume a token if one is available, else return the seconds to wait."""
+        with self._lock:
+            now = self._clock()
+            elapsed = now - self._updated
+            self._updated = now
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it."""
+        while (wait := self.try_acquire()) > 0:
+            self._sleep(wait)
+
+
+def _list_params(
+    current: int = 1,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    job_filter: JobFilter | None = None,
+) -> dict:
+    params = {
+        "id": "",
+        "current": current,
+        "pageSize": page_size,
+        "tags": "",
+        "sortStr": "event.updateDate:DESC",
+        "name": "",
+        "location": "",
+        "role": "",
+        "workType": "",
+        "like": 2,
+        "applied": 2,
+        "workLanguage": "",
+        "workExperience": "",
+        "workPreferences": "",
+        "status": "",
+        "approve": 1,
+    }
+    if job_filter:
+        params.update(job_filter.list_params())
+    return params
+
+
+def _has_next_page(
+    page: List[dict],
+    page_size: int,
+    seen: int,
+    total: int | None,
+    job_filter: JobFilter | None = None,
+) -> bool:
+    if not page:
+        return False
+    if job_filter and job_filter.exhausted(page):
+        # The list is sorted newest first, so later pages are older still.
+        return False
+    if total is not None:
+        return seen < total
+    return len(page) >= page_size
+
+
+def _count_retry(retry_state: RetryCallState) -> None:
+    """tenacity ``before_sleep`` hook: log the retry and count it on the client's metrics."""
+    client = retry_state.args[0] if retry_state.args else None
+    logger.debug(
+        "Retrying %s after attempt %s: %s",
+        retry_state.fn.__name__ if retry_state.fn else "request",
+        retry_state.attempt_number,
+        retry_state.outcome.exception() if retry_state.outcome else None,
+    )
+    metrics = getattr(client, "metrics", None)
+    if metrics:
+        metrics.incr("retries")
+
+
+def _retry_wait(retry_state: RetryCallState) -> float:
+    """tenacity ``wait``: the server's ``Retry-After`` if it sent one, else 1s, 2s, 4s, ..."""
+    exc = retry_state.outcome.exception() if retry_state.outcome else None
+    if isinstance(exc, RateLimitedError) and exc.retry_after is not None:
+        return exc.retry_after
+    return min(RETRY_MAX_WAIT, 2.0 ** (retry_state.attempt_number - 1))
+
+
+def _handle_response(
+    response: Response, decode: Callable[[str | bytes], Any] = loads
+) -> dict:
+    status = response.status_code
+    retry_after = retry_after_of(status, response.headers)
+    if status == 429 or retry_after is not None:
+        raise RateLimitedError(status, retry_after)
     response.raise_for_status()
-    payload = response.json()
+    payload = decode(response.content)
     if payload.get("code") != 200:
         raise RuntimeError(f"Unexpected API response: {payload}")
     data = payload.get("data")
@@ -119,69 +329,12 @@ def _handle_response(response: Response) -> dict:
     return data
 
 
-@dataclass
-class LiveCareerListClient:
-    """Hits the live career list endpoint with retries."""
-
-    base_url: str = DEFAULT_BASE_URL
-    session: Session | None = None
-
-    def __post_init__(self) -> None:
-        self.session = _ensure_session(self.session)
-
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=4),
-        retry=retry_if_exception_type((requests.RequestException, RuntimeError)),
-        reraise=True,
-    )
-    def fetch(self) -> List[dict]:
-        params = {
-            "id": "",
-            "current": 1,
-            "pageSize": 300,
-            "tags": "",
-            "sortStr": "event.updateDate:DESC",
-            "name": "",
-            "location": "",
-            "role": "",
-            "workType": "",
-            "like": 2,
-            "applied": 2,
-            "workLanguage": "",
-            "workExperience": "",
-            "workPreferences": "",
-            "status": "",
-            "approve": 1,
-        }
-        url = f"{self.base_url}/career/list"
-        logger.debug("Requesting career list from %s", url)
-        resp = self.session.get(url, params=params, timeout=15)
-        data = _handle_response(resp)
-        list_data = data.get("list") or []
-        logger.info("Fetched %s jobs from live list API", len(list_data))
-        return list_data
-
+_LIVE_CLIENTS = ("LiveCareerListClient", "LiveCareerDetailsClient")
 
-@dataclass
-class LiveCareerDetailsClient:
-    """Hits the live career detail endpoint with retries."""
-
-    base_url: str = DEFAULT_BASE_URL
-    session: Session | None = None
 
-    def __post_init__(self) -> None:
-        self.session = _ensure_session(self.session)
+def __getattr__(name: str):
+    if name in _LIVE_CLIENTS:
+        from . import live_clients
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=4),
-        retry=retry_if_exception_type((requests.RequestException, RuntimeError)),
-        reraise=True,
-    )
-    def fetch(self, job_id: str) -> dict:
-        url = f"{self.base_url}/career/details"
-        resp = self.session.get(url, params={"id": job_id}, timeout=15)
-        data = _handle_response(resp)
-        logger.info("Fetched job details for %s", job_id)
-        return data
+        return getattr(live_clients, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
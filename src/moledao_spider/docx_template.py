@@ -0,0 +1,186 @@
+"""Fast DOCX writer that emits ``word/document.xml`` without python-docx objects.
+
+python-docx's default package is serialized once per process and every static
+part is deflated once. Each document is then the job paragraphs rendered from
+precompiled XML snippets, spliced between the template's body head and its
+``<w:sectPr>``, and zip-streamed straight to disk next to the cached parts.
+Paragraph and run markup mirrors what ``add_heading``/``add_paragraph`` emit.
+"""
+
+from __future__ import annotations
+
+import io
+import re
+import struct
+import time
+import zipfile
+import zlib
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import BinaryIO, List, Sequence
+
+from .models import CareerRecord
+
+DOCUMENT_PART = "word/document.xml"
+
+_LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+_CENTRAL_HEADER = struct.Struct("<4s4B4HL2L5H2L")
+_END_RECORD = struct.Struct("<4s4H2LH")
+_ZIP_VERSION = 20
+_UNIX = 3
+_FILE_MODE = 0o600 << 16
+
+_HEADING_1 = '<w:p><w:pPr><w:pStyle w:val="Heading1"/></w:pPr>'
+_HEADING_2 = '<w:p><w:pPr><w:pStyle w:val="Heading2"/></w:pPr>'
+_PARAGRAPH = "<w:p>"
+EMPTY_PARAGRAPH = "<w:p/>"
+_RUN_BREAKS = re.compile(r"([\t\r\n])")
+# Characters XML 1.0 cannot carry; python-docx would reject them outright.
+_INVALID_XML = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]")
+
+
+def _text(text: str) -> str:
+    text = _INVALID_XML.sub("", text)
+    escaped = text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+    if len(text.strip()) < len(text):
+        return f'<w:t xml:space="preserve">{escaped}</w:t>'
+    return f"<w:t>{escaped}</w:t>"
+
+
+def _run(text: str) -> str:
+    if "\t" not in text and "\n" not in text and "\r" not in text:
+        return f"<w:r>{_text(text)}</w:r>"
+    content: List[str] = []
+    for piece in _RUN_BREAKS.split(text):
+        if piece == "\t":
+            content.append("<w:tab/>")
+        elif piece in ("\r", "\n"):
+            content.append("<w:br/>")
+        elif piece:
+            content.append(_text(piece))
+    return f"<w:r>{''.join(content)}</w:r>"
+
+
+def paragraph(text: str, opening: str = _PARAGRAPH) -> str:
+    """One paragraph, matching ``add_paragraph``/``add_heading`` output."""
+    if not text:
+        return EMPTY_PARAGRAPH if opening == _PARAGRAPH else opening + "</w:p>"
+    return f"{opening}{_run(text)}</w:p>"
+
+
+def job_xml(job: CareerRecord, content_lines: Sequence[str]) -> str:
+    """Body XML for one job in the layout of ``exporter._write_job``."""
+    parts = [
+        paragraph(job.company, _HEADING_1),
+        paragraph(f"{job.role} ({job.type_text})", _HEADING_2),
+        paragraph(f"Location: {job.location}"),
+        paragraph(f"Type: {job.type_text}"),
+        paragraph(f"Preferences: {job.preference_text}"),
+        paragraph(job.relative_time),
+        paragraph(f"Exp: {job.experience_text}"),
+        paragraph(f"Tag: {job.tag_text}"),
+        paragraph("content:"),
+    ]
+    parts.extend(paragraph(line) for line in content_lines)
+    parts.append(paragraph(f"time: {job.update_date}"))
+    return "".join(parts)
+
+
+@dataclass(frozen=True, slots=True)
+class _Member:
+    name: bytes
+    crc: int
+    compressed: bytes
+    size: int
+
+
+def _deflate(name: str, data: bytes) -> _Member:
+    compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+    compressed = compressor.compress(data) + compressor.flush()
+    return _Member(name.encode("utf-8"), zlib.crc32(data), compressed, len(data))
+
+
+def _dos_timestamp(now: float) -> tuple[int, int]:
+    t = time.localtime(now)
+    dos_time = t.tm_hour << 11 | t.tm_min << 5 | t.tm_sec // 2
+    dos_date = (t.tm_year - 1980) << 9 | t.tm_mon << 5 | t.tm_mday
+    return dos_time, dos_date
+
+
+def _write_zip(handle: BinaryIO, members: Sequence[_Member]) -> None:
+    dos_time, dos_date = _dos_timestamp(time.time())
+    central: List[bytes] = []
+    offset = 0
+    for member in members:
+        sizes = (member.crc, len(member.compressed), member.size, len(member.name))
+        header = _LOCAL_HEADER.pack(
+            b"PK\x03\x04", _ZIP_VERSION, 0, 0, zipfile.ZIP_DEFLATED, dos_time, dos_date, *sizes, 0
+        )
+        handle.write(header)
+        handle.write(member.name)
+        handle.write(member.compressed)
+        central.append(
+            _CENTRAL_HEADER.pack(
+                b"PK\x01\x02",
+                _ZIP_VERSION,
+                _UNIX,
+                _ZIP_VERSION,
+                0,
+                0,
+                zipfile.ZIP_DEFLATED,
+                dos_time,
+                dos_date,
+                *sizes,
+                0,
+                0,
+                0,
+                0,
+                _FILE_MODE,
+                offset,
+            )
+            + member.name
+        )
+        offset += len(header) + len(member.name) + len(member.compressed)
+    directory = b"".join(central)
+    handle.write(directory)
+    count = len(members)
+    handle.write(_END_RECORD.pack(b"PK\x05\x06", 0, 0, count, count, len(directory), offset, 0))
+
+
+class DocxTemplate:
+    """python-docx's default package, captured once and split around the body."""
+
+    def __init__(self) -> None:
+        from docx import Document
+
+        buffer = io.BytesIO()
+        Document().save(buffer)
+        with zipfile.ZipFile(buffer) as package:
+            parts = [(name, package.read(name)) for name in package.namelist()]
+        self._members: List[_Member | None] = []
+        for name, data in parts:
+            if name == DOCUMENT_PART:
+                document = data.decode("utf-8")
+                split = document.rindex("<w:sectPr")
+                self._head = document[:split].encode("utf-8")
+                self._tail = document[split:].encode("utf-8")
+                self._members.append(None)
+            else:
+                self._members.append(_deflate(name, data))
+
+    def document_xml(self, body: str) -> bytes:
+        return self._head + body.encode("utf-8") + self._tail
+
+    def write(self, path: Path, body: str) -> None:
+        """Zip-stream a package whose body is ``body`` (concatenated ``<w:p>`` XML)."""
+        document = _deflate(DOCUMENT_PART, self.document_xml(body))
+        members = [member or document for member in self._members]
+        with path.open("wb") as handle:
+            _write_zip(handle, members)
+
+
+@lru_cache(maxsize=None)
+def get_template() -> DocxTemplate:
+    """Per-process template; render workers each build it on first use."""
+    return DocxTemplate()
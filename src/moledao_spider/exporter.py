@@ -1,99 +1,254 @@
-"""DOCX exporter that batches jobs into groups of ten."""
+"""Exporter base class and the DOCX exporter that streams jobs into batched files."""
 
 from __future__ import annotations
 
+import concurrent.futures
 import logging
 import re
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List, Sequence
-
-from bs4 import BeautifulSoup
-from docx import Document
+from typing import TYPE_CHECKING, Callable, Deque, Iterable, List, Sequence
 
+from .docx_template import EMPTY_PARAGRAPH, get_template, job_xml
+from .html_text import html_to_lines, resolve_backend
+from .metrics import RunMetrics
 from .models import CareerRecord
+from .record_batch import CareerRecordView
+
+if TYPE_CHECKING:
+    from docx.document import Document
 
 logger = logging.getLogger(__name__)
 
+DOCX_ENGINES = ("python-docx", "template")
+
+
+def _html_to_lines(html: str, backend: str = "auto") -> List[str]:
+    return html_to_lines(html, backend)
+
+
+@dataclass(slots=True)
+class _RenderResult:
+    filename: Path
+    html_seconds: List[float]
+    save_seconds: float
+    job_ids: List[str]
+
+
+def _write_job(document: Document, job: CareerRecord, html_backend: str = "auto") -> float:
+    """Append one job to ``document`` and return the seconds spent converting HTML."""
+    document.add_heading(job.company, level=1)
+    document.add_heading(f"{job.role} ({job.type_text})", level=2)
+    document.add_paragraph(f"Location: {job.location}")
+    document.add_paragraph(f"Type: {job.type_text}")
+    document.add_paragraph(f"Preferences: {job.preference_text}")
+    document.add_paragraph(job.relative_time)
+    document.add_paragraph(f"Exp: {job.experience_text}")
+    document.add_paragraph(f"Tag: {job.tag_text}")
+    document.add_paragraph("content:")
+    start = time.perf_counter()
+    lines = _html_to_lines(job.html_content, html_backend)
+    html_seconds = time.perf_counter() - start
+    for line in lines:
+        document.add_paragraph(line)
+    document.add_paragraph(f"time: {job.update_date}")
+    return html_seconds
+
+
+def _render_chunk(
+    filename: Path,
+    chunk: Sequence[CareerRecord],
+    html_backend: str = "auto",
+    engine: str = "python-docx",
+) -> _RenderResult:
+    """Build and save one DOCX; module-level so it can run in a worker process."""
+    if engine == "template":
+        return _render_template_chunk(filename, chunk, html_backend)
+    # Imported here so runs that write no DOCX never load python-docx and lxml.
+    from docx import Document
+
+    document = Document()
+    html_seconds: List[float] = []
+    for idx, job in enumerate(chunk):
+        html_seconds.append(_write_job(document, job, html_backend))
+        if idx < len(chunk) - 1:
+            document.add_paragraph()
+    start = time.perf_counter()
+    document.save(filename)
+    job_ids = [job.job_id for job in chunk]
+    return _RenderResult(filename, html_seconds, time.perf_counter() - start, job_ids)
+
+
+def _render_template_chunk(
+    filename: Path, chunk: Sequence[CareerRecord], html_backend: str = "auto"
+) -> _RenderResult:
+    bodies: List[str] = []
+    html_seconds: List[float] = []
+    for job in chunk:
+        start = time.perf_counter()
+        lines = _html_to_lines(job.html_content, html_backend)
+        html_seconds.append(time.perf_counter() - start)
+        bodies.append(job_xml(job, lines))
+    start = time.perf_counter()
+    get_template().write(filename, EMPTY_PARAGRAPH.join(bodies))
+    job_ids = [job.job_id for job in chunk]
+    return _RenderResult(filename, html_seconds, time.perf_counter() - start, job_ids)
+
+
+class RecordExporter(ABC):
+    """Base for exporters fed one record at a time.
+
+    Use :meth:`export` for an iterable (including a
+    :class:`~moledao_spider.record_batch.CareerRecordBatch`), or :meth:`write`
+    per job followed by :meth:`close`, which returns the files written.
+    """
+
+    def export(self, jobs: Iterable[CareerRecord]) -> List[Path]:
+        try:
+            for job in jobs:
+                self.write(job)
+        finally:
+            written = self.close()
+        return written
+
+    @abstractmethod
+    def write(self, job: CareerRecord) -> None:
+        """Add ``job`` to the export."""
+
+    @abstractmethod
+    def close(self) -> List[Path]:
+        """Flush pending jobs and return the files written."""
+
 
-def _chunk(items: Sequence[CareerRecord], size: int) -> Iterable[Sequence[CareerRecord]]:
-    for idx in range(0, len(items), size):
-        yield items[idx : idx + size]
+_FILE_INDEX = re.compile(r"jobs-(\d{3})\.\w+$")
 
 
-def _html_to_lines(html: str) -> List[str]:
-    if not html:
-        return ["N/A"]
-    soup = BeautifulSoup(html, "html.parser")
-    for tag in soup(["script", "style"]):
-        tag.decompose()
+def file_index(path: Path) -> int | None:
+    """The ``NNN`` of a ``jobs-NNN.<ext>`` output file, if ``path`` is one."""
+    match = _FILE_INDEX.match(path.name)
+    return int(match.group(1)) if match else None
 
-    lines: List[str] = []
-    for block in soup.find_all(["p", "li", "div"]):
-        text = block.get_text(" ", strip=True)
-        if text:
-            lines.append(text)
 
-    if not lines:
-        text = soup.get_text(" ", strip=True)
-        if text:
-            lines.append(text)
+def next_file_index(output_dir: Path, suffix: str) -> int:
+    """One past the highest ``jobs-NNN<suffix>`` number in ``output_dir``."""
+    indexes = (file_index(path) or 0 for path in output_dir.glob(f"jobs-*{suffix}"))
+    return max(indexes, default=0) + 1
 
-    return lines or ["N/A"]
 
+class DocxExporter(RecordExporter):
+    """Streams jobs into numbered DOCX files, saving each batch as soon as it is full.
 
-class DocxExporter:
-    def __init__(self, output_dir: Path, batch_size: int = 10, append: bool = False):
+    Completed batches are already on disk if the caller fails.
+    """
+
+    def __init__(
+        self,
+        output_dir: Path,
+        batch_size: int = 10,
+        append: bool = False,
+        render_workers: int = 1,
+        html_backend: str = "auto",
+        metrics: RunMetrics | None = None,
+        engine: str = "python-docx",
+        start_index: int | None = None,
+        on_batch: Callable[[Path, List[str]], None] | None = None,
+    ):
+        if engine not in DOCX_ENGINES:
+            choices = ", ".join(DOCX_ENGINES)
+            raise ValueError(f"Unknown DOCX engine {engine!r}; choose from {choices}")
         self.output_dir = output_dir
         self.batch_size = max(1, batch_size)
         self.append = append
-
-    def export(self, jobs: Sequence[CareerRecord]) -> List[Path]:
-        if not jobs:
+        self.render_workers = max(1, render_workers)
+        self.html_backend = resolve_backend(html_backend)
+        self.metrics = metrics
+        self.engine = engine
+        self.start_index = start_index
+        self.on_batch = on_batch
+        self._opened = False
+
+    def write(self, job: CareerRecord | CareerRecordView) -> None:
+        if not self._opened:
+            self._open()
+        # Batch views are reused per row, so buffered jobs must own their data.
+        if isinstance(job, CareerRecordView):
+            job = job.detach()
+        self._buffer.append(job)
+        if len(self._buffer) >= self.batch_size:
+            self._flush()
+
+    def close(self) -> List[Path]:
+        if not self._opened:
             logger.warning("No jobs provided to exporter")
             return []
+        try:
+            self._flush()
+            while self._pending:
+                self._record(self._pending.popleft().result())
+        finally:
+            if self._pool:
+                self._pool.shutdown()
+            self._opened = False
+        return self._written
+
+    def _open(self) -> None:
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        written: List[Path] = []
-
-        start_index = self._next_index() if self.append else 1
-
-        for offset, chunk in enumerate(_chunk(jobs, self.batch_size)):
-            document = Document()
-            for idx, job in enumerate(chunk):
-                self._write_job(document, job)
-                if idx < len(chunk) - 1:
-                    document.add_paragraph()
-            filename = self._filename(start_index + offset)
-            if not self.append and filename.exists():
-                logger.info("Overwriting %s", filename)
-            document.save(filename)
-            written.append(filename)
-            logger.info("Wrote %s", filename)
-
-        return written
+        if self.start_index:
+            self._next_doc = self.start_index
+        elif self.append:
+            self._next_doc = next_file_index(self.output_dir, ".docx")
+        else:
+            self._next_doc = 1
+        self._buffer: List[CareerRecord] = []
+        self._written: List[Path] = []
+        self._pending: Deque[concurrent.futures.Future] = deque()
+        # Rendering is CPU-bound, so whole documents can be spread across processes.
+        # The process pool module (and multiprocessing) is only loaded when used.
+        self._pool = (
+            concurrent.futures.ProcessPoolExecutor(max_workers=self.render_workers)
+            if self.render_workers > 1
+            else None
+        )
+        self._opened = True
+
+    def _flush(self) -> None:
+        if not self._buffer:
+            return
+        chunk, self._buffer = self._buffer, []
+        filename = self._filename(self._next_doc)
+        self._next_doc += 1
+        if not self.append and filename.exists():
+            logger.info("Overwriting %s", filename)
+        if not self._pool:
+            if self.metrics:
+                # Timed piecewise by _render_chunk; labelled for the sampling profiler.
+                with self.metrics.label("docx_render"):
+                    result = _render_chunk(filename, chunk, self.html_backend, self.engine)
+            else:
+                result = _render_chunk(filename, chunk, self.html_backend, self.engine)
+            self._record(result)
+            return
+        self._pending.append(
+            self._pool.submit(_render_chunk, filename, chunk, self.html_backend, self.engine)
+        )
+        # Bound the records held by queued batches to a couple per worker.
+        while len(self._pending) > self.render_workers * 2:
+            self._record(self._pending.popleft().result())
+
+    def _record(self, result: _RenderResult) -> None:
+        self._written.append(result.filename)
+        logger.info("Wrote %s", result.filename)
+        if self.on_batch:
+            self.on_batch(result.filename, result.job_ids)
+        if self.metrics:
+            for seconds in result.html_seconds:
+                self.metrics.observe("html_convert", seconds)
+            self.metrics.observe("document_save", result.save_seconds)
+            self.metrics.incr("documents_written")
+            self.metrics.incr("jobs_exported", len(result.html_seconds))
 
     def _filename(self, doc_index: int) -> Path:
         return self.output_dir / f"jobs-{doc_index:03d}.docx"
-
-    def _next_index(self) -> int:
-        existing = sorted(self.output_dir.glob("jobs-*.docx"))
-        pattern = re.compile(r"jobs-(\d{3})\.docx$")
-        max_index = 0
-        for path in existing:
-            match = pattern.match(path.name)
-            if match:
-                max_index = max(max_index, int(match.group(1)))
-        return max_index + 1 if max_index else 1
-
-    def _write_job(self, document: Document, job: CareerRecord) -> None:
-        document.add_heading(job.company, level=1)
-        document.add_heading(f"{job.role} ({job.type_text})", level=2)
-        document.add_paragraph(f"Location: {job.location}")
-        document.add_paragraph(f"Type: {job.type_text}")
-        document.add_paragraph(f"Preferences: {job.preference_text}")
-        document.add_paragraph(job.relative_time)
-        document.add_paragraph(f"Exp: {job.experience_text}")
-        document.add_paragraph(f"Tag: {job.tag_text}")
-        document.add_paragraph("content:")
-        for line in _html_to_lines(job.html_content):
-            document.add_paragraph(line)
-        document.add_paragraph(f"time: {job.update_date}")
@@ -0,0 +1,176 @@
+"""Job selection filters evaluated before details are fetched.
+
+Filter values accept the friendly names of the lookup tables in
+:mod:`.models` (``"Full-time"``, ``"Hybrid"``, ``"Singapore"``) as well as the
+raw codes. Live runs push them into the list query parameters; every run also
+checks them on the summaries, and on the detail for fields that list
+summaries do not carry (tags, and experience or location when the summary
+lacks it).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from functools import cached_property
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Mapping, Tuple
+
+from .dedupe import parse_update_date
+from .models import COUNTRY_NAMES, parse_location
+
+
+def _reverse(mapping: Mapping[Any, str]) -> Dict[str, Any]:
+    # Later entries lose ties, so "United Kingdom" maps to GB rather than UK.
+    reverse: Dict[str, Any] = {}
+    for code, name in mapping.items():
+        reverse.setdefault(name.casefold(), code)
+    return reverse
+
+
+COUNTRY_CODES = _reverse(COUNTRY_NAMES)
+
+
+def resolve_code(value: str, lookup: Mapping[int, str]) -> int:
+    """Map a friendly name or numeric code of ``lookup`` to its code."""
+    text = value.strip()
+    if text.isdigit() and int(text) in lookup:
+        return int(text)
+    code = _reverse(lookup).get(text.casefold())
+    if code is None:
+        choices = ", ".join(f"{name} ({code})" for code, name in lookup.items())
+        raise ValueError(f"Unknown value {value!r}; choose from {choices}")
+    return code
+
+
+def resolve_country(value: str) -> str:
+    """Map a country name or two-letter code to the upper-case code."""
+    text = value.strip()
+    code = COUNTRY_CODES.get(text.casefold())
+    if code is not None:
+        return code
+    if len(text) == 2 and text.isalpha():
+        return text.upper()
+    raise ValueError(
+        f"Unknown country {value!r}; use a two-letter code or one of "
+        + ", ".join(sorted(set(COUNTRY_NAMES.values())))
+    )
+
+
+def _code(value: Any) -> int | None:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _career(payload: Mapping[str, Any]) -> Mapping[str, Any]:
+    career = payload.get("career")
+    return career if isinstance(career, dict) else {}
+
+
+@dataclass(frozen=True)
+class JobFilter:
+    """Conjunction of per-field filters; several values for one field match any of them."""
+
+    tags: Tuple[str, ...] = ()
+    countries: Tuple[str, ...] = ()
+    types: Tuple[int, ...] = ()
+    preferences: Tuple[int, ...] = ()
+    experiences: Tuple[int, ...] = ()
+    updated_since: datetime | None = None
+
+    def __post_init__(self) -> None:
+        if self.updated_since and self.updated_since.tzinfo is None:
+            object.__setattr__(self, "updated_since", self.updated_since.replace(tzinfo=UTC))
+
+    def __bool__(self) -> bool:
+        return bool(
+            self.tags
+            or self.countries
+            or self.types
+            or self.preferences
+            or self.experiences
+            or self.updated_since
+        )
+
+    @cached_property
+    def _tag_names(self) -> FrozenSet[str]:
+        return frozenset(tag.casefold() for tag in self.tags)
+
+    @cached_property
+    def _location_names(self) -> FrozenSet[str]:
+        # Compared with parse_location's output, the same value the export shows.
+        return frozenset(COUNTRY_NAMES.get(code, code) for code in self.countries)
+
+    def list_params(self) -> Dict[str, str]:
+        """Query parameters of the career list endpoint that pre-select matching jobs."""
+        params: Dict[str, str] = {}
+        if self.tags:
+            params["tags"] = ",".join(self.tags)
+        if self.countries:
+            params["location"] = ",".join(self.countries)
+        if self.types:
+            params["workType"] = ",".join(map(str, self.types))
+        if self.experiences:
+            params["workExperience"] = ",".join(map(str, self.experiences))
+        if self.preferences:
+            params["workPreferences"] = ",".join(map(str, self.preferences))
+        return params
+
+    def _updated_after(self, value: Any) -> bool:
+        updated = parse_update_date(value)
+        return updated is not None and updated >= self.updated_since
+
+    def match_summary(self, summary: Mapping[str, Any]) -> bool:
+        """Whether a list summary can match; fields it lacks are left to :meth:`match_detail`."""
+        career = _career(summary)
+        if self.types and _code(career.get("type")) not in self.types:
+            return False
+        if self.preferences and _code(career.get("preferences")) not in self.preferences:
+            return False
+        base = career.get("base")
+        if self.countries and base and parse_location(base) not in self._location_names:
+            return False
+        experience = _code(career.get("experience"))
+        if self.experiences and experience is not None and experience not in self.experiences:
+            return False
+        if self.updated_since and summary.get("updateDate"):
+            return self._updated_after(summary["updateDate"])
+        return True
+
+    def match_detail(self, summary: Mapping[str, Any], detail: Mapping[str, Any]) -> bool:
+        """Check the fields only the detail payload carries."""
+        if self.tags:
+            names = {
+                str(tag["name"]).casefold()
+                for tag in detail.get("tags") or []
+                if isinstance(tag, dict) and tag.get("name")
+            }
+            if not names & self._tag_names:
+                return False
+        if self.experiences:
+            experience = _code(_career(detail).get("experience"))
+            if experience is None:
+                experience = _code(_career(summary).get("experience"))
+            if experience not in self.experiences:
+                return False
+        if self.countries and not _career(summary).get("base"):
+            # Records fall back to the detail's base when the summary has none.
+            if parse_location(_career(detail).get("base")) not in self._location_names:
+                return False
+        if self.updated_since and not summary.get("updateDate"):
+            return self._updated_after(detail.get("updateDate"))
+        return True
+
+    def summaries(self, summaries: Iterable[dict]) -> Iterator[dict]:
+        return (summary for summary in summaries if self.match_summary(summary))
+
+    def pairs(self, pairs: Iterable[Tuple[dict, dict]]) -> Iterator[Tuple[dict, dict]]:
+        return (pair for pair in pairs if self.match_detail(*pair))
+
+    def exhausted(self, page: List[dict]) -> bool:
+        """Whether a page of the newest-first live list ends before ``updated_since``."""
+        if not self.updated_since or not page:
+            return False
+        oldest = parse_update_date(page[-1].get("updateDate"))
+        return oldest is not None and oldest < self.updated_since
@@ -0,0 +1,244 @@
+"""Tabular export formats (JSONL, CSV, Parquet) and fan-out to several exporters.
+
+Each writer emits one row per :class:`CareerRecord` with the dataclass fields
+as columns, so analytics can read the data without re-parsing DOCX files.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import logging
+import time
+from abc import ABC, abstractmethod
+from dataclasses import fields
+from operator import attrgetter
+from pathlib import Path
+from typing import IO, Callable, Iterable, Iterator, List, Sequence
+
+from .exporter import DocxExporter, RecordExporter, next_file_index
+from .metrics import RunMetrics
+from .models import CareerRecord
+
+logger = logging.getLogger(__name__)
+
+FORMATS = ("docx", "jsonl", "csv", "parquet")
+FIELDS = tuple(field.name for field in fields(CareerRecord))
+_row = attrgetter(*FIELDS)
+WRITE_BATCH_SIZE = 500
+PARQUET_ROW_GROUP_SIZE = 10_000
+
+
+class _BatchedFileExporter(RecordExporter, ABC):
+    """Buffers field tuples and hands them to :meth:`_write_rows` a batch at a time.
+
+    Rows are extracted on :meth:`write`, so record batch views need no detaching.
+    """
+
+    format_name = ""
+    batch_size = WRITE_BATCH_SIZE
+
+    def __init__(
+        self, output_dir: Path, append: bool = False, metrics: RunMetrics | None = None
+    ) -> None:
+        self.output_dir = output_dir
+        self.append = append
+        self.metrics = metrics
+        self.path: Path | None = None
+        self._buffer: List[tuple] = []
+        self._written = 0
+
+    def write(self, job: CareerRecord) -> None:
+        if self.path is None:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            self.path = self._open()
+        self._buffer.append(_row(job))
+        if len(self._buffer) >= self.batch_size:
+            self._flush()
+
+    def close(self) -> List[Path]:
+        if self.path is None:
+            return []
+        try:
+            self._flush()
+        finally:
+            self._close()
+        logger.info("Wrote %s record(s) to %s", self._written, self.path)
+        path, self.path = self.path, None
+        return [path]
+
+    def _flush(self) -> None:
+        if not self._buffer:
+            return
+        rows, self._buffer = self._buffer, []
+        start = time.perf_counter()
+        self._write_rows(rows)
+        self._written += len(rows)
+        if self.metrics:
+            self.metrics.observe(f"{self.format_name}_write", time.perf_counter() - start)
+            self.metrics.incr(f"{self.format_name}_records", len(rows))
+
+    @abstractmethod
+    def _open(self) -> Path:
+        """Create the output file and return its path."""
+
+    @abstractmethod
+    def _write_rows(self, rows: Sequence[tuple]) -> None:
+        """Write one batch of field tuples."""
+
+    @abstractmethod
+    def _close(self) -> None:
+        """Release the output file."""
+
+
+class _TextFileExporter(_BatchedFileExporter):
+    """Single ``jobs.<ext>`` text file, appended to when ``append`` is set."""
+
+    suffix = ""
+
+    def _open(self) -> Path:
+        path = self.output_dir / f"jobs{self.suffix}"
+        self._resumed = self.append and path.exists() and path.stat().st_size > 0
+        self._handle: IO[str] = path.open(
+            "a" if self.append else "w", encoding="utf-8", newline=""
+        )
+        return path
+
+    def _close(self) -> None:
+        self._handle.close()
+
+
+class JsonlExporter(_TextFileExporter):
+    """One JSON object per line in ``jobs.jsonl``."""
+
+    format_name = "jsonl"
+    suffix = ".jsonl"
+
+    def _write_rows(self, rows: Sequence[tuple]) -> None:
+        self._handle.write(
+            "".join(json.dumps(dict(zip(FIELDS, row)), ensure_ascii=False) + "\n" for row in rows)
+        )
+
+
+def read_jsonl_records(path: Path) -> Iterator[CareerRecord]:
+    """Read records back from a file written by :class:`JsonlExporter`."""
+    with path.open(encoding="utf-8") as handle:
+        for line in handle:
+            if line.strip():
+                yield CareerRecord(**json.loads(line))
+
+
+class CsvExporter(_TextFileExporter):
+    """RFC 4180 CSV in ``jobs.csv`` with a header row."""
+
+    format_name = "csv"
+    suffix = ".csv"
+
+    def _open(self) -> Path:
+        path = super()._open()
+        self._writer = csv.writer(self._handle)
+        if not self._resumed:
+            self._writer.writerow(FIELDS)
+        return path
+
+    def _write_rows(self, rows: Sequence[tuple]) -> None:
+        self._writer.writerows(rows)
+
+
+class ParquetExporter(_BatchedFileExporter):
+    """Columnar ``jobs-NNN.parquet`` per run, one row group per batch (needs pyarrow)."""
+
+    format_name = "parquet"
+    batch_size = PARQUET_ROW_GROUP_SIZE
+
+    def __init__(
+        self, output_dir: Path, append: bool = False, metrics: RunMetrics | None = None
+    ) -> None:
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as exc:  # pragma: no cover - depends on optional extra
+            raise ImportError(
+                "Parquet export requires pyarrow; install with `pip install -e .[parquet]`"
+            ) from exc
+        super().__init__(output_dir, append, metrics)
+        self._pa = pa
+        self._pq = pq
+        self._schema = pa.schema([(name, pa.string()) for name in FIELDS])
+
+    def _open(self) -> Path:
+        index = next_file_index(self.output_dir, ".parquet") if self.append else 1
+        path = self.output_dir / f"jobs-{index:03d}.parquet"
+        self._parquet = self._pq.ParquetWriter(path, self._schema, compression="zstd")
+        return path
+
+    def _write_rows(self, rows: Sequence[tuple]) -> None:
+        columns = [list(column) for column in zip(*rows)]
+        self._parquet.write_batch(self._pa.record_batch(columns, schema=self._schema))
+
+    def _close(self) -> None:
+        self._parquet.close()
+
+
+class MultiExporter(RecordExporter):
+    """Fans every record out to several exporters so one fetch feeds all formats."""
+
+    def __init__(self, exporters: Iterable[RecordExporter]) -> None:
+        self.exporters = list(exporters)
+
+    def write(self, job: CareerRecord) -> None:
+        for exporter in self.exporters:
+            exporter.write(job)
+
+    def close(self) -> List[Path]:
+        written: List[Path] = []
+        error: BaseException | None = None
+        # Close every exporter even if one fails, then re-raise the first error.
+        for exporter in self.exporters:
+            try:
+                written.extend(exporter.close())
+            except Exception as exc:  # noqa: BLE001
+                error = error or exc
+        if error:
+            raise error
+        return written
+
+
+def create_exporter(
+    formats: Sequence[str],
+    output_dir: Path,
+    append: bool = False,
+    metrics: RunMetrics | None = None,
+    batch_size: int = 10,
+    render_workers: int = 1,
+    html_backend: str = "auto",
+    docx_engine: str = "python-docx",
+    start_index: int | None = None,
+    on_batch: Callable[[Path, List[str]], None] | None = None,
+) -> RecordExporter:
+    """Build the exporter for ``formats``; the batch/render/numbering options only affect DOCX."""
+    exporters: List[RecordExporter] = []
+    for name in dict.fromkeys(formats):
+        if name == "docx":
+            exporters.append(
+                DocxExporter(
+                    output_dir=output_dir,
+                    batch_size=batch_size,
+                    append=append,
+                    render_workers=render_workers,
+                    html_backend=html_backend,
+                    metrics=metrics,
+                    engine=docx_engine,
+                    start_index=start_index,
+                    on_batch=on_batch,
+                )
+            )
+        elif name == "jsonl":
+            exporters.append(JsonlExporter(output_dir, append, metrics))
+        elif name == "csv":
+            exporters.append(CsvExporter(output_dir, append, metrics))
+        elif name == "parquet":
+            exporters.append(ParquetExporter(output_dir, append, metrics))
+        else:
+            raise ValueError(f"Unknown export format {name!r}; choose from {', '.join(FORMATS)}")
+    return exporters[0] if len(exporters) == 1 else MultiExporter(exporters)
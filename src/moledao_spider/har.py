@@ -0,0 +1,215 @@
+"""Incremental HAR reader that decodes one entry at a time."""
+
+from __future__ import annotations
+
+import base64
+import json
+import logging
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any, Callable, Iterator, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from .jsonio import loads
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 1 << 16
+LIST_PATH = "/career/list"
+DETAIL_PATH = "/career/details"
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+@dataclass(frozen=True, slots=True)
+class EntrySpan:
+    """Byte range of one serialized entry inside a HAR file."""
+
+    path: Path
+    offset: int
+    length: int
+
+    def load(self) -> dict:
+        with self.path.open("rb") as handle:
+            handle.seek(self.offset)
+            return loads(handle.read(self.length))
+
+
+class _StreamReader:
+    """Chunked text buffer over a UTF-8 file that tracks absolute byte offsets."""
+
+    def __init__(self, handle: IO[str], chunk_size: int = CHUNK_SIZE) -> None:
+        self._handle = handle
+        self._chunk_size = chunk_size
+        self._buf = ""
+        self._pos = 0
+        self._consumed_bytes = 0
+        self._eof = False
+        if self._fill() and self._buf.startswith("\ufeff"):
+            self._pos = 1
+            self._compact()
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        # Read at least as much as is buffered so huge entries parse in amortized linear time.
+        chunk = self._handle.read(max(self._chunk_size, len(self._buf) - self._pos))
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf += chunk
+        return True
+
+    def _compact(self) -> None:
+        if self._pos:
+            self._consumed_bytes += len(self._buf[: self._pos].encode("utf-8"))
+            self._buf = self._buf[self._pos :]
+            self._pos = 0
+
+    def peek(self) -> str:
+        while True:
+            self._pos = _WHITESPACE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Malformed HAR: expected {char!r}, found {found!r}")
+        self._pos += 1
+
+    def decode(self) -> Tuple[Any, int, int]:
+        """Decode the next JSON value and return it with its byte offset and length."""
+        self.peek()
+        self._compact()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A number or literal touching the buffer end may continue in the next chunk.
+            truncated = end == len(self._buf) and not isinstance(value, (dict, list, str))
+            if truncated and self._fill():
+                continue
+            break
+        length = len(self._buf[self._pos : end].encode("utf-8"))
+        offset = self._consumed_bytes
+        self._pos = end
+        return value, offset, length
+
+    def iter_object_keys(self) -> Iterator[str]:
+        """Yield object keys; the caller must consume each value before resuming."""
+        self.expect("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key, _, _ = self.decode()
+            self.expect(":")
+            yield key
+            separator = self.peek()
+            self._pos += 1
+            if separator == "}":
+                return
+            if separator != ",":
+                raise ValueError(f"Malformed HAR: unexpected {separator!r} in object")
+
+    def iter_array(self) -> Iterator[Tuple[Any, int, int]]:
+        self.expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self.decode()
+            separator = self.peek()
+            self._pos += 1
+            if separator == "]":
+                return
+            if separator != ",":
+                raise ValueError(f"Malformed HAR: unexpected {separator!r} in array")
+
+
+def iter_entry_spans(
+    path: Path, chunk_size: int = CHUNK_SIZE
+) -> Iterator[Tuple[dict, EntrySpan]]:
+    """Stream ``log.entries`` from a HAR file without loading the whole document.
+
+    Only one entry is decoded at a time; every other top-level member is parsed
+    and discarded as it is passed.
+    """
+    if not path.exists():
+        raise FileNotFoundError(f"HAR file not found: {path}")
+    with path.open("r", encoding="utf-8", newline="") as handle:
+        reader = _StreamReader(handle, chunk_size)
+        for key in reader.iter_object_keys():
+            if key != "log":
+                reader.decode()
+                continue
+            for log_key in reader.iter_object_keys():
+                if log_key != "entries":
+                    reader.decode()
+                    continue
+                for entry, offset, length in reader.iter_array():
+                    yield entry, EntrySpan(path, offset, length)
+
+
+def iter_har_entries(path: Path, chunk_size: int = CHUNK_SIZE) -> Iterator[dict]:
+    for entry, _ in iter_entry_spans(path, chunk_size):
+        yield entry
+
+
+def extract_entry_json(
+    entry: dict, decode: Callable[[str | bytes], Any] = loads
+) -> dict | None:
+    """Decode the JSON response body of a HAR entry, if it has one."""
+    content = entry.get("response", {}).get("content", {})
+    text = content.get("text")
+    if not text:
+        return None
+
+    if content.get("encoding") == "base64":
+        text = base64.b64decode(text)
+
+    try:
+        return decode(text)
+    except ValueError:
+        logger.debug("Skipping non-JSON HAR entry")
+        return None
+
+
+def request_path(entry: dict) -> str | None:
+    """URL of the entry's request without query or fragment; ``None`` without a URL.
+
+    Cheaper than ``urlsplit`` and enough to match an endpoint by suffix.
+    """
+    url = entry.get("request", {}).get("url")
+    if not url:
+        return None
+    end = len(url)
+    for separator in "?#":
+        position = url.find(separator)
+        if position != -1:
+            end = min(end, position)
+    return url[:end]
+
+
+def is_endpoint(entry: dict, endpoint: str) -> bool:
+    """Whether ``entry`` may hold ``endpoint``'s response; entries without a URL may."""
+    path = request_path(entry)
+    return path is None or path.endswith(endpoint)
+
+
+def request_job_id(entry: dict) -> str | None:
+    """Return the ``id`` query parameter of a ``/career/details`` request."""
+    url = entry.get("request", {}).get("url") or ""
+    parts = urlsplit(url)
+    if not parts.path.endswith(DETAIL_PATH):
+        return None
+    values = parse_qs(parts.query).get("id")
+    return values[0] if values else None
@@ -0,0 +1,145 @@
+"""Precompiled, memory-mapped index of the JSON bodies stored in a HAR capture.
+
+Layout: an 8-byte magic, a little-endian ``uint64`` offset of the table, the
+decoded response bodies as compact UTF-8 JSON, then the table itself (JSON)
+mapping list pages and detail ids to ``[offset, length]`` pairs.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+from .dedupe import is_newer
+from .har import (
+    DETAIL_PATH,
+    LIST_PATH,
+    extract_entry_json,
+    is_endpoint,
+    iter_har_entries,
+    request_path,
+)
+from .jsonio import loads, loads_detail
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"MOLEIDX1"
+_HEADER = struct.Struct("<8sQ")
+INDEX_SUFFIX = ".idx"
+
+
+def index_path_for(har_path: Path) -> Path:
+    return har_path.with_name(har_path.name + INDEX_SUFFIX)
+
+
+def build_har_index(har_path: Path, index_path: Path | None = None) -> Path:
+    """Compile ``har_path`` into an index file and return its path."""
+    index_path = index_path or index_path_for(har_path)
+    lists: List[List[int]] = []
+    details: Dict[str, List[int]] = {}
+    dates: Dict[str, object] = {}
+    tmp_path = index_path.with_name(index_path.name + ".tmp")
+    with tmp_path.open("wb") as handle:
+        handle.write(_HEADER.pack(MAGIC, 0))
+        for entry in iter_har_entries(har_path):
+            path = request_path(entry)
+            is_detail = bool(path and path.endswith(DETAIL_PATH))
+            payload = extract_entry_json(entry, loads_detail if is_detail else loads)
+            data = (payload or {}).get("data")
+            if not isinstance(data, dict):
+                continue
+            if data.get("list"):
+                if not is_endpoint(entry, LIST_PATH):
+                    continue  # Some other list endpoint; HarCareerListClient skips it too.
+                body, target = data["list"], None
+            elif data.get("id"):
+                if not is_endpoint(entry, DETAIL_PATH):
+                    continue  # Some other endpoint; HarCareerDetailsClient skips it too.
+                if not is_detail:
+                    # Decode URL-less details like HarCareerDetailsClient does.
+                    data = extract_entry_json(entry, loads_detail)["data"]
+                body, target = data, str(data["id"])
+                # Duplicate ids keep the newest updateDate, as HarCareerDetailsClient does.
+                if target in dates and not is_newer(data, {"updateDate": dates[target]}):
+                    continue
+                dates[target] = data.get("updateDate")
+            else:
+                continue
+            blob = json.dumps(body, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            span = [handle.tell(), len(blob)]
+            handle.write(blob)
+            if target is None:
+                lists.append(span)
+            else:
+                details[target] = span
+        table_offset = handle.tell()
+        table = {"source": har_path.name, "lists": lists, "details": details}
+        handle.write(json.dumps(table, separators=(",", ":")).encode("utf-8"))
+        handle.seek(0)
+        handle.write(_HEADER.pack(MAGIC, table_offset))
+    os.replace(tmp_path, index_path)
+    logger.info(
+        "Indexed %s list page(s) and %s detail(s) from %s into %s",
+        len(lists),
+        len(details),
+        har_path,
+        index_path,
+    )
+    return index_path
+
+
+class HarIndex:
+    """Read-only view over a compiled index; bodies are decoded on access."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        with path.open("rb") as handle:
+            self._mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, table_offset = _HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            self._mmap.close()
+            raise ValueError(f"Not a HAR index: {path}")
+        table = loads(self._mmap[table_offset:])
+        self._lists: List[List[int]] = table["lists"]
+        self._details: Dict[str, List[int]] = table["details"]
+
+    def _decode(self, span: List[int]):
+        offset, length = span
+        return loads(self._mmap[offset : offset + length])
+
+    def __contains__(self, job_id: str) -> bool:
+        return job_id in self._details
+
+    def job_ids(self) -> Iterator[str]:
+        return iter(self._details)
+
+    def detail(self, job_id: str) -> dict | None:
+        span = self._details.get(job_id)
+        return self._decode(span) if span else None
+
+    def list_pages(self) -> Iterator[List[dict]]:
+        for span in self._lists:
+            yield self._decode(span)
+
+    def close(self) -> None:
+        self._mmap.close()
+
+
+def load_index_for(har_path: Path) -> HarIndex | None:
+    """Return the sidecar index of ``har_path`` when it is at least as new as the HAR."""
+    index_path = index_path_for(har_path)
+    try:
+        if index_path.stat().st_mtime_ns < har_path.stat().st_mtime_ns:
+            logger.debug("Ignoring stale HAR index %s", index_path)
+            return None
+        index = HarIndex(index_path)
+    except (OSError, ValueError) as exc:
+        logger.debug("HAR index %s unavailable: %s", index_path, exc)
+        return None
+    logger.debug("Using HAR index %s", index_path)
+    return index
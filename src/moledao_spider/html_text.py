@@ -0,0 +1,224 @@
+"""Single-pass HTML-to-paragraph conversion with pluggable parser backends.
+
+Every backend drives the same :class:`_LineCollector`: text is gathered per
+text node and a line is emitted whenever a block-level tag opens or closes, so
+nested blocks (``<div><p>..</p></div>``) produce each line exactly once.
+Results are memoized by content hash so reposted descriptions parse once.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import threading
+from collections import OrderedDict
+from html.parser import HTMLParser
+from typing import Callable, Dict, List, Tuple
+
+BLOCK_TAGS = frozenset(
+    {
+        "p",
+        "li",
+        "div",
+        "h1",
+        "h2",
+        "h3",
+        "h4",
+        "h5",
+        "h6",
+        "ul",
+        "ol",
+        "blockquote",
+        "pre",
+        "section",
+        "article",
+        "table",
+        "tr",
+    }
+)
+SKIP_TAGS = frozenset({"script", "style"})
+BACKENDS = ("auto", "lxml", "selectolax", "html.parser")
+DEFAULT_MEMO_SIZE = 2048
+
+
+class _LineCollector:
+    """Parser target (lxml target interface) that turns events into text lines."""
+
+    def __init__(self) -> None:
+        self.lines: List[str] = []
+        self._words: List[str] = []
+        self._text: List[str] = []
+        self._skip_depth = 0
+
+    def _end_text(self) -> None:
+        if self._text:
+            text = "".join(self._text).strip()
+            self._text.clear()
+            if text and not self._skip_depth:
+                self._words.append(text)
+
+    def _end_line(self) -> None:
+        if self._words:
+            self.lines.append(" ".join(self._words))
+            self._words.clear()
+
+    def start(self, tag: str, attrib=None) -> None:
+        self._end_text()
+        tag = tag.lower()
+        if tag in SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag in BLOCK_TAGS:
+            self._end_line()
+
+    def end(self, tag: str) -> None:
+        self._end_text()
+        tag = tag.lower()
+        if tag in SKIP_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag in BLOCK_TAGS:
+            self._end_line()
+
+    def data(self, text: str) -> None:
+        if not self._skip_depth:
+            self._text.append(text)
+
+    def close(self) -> List[str]:
+        self._end_text()
+        self._end_line()
+        return self.lines
+
+
+class _StdlibAdapter(HTMLParser):
+    def __init__(self, collector: _LineCollector) -> None:
+        super().__init__(convert_charrefs=True)
+        self._collector = collector
+
+    def handle_starttag(self, tag: str, attrs) -> None:
+        self._collector.start(tag)
+
+    def handle_startendtag(self, tag: str, attrs) -> None:
+        self._collector.start(tag)
+        self._collector.end(tag)
+
+    def handle_endtag(self, tag: str) -> None:
+        self._collector.end(tag)
+
+    def handle_data(self, data: str) -> None:
+        self._collector.data(data)
+
+
+def _convert_stdlib(html: str) -> List[str]:
+    collector = _LineCollector()
+    parser = _StdlibAdapter(collector)
+    parser.feed(html)
+    parser.close()
+    return collector.close()
+
+
+def _convert_lxml(html: str) -> List[str]:
+    from lxml import etree
+
+    collector = _LineCollector()
+    parser = etree.HTMLParser(target=collector, remove_comments=True)
+    parser.feed(html)
+    return parser.close()
+
+
+def _convert_selectolax(html: str) -> List[str]:
+    from selectolax.lexbor import LexborHTMLParser
+
+    collector = _LineCollector()
+    root = LexborHTMLParser(html).body
+    # Iterative walk; a plain tag string on the stack marks the end of that element.
+    stack = list(_children(root))[::-1] if root else []
+    while stack:
+        node = stack.pop()
+        if isinstance(node, str):
+            collector.end(node)
+        elif node.is_text_node:
+            collector.data(node.text_content or "")
+        elif node.is_element_node:
+            collector.start(node.tag)
+            stack.append(node.tag)
+            stack.extend(list(_children(node))[::-1])
+    return collector.close()
+
+
+def _children(node):
+    child = node.child
+    while child is not None:
+        yield child
+        child = child.next
+
+
+_CONVERTERS: Dict[str, Callable[[str], List[str]]] = {
+    "lxml": _convert_lxml,
+    "selectolax": _convert_selectolax,
+    "html.parser": _convert_stdlib,
+}
+_MODULES = {
+    "lxml": "lxml.etree",
+    "selectolax": "selectolax.lexbor",
+    "html.parser": "html.parser",
+}
+
+
+def _available(backend: str) -> bool:
+    try:
+        return importlib.util.find_spec(_MODULES[backend]) is not None
+    except ModuleNotFoundError:
+        return False
+
+
+def resolve_backend(backend: str = "auto") -> str:
+    """Map ``auto`` to the fastest installed backend and validate explicit choices."""
+    if backend == "auto":
+        return next(name for name in BACKENDS[1:] if _available(name))
+    if backend not in _CONVERTERS:
+        raise ValueError(f"Unknown HTML backend {backend!r}; choose from {', '.join(BACKENDS)}")
+    if not _available(backend):
+        raise ImportError(f"HTML backend {backend!r} is not installed")
+    return backend
+
+
+class HtmlConverter:
+    """Converts HTML snippets to text lines, memoizing results by content hash."""
+
+    def __init__(self, backend: str = "auto", memo_size: int = DEFAULT_MEMO_SIZE) -> None:
+        self.backend = resolve_backend(backend)
+        self._convert = _CONVERTERS[self.backend]
+        self.memo_size = memo_size
+        self._memo: OrderedDict[bytes, Tuple[str, ...]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __call__(self, html: str) -> List[str]:
+        if not html:
+            return ["N/A"]
+        key = hashlib.blake2b(html.encode("utf-8"), digest_size=16).digest()
+        with self._lock:
+            cached = self._memo.get(key)
+            if cached is not None:
+                self._memo.move_to_end(key)
+                return list(cached)
+        lines = self._convert(html) or ["N/A"]
+        if self.memo_size:
+            with self._lock:
+                self._memo[key] = tuple(lines)
+                if len(self._memo) > self.memo_size:
+                    self._memo.popitem(last=False)
+        return lines
+
+
+_converters: Dict[str, HtmlConverter] = {}
+
+
+def get_converter(backend: str = "auto") -> HtmlConverter:
+    """Return the process-wide converter for ``backend`` (shared memo)."""
+    converter = _converters.get(backend)
+    if converter is None:
+        converter = _converters.setdefault(backend, HtmlConverter(backend))
+    return converter
+
+
+def html_to_lines(html: str, backend: str = "auto") -> List[str]:
+    return get_converter(backend)(html)
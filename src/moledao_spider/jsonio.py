@@ -0,0 +1,103 @@
+"""JSON decoding with the fastest installed backend and a slim detail schema.
+
+``loads`` uses orjson, then msgspec, then the stdlib ``json`` module,
+whichever is installed first (``pip install -e .[fast-json]``).
+:data:`DETAIL_SCHEMA` lists the detail fields record building reads. With
+msgspec, :func:`loads_detail` decodes responses into typed structs of just
+those fields, so the rest are never materialized; other backends return the
+full payload, as pruning decoded dicts costs more than it saves.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, List, Mapping
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the fast-json extra
+    orjson = None
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+BACKEND = "orjson" if orjson else "msgspec" if msgspec else "json"
+
+# Nested field selection: a dict selects keys of an object, a one-item list
+# applies its schema to every element, ``None`` keeps the value as is.
+DETAIL_SCHEMA: Mapping[str, Any] = {
+    "id": None,
+    "name": None,
+    "updateDate": None,
+    "belonging": {"name": None},
+    "career": {"experience": None, "base": None},
+    "tags": [{"name": None}],
+    "content": {"content": None},
+}
+
+if orjson is not None:
+    loads = orjson.loads
+elif msgspec is not None:
+    loads = msgspec.json.decode
+else:
+    loads = json.loads
+
+
+def project(value: Any, schema: Any) -> Any:
+    """Copy of ``value`` restricted to the fields selected by ``schema``."""
+    if schema is None:
+        return value
+    if isinstance(schema, list):
+        return [project(item, schema[0]) for item in value] if isinstance(value, list) else value
+    if not isinstance(value, dict):
+        return value
+    # Leaves are copied inline; recursing into every field doubled the cost.
+    return {
+        key: value[key] if sub is None else project(value[key], sub)
+        for key, sub in schema.items()
+        if key in value
+    }
+
+
+if msgspec is not None:
+
+    class _Named(msgspec.Struct, omit_defaults=True):
+        name: Any = None
+
+    class _Career(msgspec.Struct, omit_defaults=True):
+        experience: Any = None
+        base: Any = None
+
+    class _Content(msgspec.Struct, omit_defaults=True):
+        content: Any = None
+
+    class _Detail(msgspec.Struct, omit_defaults=True):
+        id: Any = None
+        name: Any = None
+        updateDate: Any = None
+        belonging: _Named | None = None
+        career: _Career | None = None
+        tags: List[_Named] | None = None
+        content: _Content | None = None
+
+    class _DetailEnvelope(msgspec.Struct, omit_defaults=True):
+        code: Any = None
+        message: Any = None
+        data: _Detail | None = None
+
+    _DETAIL_DECODER = msgspec.json.Decoder(_DetailEnvelope)
+
+    def loads_detail(data: str | bytes) -> Any:
+        """Decode a ``/career/details`` response, keeping only :data:`DETAIL_SCHEMA` fields."""
+        try:
+            return msgspec.to_builtins(_DETAIL_DECODER.decode(data))
+        except msgspec.ValidationError:
+            # Unexpected shapes (a string where an object belongs) are pruned after decoding.
+            payload = loads(data)
+            if isinstance(payload, dict) and isinstance(payload.get("data"), dict):
+                payload["data"] = project(payload["data"], DETAIL_SCHEMA)
+            return payload
+
+else:
+    loads_detail = loads
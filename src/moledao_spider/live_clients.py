@@ -0,0 +1,178 @@
+"""Live HTTP clients for the Moledao career APIs, with retries and throttling."""
+
+from __future__ import annotations
+
+import logging
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Iterator, List, Tuple
+
+import requests
+from requests import Response, Session
+from tenacity import retry, retry_if_exception_type, stop_after_attempt
+
+from .adaptive import AdaptiveController, retry_after_of
+from .cache import DetailCache
+from .clients import (
+    DEFAULT_BASE_URL,
+    DEFAULT_PAGE_SIZE,
+    RETRY_ATTEMPTS,
+    RateLimiter,
+    _count_retry,
+    _handle_response,
+    _has_next_page,
+    _list_params,
+    _retry_wait,
+)
+from .filters import JobFilter
+from .jsonio import loads_detail
+from .metrics import RunMetrics
+
+logger = logging.getLogger(__name__)
+
+
+def _ensure_session(session: Session | None) -> Session:
+    return session or requests.Session()
+
+
+def _throttled_get(
+    session: Session,
+    rate_limiter: RateLimiter | None,
+    url: str,
+    params: dict,
+    headers: dict | None = None,
+    controller: AdaptiveController | None = None,
+) -> Response:
+    if controller:
+        controller.acquire()
+    if rate_limiter:
+        rate_limiter.acquire()
+    started = time.monotonic()
+    status = retry_after = None
+    try:
+        if headers:
+            resp = session.get(url, params=params, headers=headers, timeout=15)
+        else:
+            resp = session.get(url, params=params, timeout=15)
+        status = resp.status_code
+        retry_after = retry_after_of(status, resp.headers)
+        return resp
+    finally:
+        if controller:
+            controller.release(time.monotonic() - started, status, retry_after)
+
+
+@dataclass
+class LiveCareerListClient:
+    """Hits the live career list endpoint with retries."""
+
+    base_url: str = DEFAULT_BASE_URL
+    session: Session | None = None
+    rate_limiter: RateLimiter | None = None
+    page_size: int = DEFAULT_PAGE_SIZE
+    max_pages: int | None = None
+    metrics: RunMetrics | None = None
+    job_filter: JobFilter | None = None
+    controller: AdaptiveController | None = None
+
+    def __post_init__(self) -> None:
+        self.session = _ensure_session(self.session)
+
+    @retry(
+        stop=stop_after_attempt(RETRY_ATTEMPTS),
+        wait=_retry_wait,
+        retry=retry_if_exception_type((requests.RequestException, RuntimeError)),
+        before_sleep=_count_retry,
+        reraise=True,
+    )
+    def fetch_page(self, current: int) -> Tuple[List[dict], int | None]:
+        """Return the entries of page ``current`` and the reported total, if any."""
+        params = _list_params(current, self.page_size, self.job_filter)
+        url = f"{self.base_url}/career/list"
+        logger.debug("Requesting career list page %s from %s", current, url)
+        resp = _throttled_get(
+            self.session, self.rate_limiter, url, params, controller=self.controller
+        )
+        data = _handle_response(resp)
+        list_data = data.get("list") or []
+        total = data.get("total")
+        logger.info("Fetched %s jobs from live list API page %s", len(list_data), current)
+        return list_data, int(total) if total is not None else None
+
+    def iter_summaries(self) -> Iterator[dict]:
+        # Request the next page in the background while the current one is consumed.
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="list-page") as pool:
+            current = 1
+            seen = 0
+            future: Future | None = pool.submit(self.fetch_page, current)
+            while future is not None:
+                page, total = future.result()
+                seen += len(page)
+                future = None
+                if _has_next_page(page, self.page_size, seen, total, self.job_filter) and (
+                    not self.max_pages or current < self.max_pages
+                ):
+                    current += 1
+                    future = pool.submit(self.fetch_page, current)
+                yield from page
+
+    def fetch(self) -> List[dict]:
+        return list(self.iter_summaries())
+
+
+@dataclass
+class LiveCareerDetailsClient:
+    """Hits the live career detail endpoint with retries, optionally behind a cache."""
+
+    base_url: str = DEFAULT_BASE_URL
+    session: Session | None = None
+    rate_limiter: RateLimiter | None = None
+    cache: DetailCache | None = None
+    metrics: RunMetrics | None = None
+    controller: AdaptiveController | None = None
+
+    def __post_init__(self) -> None:
+        self.session = _ensure_session(self.session)
+
+    def fetch(self, job_id: str) -> dict:
+        if not self.cache:
+            return self._request(job_id)
+
+        entry = self.cache.get(job_id)
+        if entry and self.cache.is_fresh(entry):
+            self.cache.record_hit()
+            logger.debug("Serving job details for %s from cache", job_id)
+            return entry.data
+
+        data = self._request(job_id, entry.validators() if entry else None)
+        if data is None:
+            # 304 Not Modified: the stale entry is still current.
+            self.cache.refresh(job_id)
+            self.cache.record_hit(revalidated=True)
+            logger.debug("Revalidated cached job details for %s", job_id)
+            return entry.data
+        self.cache.record_miss()
+        return data
+
+    @retry(
+        stop=stop_after_attempt(RETRY_ATTEMPTS),
+        wait=_retry_wait,
+        retry=retry_if_exception_type((requests.RequestException, RuntimeError)),
+        before_sleep=_count_retry,
+        reraise=True,
+    )
+    def _request(self, job_id: str, validators: dict | None = None) -> dict | None:
+        url = f"{self.base_url}/career/details"
+        resp = _throttled_get(
+            self.session, self.rate_limiter, url, {"id": job_id}, validators, self.controller
+        )
+        if validators and resp.status_code == 304:
+            return None
+        data = _handle_response(resp, loads_detail)
+        if self.cache:
+            self.cache.put(
+                job_id, data, resp.headers.get("ETag"), resp.headers.get("Last-Modified")
+            )
+        logger.info("Fetched job details for %s", job_id)
+        return data
@@ -0,0 +1,167 @@
+"""Throughput and latency of the live clients against a Moledao-compatible API.
+
+Meant to run against :class:`~moledao_spider.mock_server.MockCareerApi`: the
+list is walked with :class:`~moledao_spider.live_clients.LiveCareerListClient`,
+then every detail is fetched with the threaded requests client or the asyncio
+httpx one. Each HTTP attempt is timed, retries included.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Tuple
+
+import requests
+
+from .adaptive import AdaptiveController
+from .clients import DEFAULT_PAGE_SIZE, RateLimiter
+from .live_clients import LiveCareerDetailsClient, LiveCareerListClient
+from .metrics import PERCENTILES, RunMetrics
+from .pipeline import fetch_details
+
+logger = logging.getLogger(__name__)
+
+HTTP_BACKENDS = ("requests", "httpx")
+REQUEST_STAGE = "http_request"
+
+
+class _TimedSession(requests.Session):
+    """Session that records the latency of every GET, failed attempts included."""
+
+    def __init__(self, metrics: RunMetrics) -> None:
+        super().__init__()
+        self.metrics = metrics
+
+    def get(self, *args, **kwargs) -> requests.Response:
+        started = time.perf_counter()
+        try:
+            return super().get(*args, **kwargs)
+        finally:
+            self.metrics.observe(REQUEST_STAGE, time.perf_counter() - started)
+
+
+@dataclass
+class LoadTestReport:
+    backend: str
+    concurrency: int
+    jobs: int
+    requests: int
+    seconds: float
+    retries: int
+    failures: int
+    latency: Dict[str, float] = field(default_factory=dict)
+    final_concurrency: int | None = None
+
+    @property
+    def requests_per_second(self) -> float:
+        return self.requests / self.seconds if self.seconds else 0.0
+
+    def summary(self) -> str:
+        latency = ", ".join(f"{name} {value * 1000:.1f}ms" for name, value in self.latency.items())
+        text = (
+            f"{self.backend} x{self.concurrency}: {self.jobs} jobs, {self.requests} requests "
+            f"in {self.seconds:.2f}s ({self.requests_per_second:.1f} req/s); "
+            f"latency {latency or 'n/a'}; {self.retries} retries, {self.failures} failed jobs"
+        )
+        if self.final_concurrency is not None:
+            text += f"; adaptive limit {self.final_concurrency}"
+        return text
+
+
+def _details(
+    backend: str,
+    base_url: str,
+    summaries: List[dict],
+    concurrency: int,
+    rate_limiter: RateLimiter | None,
+    controller: AdaptiveController | None,
+    metrics: RunMetrics,
+) -> Iterator[Tuple[dict, dict]]:
+    if backend == "httpx":
+        from .async_clients import (
+            DEFAULT_LIMITS,
+            AsyncLiveCareerDetailsClient,
+            httpx,
+            iter_details_async,
+        )
+
+        class _TimedAsyncClient(httpx.AsyncClient):
+            async def get(self, *args, **kwargs) -> httpx.Response:
+                started = time.perf_counter()
+                try:
+                    return await super().get(*args, **kwargs)
+                finally:
+                    metrics.observe(REQUEST_STAGE, time.perf_counter() - started)
+
+        return iter_details_async(
+            lambda: AsyncLiveCareerDetailsClient(
+                base_url=base_url,
+                client=_TimedAsyncClient(limits=DEFAULT_LIMITS, timeout=15),
+                rate_limiter=rate_limiter,
+                metrics=metrics,
+                controller=controller,
+            ),
+            summaries,
+            concurrency=concurrency,
+            metrics=metrics,
+        )
+    detail_client = LiveCareerDetailsClient(
+        base_url=base_url,
+        session=_TimedSession(metrics),
+        rate_limiter=rate_limiter,
+        metrics=metrics,
+        controller=controller,
+    )
+    return fetch_details(detail_client, summaries, concurrency=concurrency, metrics=metrics)
+
+
+def run_load_test(
+    base_url: str,
+    backend: str = "requests",
+    concurrency: int = 8,
+    rate_limit: float = 0.0,
+    adaptive: bool = False,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> LoadTestReport:
+    """Fetch the whole list and every detail from ``base_url`` and report how it went."""
+    if backend not in HTTP_BACKENDS:
+        raise ValueError(f"Unknown HTTP backend {backend!r}; choose from {HTTP_BACKENDS}")
+    metrics = RunMetrics()
+    rate_limiter = RateLimiter(rate_limit, burst=concurrency) if rate_limit else None
+    controller = AdaptiveController(concurrency, metrics=metrics) if adaptive else None
+    list_client = LiveCareerListClient(
+        base_url=base_url,
+        session=_TimedSession(metrics),
+        rate_limiter=rate_limiter,
+        page_size=page_size,
+        metrics=metrics,
+        controller=controller,
+    )
+    started = time.perf_counter()
+    summaries = list_client.fetch()
+    pairs = _details(
+        backend, base_url, summaries, concurrency, rate_limiter, controller, metrics
+    )
+    jobs = sum(1 for _ in pairs)
+    seconds = time.perf_counter() - started
+
+    report = metrics.report()
+    stats = report["stages"].get(REQUEST_STAGE, {})
+    counters = report["counters"]
+    return LoadTestReport(
+        backend=backend,
+        concurrency=concurrency,
+        jobs=jobs,
+        requests=stats.get("count", 0),
+        seconds=seconds,
+        retries=counters.get("retries", 0),
+        failures=counters.get("detail_failures", 0),
+        latency={
+            f"p{int(fraction * 100)}": stats[f"p{int(fraction * 100)}_seconds"]
+            for fraction in PERCENTILES
+            if stats
+        },
+        final_concurrency=controller.limit if controller else None,
+    )
@@ -6,10 +6,10 @@ import logging
 import sys
 from typing import Literal
 
-from rich.logging import RichHandler
-
 
 def configure_logging(verbose: bool = False) -> None:
+    from rich.logging import RichHandler
+
     level = logging.DEBUG if verbose else logging.INFO
     logging.basicConfig(
         level=level,
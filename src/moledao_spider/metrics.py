@@ -0,0 +1,157 @@
+"""Per-stage timing, counters and run reports (JSON and Prometheus textfile)."""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, TypeVar
+
+T = TypeVar("T")
+
+PERCENTILES = (0.5, 0.9, 0.99)
+PROMETHEUS_PREFIX = "moledao_spider"
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class RunMetrics:
+    """Thread-safe collector of stage latencies and event counters for one run."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._timings: Dict[str, List[float]] = {}
+        self._counters: Dict[str, int] = {}
+        # Per-thread stack of open stages, read by the sampling profiler.
+        self._active: Dict[int, List[str]] = {}
+        self.started_at = time.time()
+        self._started = time.perf_counter()
+
+    def observe(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            self._timings.setdefault(stage, []).append(seconds)
+
+    def incr(self, counter: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counters[counter] = self._counters.get(counter, 0) + amount
+
+    def active_stage(self, thread_id: int) -> str | None:
+        """Innermost stage currently open on ``thread_id``, if any."""
+        stack = self._active.get(thread_id)
+        return stack[-1] if stack else None
+
+    def _enter(self, name: str) -> List[str]:
+        stack = self._active.setdefault(threading.get_ident(), [])
+        stack.append(name)
+        return stack
+
+    @contextmanager
+    def label(self, name: str) -> Iterator[None]:
+        """Mark the current thread as running ``name`` without timing it."""
+        stack = self._enter(name)
+        try:
+            yield
+        finally:
+            stack.pop()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        with self.label(name):
+            try:
+                yield
+            finally:
+                self.observe(name, time.perf_counter() - start)
+
+    def time_iter(self, name: str, items: Iterable[T]) -> Iterator[T]:
+        """Yield from ``items``, recording the total time spent waiting on them."""
+        waited = 0.0
+        iterator = iter(items)
+        try:
+            while True:
+                stack = self._enter(name)
+                start = time.perf_counter()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+                finally:
+                    waited += time.perf_counter() - start
+                    stack.pop()
+                yield item
+        finally:
+            self.observe(name, waited)
+
+    def report(self) -> dict:
+        with self._lock:
+            timings = {name: sorted(values) for name, values in self._timings.items()}
+            counters = dict(self._counters)
+        stages = {}
+        for name, values in timings.items():
+            stats = {
+                "count": len(values),
+                "total_seconds": sum(values),
+                "mean_seconds": sum(values) / len(values),
+                "max_seconds": values[-1],
+            }
+            for fraction in PERCENTILES:
+                stats[f"p{int(fraction * 100)}_seconds"] = percentile(values, fraction)
+            stages[name] = stats
+        return {
+            "started_at": self.started_at,
+            "wall_seconds": time.perf_counter() - self._started,
+            "stages": stages,
+            "counters": counters,
+        }
+
+    def write_json(self, path: Path) -> None:
+        _write_atomic(path, json.dumps(self.report(), indent=2, sort_keys=True) + "\n")
+
+    def write_prometheus(self, path: Path) -> None:
+        """Write a node-exporter textfile collector file."""
+        report = self.report()
+        prefix = PROMETHEUS_PREFIX
+        lines = [f"# TYPE {prefix}_stage_seconds summary"]
+        for name, stats in sorted(report["stages"].items()):
+            label = f'stage="{name}"'
+            for fraction in PERCENTILES:
+                value = stats[f"p{int(fraction * 100)}_seconds"]
+                lines.append(f'{prefix}_stage_seconds{{{label},quantile="{fraction}"}} {value:.6f}')
+            lines.append(f"{prefix}_stage_seconds_sum{{{label}}} {stats['total_seconds']:.6f}")
+            lines.append(f"{prefix}_stage_seconds_count{{{label}}} {stats['count']}")
+        for name, value in sorted(report["counters"].items()):
+            lines.append(f"# TYPE {prefix}_{name}_total counter")
+            lines.append(f"{prefix}_{name}_total {value}")
+        lines.append(f"# TYPE {prefix}_run_duration_seconds gauge")
+        lines.append(f"{prefix}_run_duration_seconds {report['wall_seconds']:.6f}")
+        lines.append(f"# TYPE {prefix}_last_run_timestamp_seconds gauge")
+        lines.append(f"{prefix}_last_run_timestamp_seconds {report['started_at']:.0f}")
+        _write_atomic(path, "\n".join(lines) + "\n")
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    # Scrapers must never observe a half-written file.
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(text, "utf-8")
+    os.replace(tmp_path, path)
+
+
+@contextmanager
+def maybe_stage(metrics: RunMetrics | None, name: str) -> Iterator[None]:
+    """:meth:`RunMetrics.stage` that is a no-op when ``metrics`` is ``None``."""
+    if metrics is None:
+        yield
+        return
+    with metrics.stage(name):
+        yield
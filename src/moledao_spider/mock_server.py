@@ -0,0 +1,233 @@
+"""Local stand-in for the Moledao career API, for offline ``--live`` runs and load tests.
+
+:class:`MockCareerApi` serves ``/api/career/list`` and ``/api/career/details``
+from a :class:`http.server.ThreadingHTTPServer` on localhost. Jobs come from
+the HAR fixtures or from :func:`synthetic_jobs`. :class:`MockBehavior` injects
+latency, 5xx errors and 429s with ``Retry-After``, and caps the page size the
+way the real API would. Filter query parameters are ignored; clients re-check
+their filters anyway.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import random
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from .clients import DETAIL_PATH, LIST_PATH, HarCareerDetailsClient, HarCareerListClient
+
+logger = logging.getLogger(__name__)
+
+API_PREFIX = "/api"
+
+
+@dataclass
+class MockBehavior:
+    """Faults and limits applied to every request the mock API answers."""
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
+    retry_after: float | None = 1.0
+    max_page_size: int | None = None
+    seed: int | None = None
+
+
+def _detail_from_summary(summary: dict, template: dict | None) -> dict:
+    detail = dict(template or {})
+    detail.update(summary)
+    detail.setdefault("tags", [])
+    detail.setdefault("content", {"content": f"<p>{summary.get('name', '')}</p>"})
+    return detail
+
+
+def synthetic_jobs(count: int, seed: int = 0) -> Tuple[List[dict], Dict[str, dict]]:
+    """``count`` list summaries, newest first, and their details keyed by id."""
+    rng = random.Random(seed)
+    newest = datetime(2025, 1, 1, tzinfo=UTC)
+    countries = ("SG", "US", "CN", "GB", "JP")
+    tags = ("Engineering", "Operations", "Marketing", "Research", "Design")
+    summaries: List[dict] = []
+    details: Dict[str, dict] = {}
+    for index in range(count):
+        job_id = f"job-{index:07d}"
+        country = rng.choice(countries)
+        summary = {
+            "id": job_id,
+            "name": f"Role {index}",
+            "updateDate": (newest - timedelta(hours=index)).isoformat().replace("+00:00", "Z"),
+            "belonging": {"name": f"Company {index % 97}"},
+            "career": {
+                "type": rng.randint(1, 5),
+                "preferences": rng.randint(1, 4),
+                "base": json.dumps([{"value": {"city": None, "country": country}}]),
+            },
+        }
+        detail = _detail_from_summary(summary, None)
+        detail["career"] = {**summary["career"], "experience": rng.randint(1, 7)}
+        detail["tags"] = [{"name": rng.choice(tags)}]
+        detail["content"] = {"content": f"<p>{'Lorem ipsum dolor sit amet. ' * 40}</p>"}
+        summaries.append(summary)
+        details[job_id] = detail
+    return summaries, details
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    api: MockCareerApi
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: _Server
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; Nagle would hold the body for ~40ms.
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        status, body, headers = self.server.api.respond(self.path)
+        payload = json.dumps(body).encode("utf-8") if body is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        logger.debug("Mock API: " + format, *args)
+
+
+class MockCareerApi:
+    """In-process HTTP server that answers like the Moledao career API."""
+
+    def __init__(
+        self,
+        summaries: List[dict],
+        details: Dict[str, dict],
+        behavior: MockBehavior | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.summaries = summaries
+        self.details = details
+        self.behavior = behavior or MockBehavior()
+        self.host = host
+        self.port = port
+        self.served: Counter[int] = Counter()
+        self._rng = random.Random(self.behavior.seed)
+        self._lock = threading.Lock()
+        self._server: _Server | None = None
+        self._thread: threading.Thread | None = None
+
+    @classmethod
+    def from_har(
+        cls, list_har: Path, detail_hars: Sequence[Path], **kwargs: object
+    ) -> MockCareerApi:
+        """Serve the HAR summaries; jobs without a captured detail reuse one as a template."""
+        summaries = HarCareerListClient(list_har).fetch()
+        har_details = HarCareerDetailsClient(detail_hars)
+        details: Dict[str, dict] = {}
+        template = None
+        for summary in summaries:
+            job_id = str(summary.get("id"))
+            try:
+                details[job_id] = har_details.fetch(job_id)
+                template = template or details[job_id]
+            except KeyError:
+                continue
+        for summary in summaries:
+            job_id = str(summary.get("id"))
+            details.setdefault(job_id, _detail_from_summary(summary, template))
+        return cls(summaries, details, **kwargs)
+
+    @classmethod
+    def synthetic(
+        cls, count: int, behavior: MockBehavior | None = None, **kwargs: object
+    ) -> MockCareerApi:
+        seed = behavior.seed if behavior and behavior.seed is not None else 0
+        return cls(*synthetic_jobs(count, seed), behavior=behavior, **kwargs)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}{API_PREFIX}"
+
+    def _fault(self) -> Tuple[int, Dict[str, str]] | None:
+        behavior = self.behavior
+        with self._lock:
+            roll = self._rng.random()
+            delay = behavior.latency + behavior.jitter * self._rng.random()
+        if delay:
+            time.sleep(delay)
+        if roll < behavior.throttle_rate:
+            retry_after = behavior.retry_after
+            return 429, {"Retry-After": f"{retry_after:g}"} if retry_after is not None else {}
+        if roll < behavior.throttle_rate + behavior.error_rate:
+            return 500, {}
+        return None
+
+    def respond(self, raw_path: str) -> Tuple[int, dict | None, Dict[str, str]]:
+        """Status, JSON body and extra headers for a GET of ``raw_path``."""
+        parts = urlsplit(raw_path)
+        query = {key: values[0] for key, values in parse_qs(parts.query).items()}
+        fault = self._fault()
+        if fault is not None:
+            status, headers = fault
+            body = None
+        elif parts.path == API_PREFIX + LIST_PATH:
+            status, body, headers = 200, self._list(query), {}
+        elif parts.path == API_PREFIX + DETAIL_PATH:
+            status, body, headers = 200, self._detail(query), {}
+        else:
+            status, body, headers = 404, None, {}
+        with self._lock:
+            self.served[status] += 1
+        return status, body, headers
+
+    def _list(self, query: Dict[str, str]) -> dict:
+        current = max(1, int(query.get("current", 1)))
+        size = max(1, int(query.get("pageSize", 10)))
+        if self.behavior.max_page_size:
+            size = min(size, self.behavior.max_page_size)
+        page = self.summaries[(current - 1) * size : current * size]
+        return {"code": 200, "data": {"list": page, "total": len(self.summaries)}}
+
+    def _detail(self, query: Dict[str, str]) -> dict:
+        detail = self.details.get(query.get("id", ""))
+        if detail is None:
+            return {"code": 404, "message": "Career not found", "data": None}
+        return {"code": 200, "data": detail}
+
+    def start(self) -> MockCareerApi:
+        """Serve in a background thread; ``port=0`` picks a free port."""
+        server = _Server((self.host, self.port), _Handler)
+        server.api = self
+        self._server = server
+        self.port = server.server_address[1]
+        self._thread = threading.Thread(target=server.serve_forever, name="mock-api", daemon=True)
+        self._thread.start()
+        logger.info("Mock Moledao API serving %s jobs at %s", len(self.summaries), self.base_url)
+        return self
+
+    def stop(self) -> None:
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+
+    def __enter__(self) -> MockCareerApi:
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from datetime import UTC, datetime
-from typing import Any, Dict, Iterable, Mapping, Sequence
+from typing import Any, Dict, Iterable, List, Mapping, Sequence
+
+from .jsonio import loads
 
 COUNTRY_NAMES = {
     "CN": "China",
@@ -60,8 +61,8 @@ def parse_location(base_value: str | None) -> str:
         return "Unknown"
     country_code = None
     try:
-        base_data = json.loads(base_value)
-    except json.JSONDecodeError:
+        base_data = loads(base_value)
+    except ValueError:
         return base_value
 
     if isinstance(base_data, list):
@@ -157,7 +158,48 @@ class CareerRecord:
         return f"[{self.company}][{self.role}]-[{self.preference_text}]"
 
 
-def build_career_record(summary: Mapping[str, Any], detail: Mapping[str, Any]) -> CareerRecord:
+NORMALIZER_MEMO_SIZE = 65_536
+
+
+class RecordNormalizer:
+    """Field conversions shared by a batch of records: one ``now`` and memoized parses.
+
+    ``career.base`` blobs repeat across jobs and reposts share ``updateDate``
+    values, so both conversions are cached by their raw string.
+    """
+
+    def __init__(self, now: datetime | None = None, memo_size: int = NORMALIZER_MEMO_SIZE):
+        self.now = now or datetime.now(tz=UTC)
+        self.memo_size = memo_size
+        self._locations: Dict[str, str] = {}
+        self._relative: Dict[str, str] = {}
+
+    def location(self, base_value: str | None) -> str:
+        if not base_value:
+            return "Unknown"
+        location = self._locations.get(base_value)
+        if location is None:
+            if len(self._locations) >= self.memo_size:
+                self._locations.clear()
+            location = self._locations[base_value] = parse_location(base_value)
+        return location
+
+    def relative_time(self, update_date: str) -> str:
+        relative = self._relative.get(update_date)
+        if relative is None:
+            if len(self._relative) >= self.memo_size:
+                self._relative.clear()
+            relative = format_relative_time(update_date, self.now)
+            self._relative[update_date] = relative
+        return relative
+
+
+def career_record_fields(
+    summary: Mapping[str, Any],
+    detail: Mapping[str, Any],
+    normalizer: RecordNormalizer | None = None,
+) -> tuple:
+    """Field values of the :class:`CareerRecord` for a summary/detail pair, in field order."""
     job_id = str(summary.get("id") or detail.get("id"))
     company = (
         summary.get("belonging", {}).get("name")
@@ -175,24 +217,46 @@ def build_career_record(summary: Mapping[str, Any], detail: Mapping[str, Any]) -
     experience_text = lookup(EXPERIENCE_LOOKUP, exp_code)
 
     base_blob = _career_field(summary, "base") or _career_field(detail, "base")
-    location = parse_location(base_blob)
-
     update_date = str(detail.get("updateDate") or summary.get("updateDate") or "")
-    relative_time = format_relative_time(update_date)
+    if normalizer:
+        location = normalizer.location(base_blob)
+        relative_time = normalizer.relative_time(update_date)
+    else:
+        location = parse_location(base_blob)
+        relative_time = format_relative_time(update_date)
 
     tag_text = extract_tags(detail)
     html_content = extract_content(detail)
 
-    return CareerRecord(
-        job_id=job_id,
-        company=company,
-        role=role,
-        type_text=type_text,
-        preference_text=preference_text,
-        experience_text=experience_text,
-        location=location,
-        relative_time=relative_time,
-        update_date=update_date,
-        tag_text=tag_text,
-        html_content=html_content,
+    return (
+        job_id,
+        company,
+        role,
+        type_text,
+        preference_text,
+        experience_text,
+        location,
+        relative_time,
+        update_date,
+        tag_text,
+        html_content,
     )
+
+
+def build_career_record(summary: Mapping[str, Any], detail: Mapping[str, Any]) -> CareerRecord:
+    return CareerRecord(*career_record_fields(summary, detail))
+
+
+def build_career_records(
+    summaries: Iterable[Mapping[str, Any]],
+    details_by_id: Mapping[str, Mapping[str, Any]],
+    now: datetime | None = None,
+) -> List[CareerRecord]:
+    """Normalize many jobs against one ``now``; summaries without a detail are skipped."""
+    normalizer = RecordNormalizer(now)
+    records: List[CareerRecord] = []
+    for summary in summaries:
+        detail = details_by_id.get(str(summary.get("id")))
+        if detail is not None:
+            records.append(CareerRecord(*career_record_fields(summary, detail, normalizer)))
+    return records
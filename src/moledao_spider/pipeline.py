@@ -0,0 +1,90 @@
+"""Pipeline stages shared by the CLI entry points."""
+
+from __future__ import annotations
+
+import logging
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Deque, Iterable, Iterator, Tuple
+
+from .adaptive import CircuitOpenError
+from .clients import CareerDetailsClient
+from .metrics import RunMetrics, maybe_stage
+from .models import CareerRecord, build_career_record
+
+logger = logging.getLogger(__name__)
+
+
+def _fetch_one(
+    detail_client: CareerDetailsClient, job_id: str, metrics: RunMetrics | None = None
+) -> dict | None:
+    try:
+        with maybe_stage(metrics, "detail_fetch"):
+            return detail_client.fetch(job_id)
+    except CircuitOpenError:
+        raise
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("Failed to fetch detail for %s: %s", job_id, exc)
+        if metrics:
+            metrics.incr("detail_failures")
+        return None
+
+
+def _with_ids(summaries: Iterable[dict]) -> Iterator[Tuple[dict, str]]:
+    for summary in summaries:
+        job_id = summary.get("id")
+        if not job_id:
+            logger.warning("Skipping list entry without id: %s", summary)
+            continue
+        yield summary, job_id
+
+
+def fetch_details(
+    detail_client: CareerDetailsClient,
+    summaries: Iterable[dict],
+    concurrency: int = 1,
+    metrics: RunMetrics | None = None,
+) -> Iterator[Tuple[dict, dict]]:
+    """Yield ``(summary, detail)`` pairs in list order, skipping failed ids.
+
+    With ``concurrency`` above one the detail calls run on a thread pool. At most
+    ``concurrency * 2`` requests are queued ahead of the consumer, so results are
+    still yielded in the original order without buffering the whole list.
+    """
+    if concurrency <= 1:
+        for summary, job_id in _with_ids(summaries):
+            detail = _fetch_one(detail_client, job_id, metrics)
+            if detail is not None:
+                yield summary, detail
+        return
+
+    window = concurrency * 2
+    pending: Deque[Tuple[dict, Future]] = deque()
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="detail") as pool:
+        for summary, job_id in _with_ids(summaries):
+            pending.append((summary, pool.submit(_fetch_one, detail_client, job_id, metrics)))
+            if len(pending) >= window:
+                summary, future = pending.popleft()
+                detail = future.result()
+                if detail is not None:
+                    yield summary, detail
+        while pending:
+            summary, future = pending.popleft()
+            detail = future.result()
+            if detail is not None:
+                yield summary, detail
+
+
+def build_records(
+    pairs: Iterable[Tuple[dict, dict]],
+    on_record: Callable[[dict, CareerRecord], None] | None = None,
+    metrics: RunMetrics | None = None,
+) -> Iterator[CareerRecord]:
+    """Normalize ``(summary, detail)`` pairs lazily, logging each processed job."""
+    for summary, detail in pairs:
+        with maybe_stage(metrics, "record_build"):
+            record = build_career_record(summary, detail)
+        logger.info(record.log_stub())
+        if on_record:
+            on_record(summary, record)
+        yield record
@@ -0,0 +1,165 @@
+"""Run profiling: cProfile stats, sampled collapsed stacks and tracemalloc reports.
+
+cProfile only sees the thread that enabled it, so a background sampler also
+walks ``sys._current_frames()`` to capture detail-fetch workers. Its output is
+the collapsed-stack format read by ``flamegraph.pl``, speedscope and inferno.
+DOCX batches rendered in ``--render-workers`` processes are not covered.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import logging
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from pathlib import Path
+from types import CodeType, FrameType
+from typing import Dict, List, Tuple
+
+from .metrics import RunMetrics
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SAMPLE_INTERVAL = 0.005
+DEFAULT_SNAPSHOT_INTERVAL = 1.0
+TRACEMALLOC_FRAMES = 25
+TOP_ALLOCATIONS = 20
+COLLAPSED_SUFFIX = ".collapsed"
+# Allocations are attributed to the innermost frame inside these hot-path modules.
+HOT_PATHS = tuple(
+    str(Path(__file__).with_name(name)) for name in ("models.py", "exporter.py", "html_text.py")
+)
+
+
+def collapsed_path_for(profile_path: Path) -> Path:
+    return profile_path.with_suffix(COLLAPSED_SUFFIX)
+
+
+class RunProfiler:
+    """Context manager that profiles everything run inside it.
+
+    ``output`` receives cProfile stats (``.prof``) and a sibling ``.collapsed``
+    stack file; with ``by_stage`` each sampled stack is rooted at the pipeline
+    stage its thread was in. ``memory_output`` receives the top tracemalloc
+    allocation sites of the largest snapshot seen during the run.
+    """
+
+    def __init__(
+        self,
+        output: Path | None = None,
+        memory_output: Path | None = None,
+        metrics: RunMetrics | None = None,
+        by_stage: bool = False,
+        interval: float = DEFAULT_SAMPLE_INTERVAL,
+        snapshot_interval: float = DEFAULT_SNAPSHOT_INTERVAL,
+    ) -> None:
+        self.output = output
+        self.memory_output = memory_output
+        self.metrics = metrics
+        self.by_stage = by_stage and metrics is not None
+        self.interval = interval
+        self.snapshot_interval = snapshot_interval
+        self.stacks: Counter[str] = Counter()
+        self._labels: Dict[CodeType, str] = {}
+        self._profile: cProfile.Profile | None = None
+        self._snapshot: tracemalloc.Snapshot | None = None
+        self._snapshot_size = -1
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self) -> RunProfiler:
+        if self.memory_output:
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        if self.output or self.memory_output:
+            self._thread = threading.Thread(target=self._sample, name="profiler", daemon=True)
+            self._thread.start()
+        if self.output:
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self._profile:
+            self._profile.disable()
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+        if self.output:
+            self.output.parent.mkdir(parents=True, exist_ok=True)
+            self._profile.dump_stats(str(self.output))
+            collapsed = collapsed_path_for(self.output)
+            collapsed.write_text(self.collapsed(), "utf-8")
+            logger.info("Wrote profile %s and stacks %s", self.output, collapsed)
+        if self.memory_output:
+            self._take_snapshot()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            self.memory_output.parent.mkdir(parents=True, exist_ok=True)
+            self.memory_output.write_text(self.memory_report(peak), "utf-8")
+            logger.info("Wrote memory profile %s", self.memory_output)
+
+    def _sample(self) -> None:
+        own = threading.get_ident()
+        next_snapshot = time.monotonic() + self.snapshot_interval
+        while not self._stop.wait(self.interval):
+            if self.output:
+                for thread_id, frame in sys._current_frames().items():
+                    if thread_id != own:
+                        self.stacks[self._collapse(thread_id, frame)] += 1
+            if self.memory_output and time.monotonic() >= next_snapshot:
+                self._take_snapshot()
+                next_snapshot = time.monotonic() + self.snapshot_interval
+
+    def _collapse(self, thread_id: int, frame: FrameType | None) -> str:
+        labels: List[str] = []
+        while frame is not None:
+            code = frame.f_code
+            label = self._labels.get(code)
+            if label is None:
+                filename = Path(code.co_filename).name
+                label = f"{code.co_name} ({filename}:{code.co_firstlineno})"
+                self._labels[code] = label
+            labels.append(label)
+            frame = frame.f_back
+        if self.by_stage:
+            labels.append(f"stage:{self.metrics.active_stage(thread_id) or 'none'}")
+        return ";".join(reversed(labels))
+
+    def _take_snapshot(self) -> None:
+        # Keep the fullest snapshot: streamed records are gone by the end of a run.
+        current = tracemalloc.get_traced_memory()[0]
+        if current > self._snapshot_size:
+            self._snapshot = tracemalloc.take_snapshot()
+            self._snapshot_size = current
+
+    def collapsed(self) -> str:
+        """Stacks in ``frame;frame;frame count`` form, one per line."""
+        return "".join(f"{stack} {count}\n" for stack, count in sorted(self.stacks.items()))
+
+    def hot_allocations(self) -> List[Tuple[str, int, int]]:
+        """``(site, bytes, blocks)`` for the top allocation sites in the hot paths."""
+        if self._snapshot is None:
+            return []
+        filters = [tracemalloc.Filter(True, path, all_frames=True) for path in HOT_PATHS]
+        sites: Dict[str, List[int]] = {}
+        for stat in self._snapshot.filter_traces(filters).statistics("traceback"):
+            frame = next(frame for frame in reversed(stat.traceback) if frame.filename in HOT_PATHS)
+            site = f"{Path(frame.filename).name}:{frame.lineno}"
+            totals = sites.setdefault(site, [0, 0])
+            totals[0] += stat.size
+            totals[1] += stat.count
+        ranked = sorted(sites.items(), key=lambda item: item[1][0], reverse=True)
+        return [(site, size, count) for site, (size, count) in ranked[:TOP_ALLOCATIONS]]
+
+    def memory_report(self, peak: int) -> str:
+        lines = [
+            f"Peak traced memory: {peak / 2**20:.1f} MiB",
+            f"Largest snapshot: {max(self._snapshot_size, 0) / 2**20:.1f} MiB traced",
+            "Top allocation sites in models/exporter/html_text:",
+        ]
+        for site, size, count in self.hot_allocations():
+            lines.append(f"  {site:<24} {size / 1024:10.1f} KiB in {count} block(s)")
+        return "\n".join(lines) + "\n"
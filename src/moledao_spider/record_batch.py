@@ -0,0 +1,177 @@
+"""Columnar storage for many career records.
+
+Repetitive text columns are interned into per-column string tables and kept
+as small integer codes; the lookup tables are seeded from ``TYPE_LOOKUP``,
+``PREFERENCE_LOOKUP``, ``EXPERIENCE_LOOKUP`` and ``COUNTRY_NAMES``. HTML bodies
+share one UTF-8 buffer addressed by offsets. Iterating a batch yields a single
+reusable :class:`CareerRecordView`, so reading it allocates no record objects.
+"""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import fields
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Tuple
+
+from .models import (
+    COUNTRY_NAMES,
+    EXPERIENCE_LOOKUP,
+    PREFERENCE_LOOKUP,
+    TYPE_LOOKUP,
+    CareerRecord,
+    RecordNormalizer,
+    career_record_fields,
+)
+
+# Column -> (array typecode, table seed). Lookup columns only ever hold their table values.
+INTERNED_FIELDS: Dict[str, Tuple[str, Iterable[str]]] = {
+    "company": ("I", ()),
+    "type_text": ("H", TYPE_LOOKUP.values()),
+    "preference_text": ("H", PREFERENCE_LOOKUP.values()),
+    "experience_text": ("H", EXPERIENCE_LOOKUP.values()),
+    "location": ("I", COUNTRY_NAMES.values()),
+    "relative_time": ("I", ()),
+    "tag_text": ("I", ()),
+}
+PLAIN_FIELDS = ("job_id", "role", "update_date")
+_FIELD_ORDER = tuple(field.name for field in fields(CareerRecord))
+
+
+class _StringTable:
+    """Append-only string table; a value's code is its index in ``values``."""
+
+    __slots__ = ("values", "_codes")
+
+    def __init__(self, seed: Iterable[str] = ()) -> None:
+        self.values: List[str] = []
+        self._codes: Dict[str, int] = {}
+        self.code("Unknown")
+        for value in seed:
+            self.code(value)
+
+    def code(self, value: str) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+class CareerRecordBatch:
+    """Columnar, append-only collection of career records."""
+
+    def __init__(self) -> None:
+        self._tables = {name: _StringTable(seed) for name, (_, seed) in INTERNED_FIELDS.items()}
+        self._codes = {name: array(typecode) for name, (typecode, _) in INTERNED_FIELDS.items()}
+        self._plain: Dict[str, List[str]] = {name: [] for name in PLAIN_FIELDS}
+        self._html = bytearray()
+        self._html_offsets = array("Q", [0])
+
+    @classmethod
+    def from_pairs(
+        cls,
+        summaries: Iterable[Mapping[str, Any]],
+        details: Iterable[Mapping[str, Any]],
+        now: datetime | None = None,
+    ) -> CareerRecordBatch:
+        """Build a batch from parallel sequences of list summaries and detail payloads."""
+        batch = cls()
+        normalizer = RecordNormalizer(now)
+        for summary, detail in zip(summaries, details, strict=True):
+            batch._append_fields(career_record_fields(summary, detail, normalizer))
+        return batch
+
+    @classmethod
+    def from_records(cls, records: Iterable[CareerRecord]) -> CareerRecordBatch:
+        batch = cls()
+        for record in records:
+            batch.append(record)
+        return batch
+
+    def append(self, record: CareerRecord) -> None:
+        self._append_fields(tuple(getattr(record, name) for name in _FIELD_ORDER))
+
+    def _append_fields(self, values: tuple) -> None:
+        for name, value in zip(_FIELD_ORDER, values):
+            if name in self._codes:
+                self._codes[name].append(self._tables[name].code(value))
+            elif name == "html_content":
+                self._html += value.encode("utf-8")
+                self._html_offsets.append(len(self._html))
+            else:
+                self._plain[name].append(value)
+
+    def __len__(self) -> int:
+        return len(self._html_offsets) - 1
+
+    def __iter__(self) -> Iterator[CareerRecordView]:
+        """Yield one view repositioned per row; call ``detach()`` to keep a row."""
+        view = CareerRecordView(self, 0)
+        for index in range(len(self)):
+            view._index = index
+            yield view
+
+    def __getitem__(self, index: int) -> CareerRecordView:
+        if not -len(self) <= index < len(self):
+            raise IndexError(index)
+        return CareerRecordView(self, index % len(self))
+
+    def record(self, index: int) -> CareerRecord:
+        return self[index].detach()
+
+    def nbytes(self) -> int:
+        """Approximate payload bytes held by code arrays and the HTML buffer."""
+        codes = sum(column.itemsize * len(column) for column in self._codes.values())
+        return codes + len(self._html) + self._html_offsets.itemsize * len(self._html_offsets)
+
+
+def _interned(name: str) -> property:
+    def get(view: CareerRecordView) -> str:
+        batch = view._batch
+        return batch._tables[name].values[batch._codes[name][view._index]]
+
+    return property(get)
+
+
+def _plain(name: str) -> property:
+    return property(lambda view: view._batch._plain[name][view._index])
+
+
+def _html(view: CareerRecordView) -> str:
+    offsets = view._batch._html_offsets
+    start, end = offsets[view._index], offsets[view._index + 1]
+    return view._batch._html[start:end].decode("utf-8")
+
+
+class CareerRecordView:
+    """Read-only flyweight over one row of a :class:`CareerRecordBatch`.
+
+    Exposes the :class:`CareerRecord` attributes; rows yielded while iterating
+    share one view, so anything kept past the next row must be detached.
+    """
+
+    __slots__ = ("_batch", "_index")
+
+    def __init__(self, batch: CareerRecordBatch, index: int) -> None:
+        self._batch = batch
+        self._index = index
+
+    job_id = _plain("job_id")
+    company = _interned("company")
+    role = _plain("role")
+    type_text = _interned("type_text")
+    preference_text = _interned("preference_text")
+    experience_text = _interned("experience_text")
+    location = _interned("location")
+    relative_time = _interned("relative_time")
+    update_date = _plain("update_date")
+    tag_text = _interned("tag_text")
+    html_content = property(_html)
+
+    def log_stub(self) -> str:
+        return f"[{self.company}][{self.role}]-[{self.preference_text}]"
+
+    def detach(self) -> CareerRecord:
+        """Copy the current row into a standalone :class:`CareerRecord`."""
+        return CareerRecord(*(getattr(self, name) for name in _FIELD_ORDER))
@@ -0,0 +1,275 @@
+"""Sharded scraping: a coordinator publishes summary shards, workers fetch them.
+
+The coordinator splits the (deduplicated) list into shards on a work queue.
+Each worker claims shards, fetches their details and writes the records of a
+shard to its own ``shard-NNNNN/jobs.jsonl``. The merge step reads the shard
+outputs back in shard order, so exporting them numbers ``jobs-NNN.docx``
+exactly as a single run would. Queues are opened from a location string; a
+bare path or ``sqlite://`` URL selects the built-in SQLite queue, and other
+schemes can be added with :func:`register_queue_backend`.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+import shutil
+import threading
+import time
+from dataclasses import dataclass
+from itertools import islice
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Protocol
+
+from .adaptive import CircuitOpenError
+from .clients import CareerDetailsClient
+from .formats import JsonlExporter, read_jsonl_records
+from .metrics import RunMetrics
+from .models import CareerRecord
+from .pipeline import build_records, fetch_details
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+CLAIMED = "claimed"
+DONE = "done"
+FAILED = "failed"
+QUEUE_FILENAME = ".moledao-queue.sqlite"
+DEFAULT_SHARD_SIZE = 500
+DEFAULT_LEASE = 1800.0
+
+
+@dataclass(frozen=True)
+class Shard:
+    shard_id: int
+    summaries: List[dict]
+
+
+@dataclass(frozen=True)
+class ShardStatus:
+    shard_id: int
+    status: str
+    worker: str | None = None
+    output: str | None = None
+    error: str | None = None
+
+
+class WorkQueue(Protocol):
+    def publish(self, shards: Iterable[List[dict]]) -> int:
+        """Append shards of summaries and return how many were published."""
+
+    def claim(self, worker: str) -> Shard | None:
+        """Lease the next pending shard to ``worker``; ``None`` when none is left."""
+
+    def complete(self, shard_id: int, worker: str, output: str) -> bool:
+        """Mark a shard leased to ``worker`` done; ``False`` if the lease was lost."""
+
+    def fail(self, shard_id: int, worker: str, error: str) -> bool:
+        """Mark a shard leased to ``worker`` failed; ``False`` if the lease was lost."""
+
+    def retry_failed(self) -> int:
+        """Make failed shards pending again and return how many there were."""
+
+    def status(self) -> List[ShardStatus]: ...
+
+    def close(self) -> None: ...
+
+
+class SqliteWorkQueue:
+    """Work queue in one SQLite file, safe for workers in separate processes.
+
+    A claimed shard whose lease expires (its worker died) becomes claimable
+    again; failed shards stay failed until :meth:`retry_failed` is called.
+    """
+
+    def __init__(
+        self, path: Path, lease_seconds: float = DEFAULT_LEASE, clock=time.time
+    ) -> None:
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        import sqlite3  # Deferred so importing the CLI stays cheap.
+
+        self._conn = sqlite3.connect(path, timeout=60, isolation_level=None)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS shards ("
+            "shard_id INTEGER PRIMARY KEY, payload TEXT NOT NULL, status TEXT NOT NULL, "
+            "worker TEXT, claimed_at REAL, output TEXT, error TEXT)"
+        )
+
+    def publish(self, shards: Iterable[List[dict]]) -> int:
+        count = 0
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                for summaries in shards:
+                    self._conn.execute(
+                        "INSERT INTO shards (payload, status) VALUES (?, ?)",
+                        (json.dumps(summaries, ensure_ascii=False), PENDING),
+                    )
+                    count += 1
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return count
+
+    def claim(self, worker: str) -> Shard | None:
+        now = self._clock()
+        with self._lock:
+            # IMMEDIATE takes the write lock up front so two workers never claim one shard.
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT shard_id, payload FROM shards WHERE status = ? "
+                    "OR (status = ? AND claimed_at < ?) ORDER BY shard_id LIMIT 1",
+                    (PENDING, CLAIMED, now - self.lease_seconds),
+                ).fetchone()
+                if row:
+                    self._conn.execute(
+                        "UPDATE shards SET status = ?, worker = ?, claimed_at = ? "
+                        "WHERE shard_id = ?",
+                        (CLAIMED, worker, now, row[0]),
+                    )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return Shard(row[0], json.loads(row[1])) if row else None
+
+    def _finish(
+        self, shard_id: int, worker: str, status: str, output: str | None, error: str | None
+    ) -> bool:
+        with self._lock:
+            # Only the current lease holder may finish; an expired lease may be re-claimed.
+            cursor = self._conn.execute(
+                "UPDATE shards SET status = ?, output = ?, error = ? "
+                "WHERE shard_id = ? AND worker = ? AND status = ?",
+                (status, output, error, shard_id, worker, CLAIMED),
+            )
+        return cursor.rowcount == 1
+
+    def complete(self, shard_id: int, worker: str, output: str) -> bool:
+        return self._finish(shard_id, worker, DONE, output, None)
+
+    def fail(self, shard_id: int, worker: str, error: str) -> bool:
+        return self._finish(shard_id, worker, FAILED, None, error)
+
+    def retry_failed(self) -> int:
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE shards SET status = ?, worker = NULL, error = NULL WHERE status = ?",
+                (PENDING, FAILED),
+            )
+        return cursor.rowcount
+
+    def status(self) -> List[ShardStatus]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT shard_id, status, worker, output, error FROM shards ORDER BY shard_id"
+            ).fetchall()
+        return [ShardStatus(*row) for row in rows]
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+_BACKENDS: Dict[str, Callable[[str], WorkQueue]] = {
+    "sqlite": lambda location: SqliteWorkQueue(Path(location)),
+}
+
+
+def register_queue_backend(scheme: str, factory: Callable[[str], WorkQueue]) -> None:
+    """Make ``scheme://...`` locations open queues built by ``factory(rest_of_url)``."""
+    _BACKENDS[scheme] = factory
+
+
+def open_queue(location: str) -> WorkQueue:
+    scheme, separator, rest = location.partition("://")
+    if not separator:
+        return SqliteWorkQueue(Path(location))
+    factory = _BACKENDS.get(scheme)
+    if factory is None:
+        raise ValueError(f"Unknown queue backend {scheme!r}; choose from {', '.join(_BACKENDS)}")
+    return factory(rest)
+
+
+def chunk_summaries(summaries: Iterable[dict], size: int) -> Iterator[List[dict]]:
+    iterator = iter(summaries)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+@dataclass
+class WorkerReport:
+    shards: int = 0
+    records: int = 0
+    failed: int = 0
+    lost: int = 0
+
+
+def _discard_lost(report: WorkerReport, shard: Shard, worker: str, target: Path) -> None:
+    # The lease expired and another worker owns the shard; its output is the one merged.
+    logger.warning("Worker %s lost the lease on shard %s; discarding", worker, shard.shard_id)
+    shutil.rmtree(target, ignore_errors=True)
+    report.lost += 1
+
+
+def run_worker(
+    queue: WorkQueue,
+    detail_client: CareerDetailsClient,
+    output_dir: Path,
+    worker: str,
+    concurrency: int = 1,
+    metrics: RunMetrics | None = None,
+) -> WorkerReport:
+    """Claim and process shards until the queue is drained.
+
+    Each worker writes to ``shard-NNNNN/<worker>/`` so a worker whose lease
+    expired never overwrites the output of the worker that took the shard over.
+    """
+    report = WorkerReport()
+    while (shard := queue.claim(worker)) is not None:
+        target = output_dir / f"shard-{shard.shard_id:05d}" / re.sub(r"[^\w.-]", "_", worker)
+        try:
+            pairs = fetch_details(detail_client, shard.summaries, concurrency, metrics)
+            records = list(build_records(pairs, metrics=metrics))
+            written = JsonlExporter(target, metrics=metrics).export(records)
+        except CircuitOpenError as exc:
+            # Every later shard would fail the same way; leave them for another worker.
+            logger.error("Worker %s stopping: %s", worker, exc)
+            if queue.fail(shard.shard_id, worker, f"{type(exc).__name__}: {exc}"):
+                report.failed += 1
+            else:
+                _discard_lost(report, shard, worker, target)
+            break
+        except Exception as exc:  # noqa: BLE001
+            logger.exception("Shard %s failed", shard.shard_id)
+            if queue.fail(shard.shard_id, worker, f"{type(exc).__name__}: {exc}"):
+                report.failed += 1
+            else:
+                _discard_lost(report, shard, worker, target)
+            continue
+        # A shard whose details all failed still completes, with no output to merge.
+        if not queue.complete(shard.shard_id, worker, str(written[0]) if written else ""):
+            _discard_lost(report, shard, worker, target)
+            continue
+        report.shards += 1
+        report.records += len(records)
+        logger.info("Worker %s finished shard %s", worker, shard.shard_id)
+    return report
+
+
+def iter_merged_records(queue: WorkQueue) -> Iterator[CareerRecord]:
+    """Records of every shard in shard order; all shards must be done."""
+    statuses = queue.status()
+    unfinished = [status for status in statuses if status.status != DONE]
+    if unfinished:
+        summary = ", ".join(f"{s.shard_id} ({s.status})" for s in unfinished[:10])
+        raise RuntimeError(f"{len(unfinished)} shard(s) are not done: {summary}")
+    for status in statuses:
+        if status.output:
+            yield from read_jsonl_records(Path(status.output))
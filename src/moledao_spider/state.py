@@ -0,0 +1,134 @@
+"""SQLite-backed run state used for incremental scraping."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Mapping, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+STATE_FILENAME = ".moledao-state.sqlite"
+
+NEW = "new"
+CHANGED = "changed"
+UNCHANGED = "unchanged"
+
+
+def content_hash(payload: Mapping) -> str:
+    """Stable hash of a JSON payload, independent of key order."""
+    blob = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class ChangeReport:
+    new: int = 0
+    changed: int = 0
+    unchanged: int = 0
+    removed: int = 0
+
+    def summary(self) -> str:
+        return (
+            f"{self.new} new, {self.changed} changed, "
+            f"{self.unchanged} unchanged, {self.removed} removed"
+        )
+
+
+class StateStore:
+    """Remembers the ``updateDate`` and content hash of every exported job.
+
+    The table is loaded into memory on open so lookups are safe from worker
+    threads; pending updates are only written by :meth:`commit`, after the
+    corresponding jobs have been exported.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            " job_id TEXT PRIMARY KEY,"
+            " update_date TEXT NOT NULL,"
+            " content_hash TEXT NOT NULL)"
+        )
+        self._known: Dict[str, Tuple[str, str]] = {
+            job_id: (update_date, digest)
+            for job_id, update_date, digest in self._conn.execute(
+                "SELECT job_id, update_date, content_hash FROM jobs"
+            )
+        }
+        self._pending: Dict[str, Tuple[str, str]] = {}
+
+    def __enter__(self) -> "StateStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._known)
+
+    def classify(self, summary: Mapping) -> str:
+        known = self._known.get(str(summary.get("id")))
+        if known is None:
+            return NEW
+        if known != (str(summary.get("updateDate") or ""), content_hash(summary)):
+            return CHANGED
+        return UNCHANGED
+
+    def mark(self, summary: Mapping) -> None:
+        """Queue ``summary`` as exported; persisted on the next :meth:`commit`."""
+        self._pending[str(summary.get("id"))] = (
+            str(summary.get("updateDate") or ""),
+            content_hash(summary),
+        )
+
+    def commit(self, removed: Iterable[str] = ()) -> None:
+        removed = list(removed)
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO jobs (job_id, update_date, content_hash) VALUES (?, ?, ?)",
+                [(job_id, *values) for job_id, values in self._pending.items()],
+            )
+            self._conn.executemany("DELETE FROM jobs WHERE job_id = ?", [(i,) for i in removed])
+        self._known.update(self._pending)
+        for job_id in removed:
+            self._known.pop(job_id, None)
+        self._pending.clear()
+
+    def missing(self, seen_ids: Set[str]) -> Set[str]:
+        """Return stored job ids that were not seen in the current listing."""
+        return set(self._known) - seen_ids
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+class IncrementalFilter:
+    """Passes through only new or changed summaries and tallies the rest."""
+
+    def __init__(self, store: StateStore) -> None:
+        self.store = store
+        self.report = ChangeReport()
+        self.seen_ids: Set[str] = set()
+
+    def __call__(self, summaries: Iterable[dict]) -> Iterator[dict]:
+        for summary in summaries:
+            job_id = summary.get("id")
+            if job_id:
+                self.seen_ids.add(str(job_id))
+            status = self.store.classify(summary)
+            if status == UNCHANGED:
+                self.report.unchanged += 1
+                continue
+            if status == NEW:
+                self.report.new += 1
+            else:
+                self.report.changed += 1
+            yield summary
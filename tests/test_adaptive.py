@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from moledao_spider.adaptive import AdaptiveController, CircuitOpenError, parse_retry_after
+from moledao_spider.live_clients import LiveCareerDetailsClient
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _fill(controller: AdaptiveController) -> int:
+    taken = 0
+    while controller.try_acquire() == 0:
+        taken += 1
+    return taken
+
+
+def test_limit_grows_while_healthy_and_halves_on_overload() -> None:
+    clock = _Clock()
+    controller = AdaptiveController(16, clock=clock)
+    for expected in (1, 2, 4, 8):
+        assert _fill(controller) == expected
+        for _ in range(expected):
+            controller.release(0.1, 200)
+    assert controller.limit == 16
+    _fill(controller)
+    controller.release(0.1, 429)
+    # The rest of the burst was sent at the old limit and does not halve it again.
+    controller.release(0.1, 503)
+    assert controller.limit == 8
+    for _ in range(14):
+        controller.release(0.1, 200)
+    assert controller.limit == 9
+    clock.now = 1.0
+    controller.release(0.1, None)
+    assert controller.limit == 4
+    clock.now = 2.0
+    for _ in range(4):
+        controller.release(1.0, 200)
+    assert controller.limit == 2
+
+
+def test_retry_after_pauses_every_caller() -> None:
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after("Thu, 01 Jan 1970 00:00:30 GMT", now=lambda: 10.0) == 20.0
+    assert parse_retry_after("soon") is None
+    clock = _Clock()
+    controller = AdaptiveController(4, clock=clock)
+    assert controller.try_acquire() == 0
+    controller.release(0.1, 429, retry_after=5)
+    assert controller.try_acquire() == 5
+    clock.now = 5.0
+    assert controller.try_acquire() == 0
+
+
+def test_circuit_pauses_probes_then_gives_up() -> None:
+    clock = _Clock()
+    controller = AdaptiveController(
+        4, failure_threshold=2, reset_timeout=30, max_trips=2, clock=clock
+    )
+    controller.limit = 4
+    assert _fill(controller) == 4
+    controller.release(0.1, 500)
+    controller.release(0.1, 500)
+    assert controller.circuit_open and controller.try_acquire() == 30
+    # A request sent before the circuit opened does not count as the probe.
+    controller.release(0.1, 500)
+    clock.now = 30.0
+    assert controller.try_acquire() == 0
+    assert controller.try_acquire() > 0  # only one probe at a time
+    controller.release(0.1, 200)
+    assert not controller.circuit_open
+
+    controller.release(0.1, 502)
+    controller.release(0.1, 502)
+    clock.now = 60.0
+    assert controller.try_acquire() == 0
+    controller.release(0.1, 502)
+    with pytest.raises(CircuitOpenError):
+        controller.try_acquire()
+
+
+class _Response:
+    def __init__(self, status_code: int, payload: dict, headers: dict | None = None) -> None:
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.content = json.dumps(payload).encode("utf-8")
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise AssertionError("429 should be raised as RateLimitedError first")
+
+
+class _ThrottlingSession:
+    def __init__(self) -> None:
+        self.responses = [
+            _Response(429, {}, {"Retry-After": "2"}),
+            _Response(200, {"code": 200, "data": {"id": "job"}}),
+        ]
+
+    def get(self, url: str, params: dict, timeout: int) -> _Response:
+        return self.responses.pop(0)
+
+
+def test_detail_client_waits_for_retry_after(monkeypatch: pytest.MonkeyPatch) -> None:
+    sleeps: list[float] = []
+    monkeypatch.setattr(LiveCareerDetailsClient._request.retry, "sleep", sleeps.append)
+    controller = AdaptiveController(4)
+    client = LiveCareerDetailsClient(session=_ThrottlingSession(), controller=controller)
+    assert client.fetch("job") == {"id": "job"}
+    assert sleeps == [2.0]
+    assert controller.in_flight == 0
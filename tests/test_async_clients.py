@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import httpx
+from tenacity import wait_none
+
+from moledao_spider.async_clients import (
+    AsyncLiveCareerDetailsClient,
+    AsyncLiveCareerListClient,
+    afetch_details,
+    iter_details_async,
+)
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path.endswith("/career/list"):
+        assert request.url.params["pageSize"] == "300"
+        return httpx.Response(200, json={"code": 200, "data": {"list": [{"id": "a"}]}})
+    job_id = request.url.params["id"]
+    if job_id == "bad":
+        return httpx.Response(200, json={"code": 500, "msg": "nope"})
+    return httpx.Response(200, json={"code": 200, "data": {"id": job_id}})
+
+
+def _client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+
+
+def test_async_list_client_validates_payload() -> None:
+    async def run() -> list[dict]:
+        async with AsyncLiveCareerListClient(base_url="https://mock/api", client=_client()) as c:
+            return await c.fetch()
+
+    assert asyncio.run(run()) == [{"id": "a"}]
+
+
+def test_iter_details_async_keeps_order_and_skips_failures(monkeypatch) -> None:
+    monkeypatch.setattr(AsyncLiveCareerDetailsClient.fetch.retry, "wait", wait_none())
+    summaries = [{"id": "1"}, {"id": "bad"}, {"id": "2"}, {"id": "3"}]
+    pairs = list(
+        iter_details_async(
+            lambda: AsyncLiveCareerDetailsClient(base_url="https://mock/api", client=_client()),
+            summaries,
+            concurrency=2,
+        )
+    )
+    assert [detail["id"] for _, detail in pairs] == ["1", "2", "3"]
+
+
+def test_afetch_details_keeps_fetching_while_the_next_list_page_loads() -> None:
+    events: list[str] = []
+
+    class _Details:
+        async def fetch(self, job_id: str) -> dict:
+            await asyncio.sleep(0)
+            events.append(f"fetched {job_id}")
+            return {"id": job_id}
+
+    def summaries():
+        yield {"id": "1"}
+        time.sleep(0.2)  # A blocking list page request.
+        events.append("page 2")
+        yield {"id": "2"}
+
+    async def run() -> list[dict]:
+        return [detail async for _, detail in afetch_details(_Details(), summaries())]
+
+    assert [detail["id"] for detail in asyncio.run(run())] == ["1", "2"]
+    assert events[:2] == ["fetched 1", "page 2"]
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from moledao_spider.cache import DetailCache
+from moledao_spider.clients import LiveCareerDetailsClient
+
+
+class _Response:
+    def __init__(self, status_code: int, payload: dict | None = None) -> None:
+        self.status_code = status_code
+        self._payload = payload
+        self.headers = {"ETag": '"v1"'}
+
+    def raise_for_status(self) -> None:
+        return None
+
+    @property
+    def content(self) -> bytes:
+        return json.dumps(self._payload).encode("utf-8")
+
+
+class _Session:
+    def __init__(self) -> None:
+        self.calls: list[dict | None] = []
+
+    def get(self, url: str, params: dict, timeout: int, headers: dict | None = None):
+        self.calls.append(headers)
+        if headers and headers.get("If-None-Match") == '"v1"':
+            return _Response(304)
+        return _Response(200, {"code": 200, "data": {"id": params["id"]}})
+
+
+def test_detail_client_serves_fresh_entries_and_revalidates_stale(tmp_path: Path) -> None:
+    now = [1000.0]
+    cache = DetailCache(tmp_path, ttl=60, clock=lambda: now[0])
+    session = _Session()
+    client = LiveCareerDetailsClient(session=session, cache=cache)
+
+    assert client.fetch("job-1") == {"id": "job-1"}
+    assert client.fetch("job-1") == {"id": "job-1"}
+    now[0] += 120
+    assert client.fetch("job-1") == {"id": "job-1"}
+
+    assert session.calls == [None, {"If-None-Match": '"v1"'}]
+    assert (cache.hits, cache.revalidated, cache.misses) == (2, 1, 1)
+
+
+def test_detail_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    now = [0.0]
+
+    def clock() -> float:
+        now[0] += 1
+        return now[0]
+
+    cache = DetailCache(tmp_path, max_entries=2, clock=clock)
+    cache.put("a", {"id": "a"})
+    cache.put("b", {"id": "b"})
+    assert cache.get("a") is not None
+    cache.put("c", {"id": "c"})
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
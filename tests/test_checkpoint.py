@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from moledao_spider import pipeline
+from moledao_spider.checkpoint import CHECKPOINT_FILENAME, CheckpointJournal
+from moledao_spider.cli import main
+
+
+def test_journal_reloads_and_drops_torn_entry(tmp_path: Path) -> None:
+    path = tmp_path / CHECKPOINT_FILENAME
+    journal = CheckpointJournal(path)
+    journal.record_detail("a", {"id": "a", "name": "Engineer"})
+    journal.record_batch(tmp_path / "jobs-004.docx", ["a"])
+    journal.close()
+    with path.open("ab") as handle:
+        handle.write(b'{"detail":"b","payl')
+
+    resumed = CheckpointJournal(path, resume=True)
+    assert resumed.resumed and resumed.last_index == 4
+    assert resumed.written_ids == {"a"}
+    assert resumed.detail("a") == {"id": "a", "name": "Engineer"}
+    assert resumed.detail("b") is None
+    resumed.record_detail("b", {"id": "b"})
+    assert resumed.detail("b") == {"id": "b"}
+    resumed.close()
+    assert CheckpointJournal(path, resume=True).detail("b") == {"id": "b"}
+
+
+def test_cli_resume_skips_written_batches(tmp_path: Path, monkeypatch) -> None:
+    args = ["--output-dir", str(tmp_path), "--batch-size", "1"]
+    build = pipeline.build_career_record
+    calls = []
+
+    def crash_on_second(summary: dict, detail: dict):
+        calls.append(summary["id"])
+        if len(calls) == 2:
+            raise RuntimeError("killed")
+        return build(summary, detail)
+
+    monkeypatch.setattr(pipeline, "build_career_record", crash_on_second)
+    failed = CliRunner().invoke(main, args)
+    assert isinstance(failed.exception, RuntimeError)
+    first = tmp_path / "jobs-001.docx"
+    first_written = first.stat().st_mtime_ns
+    assert not (tmp_path / "jobs-002.docx").exists()
+    assert (tmp_path / CHECKPOINT_FILENAME).exists()
+
+    monkeypatch.setattr(pipeline, "build_career_record", build)
+    resumed = CliRunner().invoke(main, [*args, "--resume"], catch_exceptions=False)
+    assert resumed.exit_code == 0
+    assert first.stat().st_mtime_ns == first_written
+    assert (tmp_path / "jobs-002.docx").exists()
+    assert not (tmp_path / "jobs-003.docx").exists()
+    assert not (tmp_path / CHECKPOINT_FILENAME).exists()
+
+
+def test_cli_non_docx_run_keeps_no_journal_and_no_resume_hint(
+    tmp_path: Path, monkeypatch, caplog
+) -> None:
+    def crash(summary: dict, detail: dict):
+        raise RuntimeError("killed")
+
+    monkeypatch.setattr(pipeline, "build_career_record", crash)
+    failed = CliRunner().invoke(main, ["--output-dir", str(tmp_path), "--format", "jsonl"])
+    assert isinstance(failed.exception, RuntimeError)
+    assert not (tmp_path / CHECKPOINT_FILENAME).exists()
+    assert "--resume" not in caplog.text
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import json
+import subprocess
+import sys
 from pathlib import Path
 
 from click.testing import CliRunner
@@ -27,3 +30,93 @@ def test_cli_generates_docx_from_har(tmp_path: Path) -> None:
     )
     assert result.exit_code == 0
     assert (tmp_path / "jobs-001.docx").exists()
+
+
+def test_cli_incremental_skips_unchanged_jobs(tmp_path: Path) -> None:
+    from moledao_spider.mock_server import MockCareerApi
+    from moledao_spider.state import STATE_FILENAME, StateStore
+
+    runs = []
+    with MockCareerApi.synthetic(12) as api:
+        for run in ("first", "second"):
+            metrics_out = tmp_path / f"{run}.json"
+            result = CliRunner().invoke(
+                main,
+                ["--live", "--api-url", api.base_url, "--output-dir", str(tmp_path)]
+                + ["--format", "jsonl", "--incremental", "--metrics-out", str(metrics_out)],
+                catch_exceptions=False,
+            )
+            assert result.exit_code == 0
+            runs.append(json.loads(metrics_out.read_text()))
+            if run == "first":
+                with StateStore(tmp_path / STATE_FILENAME) as store:
+                    assert len(store) == 12
+
+    first, second = runs
+    assert first["counters"]["jobs_new"] == 12
+    assert "detail_fetch" not in second["stages"]
+    assert (second["counters"]["jobs_new"], second["counters"]["jobs_unchanged"]) == (0, 12)
+    assert len((tmp_path / "jobs.jsonl").read_text().splitlines()) == 12
+
+
+def test_cli_live_run_against_mock_api(tmp_path: Path) -> None:
+    from moledao_spider.mock_server import MockBehavior, MockCareerApi
+
+    behavior = MockBehavior(throttle_rate=0.2, retry_after=0, seed=1)
+    with MockCareerApi.synthetic(12, behavior=behavior) as api:
+        result = CliRunner().invoke(
+            main,
+            ["--live", "--api-url", api.base_url, "--output-dir", str(tmp_path)]
+            + ["--format", "jsonl", "--adaptive", "--rate-limit", "0"],
+            catch_exceptions=False,
+        )
+    assert result.exit_code == 0
+    assert len((tmp_path / "jobs.jsonl").read_text().splitlines()) == 12
+    assert api.served[429] > 0
+
+
+# Microseconds; `import moledao_spider.cli` took ~350 ms before heavy imports were deferred
+# and ~120 ms after. The budget is loose so slow CI machines pass; HEAVY_MODULES is the tight check.
+IMPORT_BUDGET_US = 500_000
+HEAVY_MODULES = (
+    "requests", "tenacity", "docx", "lxml", "bs4", "rich", "httpx", "multiprocessing", "sqlite3"
+)
+
+
+def _import_times(module: str) -> dict[str, int]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Lines read "import time: <self us> | <cumulative us> | <indented module>".
+    times = {}
+    for line in result.stderr.splitlines():
+        parts = line.split("|")
+        if line.startswith("import time:") and parts[1].strip().isdigit():
+            times[parts[2].strip()] = int(parts[1])
+    return times
+
+
+def test_cli_import_stays_within_budget_and_skips_heavy_dependencies() -> None:
+    # Best of three keeps a busy machine from failing the budget.
+    runs = [_import_times("moledao_spider.cli") for _ in range(3)]
+    assert min(times["moledao_spider.cli"] for times in runs) < IMPORT_BUDGET_US
+    loaded = {name.split(".")[0] for name in runs[0]}
+    assert loaded.isdisjoint(HEAVY_MODULES)
+
+
+def test_har_replay_to_jsonl_skips_network_and_docx_dependencies(tmp_path: Path) -> None:
+    # Logging is the only stage of a replay that needs rich.
+    unused = tuple(name for name in HEAVY_MODULES if name != "rich")
+    script = (
+        "import sys\n"
+        "from moledao_spider.cli import main\n"
+        "main(['--format', 'jsonl', '--output-dir', sys.argv[1]], standalone_mode=False)\n"
+        f"print('loaded:', *(m for m in {unused!r} if m in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script, str(tmp_path)], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.splitlines()[-1] == "loaded:"
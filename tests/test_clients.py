@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+import copy
+import json
 from pathlib import Path
 
-from moledao_spider.clients import HarCareerDetailsClient, HarCareerListClient
+from moledao_spider.clients import (
+    HarCareerDetailsClient,
+    HarCareerListClient,
+    LiveCareerListClient,
+    RateLimiter,
+)
 
 
 def test_har_clients_load_list_and_details() -> None:
@@ -19,3 +26,82 @@ def test_har_clients_load_list_and_details() -> None:
     )
     detail = details_client.fetch(list_payload[0]["id"])
     assert detail["id"] == list_payload[0]["id"]
+
+
+def test_rate_limiter_spaces_requests_after_burst() -> None:
+    clock = [0.0]
+    sleeps: list[float] = []
+
+    def fake_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        clock[0] += seconds
+
+    limiter = RateLimiter(2.0, burst=2, clock=lambda: clock[0], sleep=fake_sleep)
+    for _ in range(4):
+        limiter.acquire()
+    assert sleeps == [0.5, 0.5]
+
+
+class _FakeResponse:
+    status_code = 200
+    headers: dict = {}
+
+    def __init__(self, payload: dict) -> None:
+        self._payload = payload
+
+    def raise_for_status(self) -> None:
+        return None
+
+    @property
+    def content(self) -> bytes:
+        return json.dumps(self._payload).encode("utf-8")
+
+
+class _PagedSession:
+    def __init__(self, jobs: list[dict], total: int | None) -> None:
+        self.jobs = jobs
+        self.total = total
+        self.pages: list[int] = []
+
+    def get(self, url: str, params: dict, timeout: int) -> _FakeResponse:
+        current, size = params["current"], params["pageSize"]
+        self.pages.append(current)
+        page = self.jobs[(current - 1) * size : current * size]
+        data: dict = {"list": page}
+        if self.total is not None:
+            data["total"] = self.total
+        return _FakeResponse({"code": 200, "data": data})
+
+
+def test_live_list_client_walks_pages_until_total() -> None:
+    jobs = [{"id": str(idx)} for idx in range(7)]
+    session = _PagedSession(jobs, total=7)
+    client = LiveCareerListClient(session=session, page_size=3)
+    assert client.fetch() == jobs
+    assert session.pages == [1, 2, 3]
+
+    session = _PagedSession(jobs, total=None)
+    client = LiveCareerListClient(session=session, page_size=3, max_pages=2)
+    assert [job["id"] for job in client.iter_summaries()] == ["0", "1", "2", "3", "4", "5"]
+    assert session.pages == [1, 2]
+
+
+def test_har_list_client_replays_every_page(tmp_path: Path) -> None:
+    source = json.loads(Path("har/moledao.io_api_career_list.har").read_text())
+    entry = source["log"]["entries"][0]
+    payload = json.loads(entry["response"]["content"]["text"])
+    jobs = payload["data"]["list"]
+
+    entries = []
+    for page in (jobs[:5], jobs[5:8]):
+        page_entry = copy.deepcopy(entry)
+        page_payload = {**payload, "data": {"list": page, "total": 8}}
+        page_entry["response"]["content"]["text"] = json.dumps(page_payload)
+        entries.append(page_entry)
+    har = tmp_path / "paged.har"
+    har.write_text(json.dumps({"log": {"entries": entries}}))
+
+    assert [job["id"] for job in HarCareerListClient(har).fetch()] == [
+        job["id"] for job in jobs[:8]
+    ]
+    assert len(HarCareerListClient(har, max_pages=1).fetch()) == 5
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import base64
+import json
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from moledao_spider.clients import HarCareerDetailsClient
+from moledao_spider.dedupe import Deduplicator
+from moledao_spider.models import CareerRecord
+
+
+def test_sorted_summaries_stream_first_copies_and_drop_later_duplicates() -> None:
+    dedupe = Deduplicator()
+    consumed: list[str] = []
+
+    def source():
+        for summary in (
+            {"id": "a", "updateDate": "2024-02-01T00:00:00Z"},
+            {"id": "b"},
+            {"id": "a", "updateDate": "2024-01-01T00:00:00Z"},
+            {"id": "c"},
+        ):
+            consumed.append(summary["id"])
+            yield summary
+
+    kept = dedupe.summaries(source(), newest_first=True)
+    # Each first-seen summary comes out before the source is read any further.
+    assert next(kept)["id"] == "a" and consumed == ["a"]
+    assert next(kept)["id"] == "b" and consumed == ["a", "b"]
+    assert [item["id"] for item in kept] == ["c"]
+    assert dedupe.report.duplicate_ids == 1
+
+
+def test_unsorted_summaries_keep_the_newest_update_date() -> None:
+    # Merged HAR captures: the older copy of "a" comes first.
+    dedupe = Deduplicator()
+    kept = list(
+        dedupe.summaries(
+            [
+                {"id": "a", "updateDate": "2024-01-01T00:00:00Z"},
+                {"id": "b"},
+                {"id": "a", "updateDate": "2024-02-01T00:00:00Z"},
+                {"id": "a", "updateDate": "2023-12-01T00:00:00Z"},
+            ]
+        )
+    )
+    assert [(item["id"], item.get("updateDate")) for item in kept] == [
+        ("a", "2024-02-01T00:00:00Z"),
+        ("b", None),
+    ]
+    assert dedupe.report.duplicate_ids == 2
+
+
+def test_records_collapse_reposts_under_new_ids() -> None:
+    original = CareerRecord(
+        "1", "Co", "Dev", "Full-time", "Hybrid", "N/A", "SG", "", "", "", "<p>x</p>"
+    )
+    repost = replace(original, job_id="2", update_date="2024-05-01", relative_time="1 day ago")
+    edited = replace(original, job_id="3", html_content="<p>y</p>")
+    dedupe = Deduplicator()
+    kept = list(dedupe.records([original, repost, edited]))
+    assert [record.job_id for record in kept] == ["1", "3"]
+    assert dedupe.report.reposts == 1
+
+
+def _har_with_update_date(source: Path, target: Path, update_date: str) -> str:
+    har = json.loads(source.read_text())
+    content = har["log"]["entries"][0]["response"]["content"]
+    text = content["text"]
+    if content.get("encoding") == "base64":
+        text = base64.b64decode(text).decode("utf-8")
+    payload = json.loads(text)
+    payload["data"]["updateDate"] = update_date
+    content.pop("encoding", None)
+    content["text"] = json.dumps(payload)
+    target.write_text(json.dumps(har))
+    return str(payload["data"]["id"])
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_har_details_keep_newest_update_date(tmp_path: Path, lazy: bool) -> None:
+    source = Path("har/moledao.io_api_career_details1.har")
+    newer = tmp_path / "newer.har"
+    older = tmp_path / "older.har"
+    job_id = _har_with_update_date(source, newer, "2025-06-01T00:00:00.000Z")
+    _har_with_update_date(source, older, "2024-06-01T00:00:00.000Z")
+
+    client = HarCareerDetailsClient([newer, older], lazy=lazy, use_index=False)
+    assert client.fetch(job_id)["updateDate"] == "2025-06-01T00:00:00.000Z"
+    assert client.duplicates == 1
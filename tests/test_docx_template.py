@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import zipfile
+from pathlib import Path
+
+from docx import Document
+
+from moledao_spider.exporter import _render_chunk
+from moledao_spider.models import CareerRecord
+
+
+def _record(idx: int) -> CareerRecord:
+    return CareerRecord(
+        job_id=str(idx),
+        company=f" Lead & <Co> {idx} ",
+        role="Engineer\tCore\r\nTeam",
+        type_text="Full-time",
+        preference_text="Fully Remote",
+        experience_text="1-3 Yrs Exp",
+        location="Singapore",
+        relative_time="1 day ago",
+        update_date="2024-01-01T00:00:00Z",
+        tag_text="",
+        html_content="<p>a &amp; b</p><ul><li> padded </li></ul>",
+    )
+
+
+def test_template_engine_matches_python_docx_parts(tmp_path: Path) -> None:
+    chunk = [_record(idx) for idx in range(3)]
+    reference = _render_chunk(tmp_path / "reference.docx", chunk, engine="python-docx")
+    fast = _render_chunk(tmp_path / "fast.docx", chunk, engine="template")
+
+    with zipfile.ZipFile(reference.filename) as expected, zipfile.ZipFile(fast.filename) as actual:
+        assert actual.testzip() is None
+        assert actual.namelist() == expected.namelist()
+        for name in expected.namelist():
+            assert actual.read(name) == expected.read(name), name
+    assert len(fast.html_seconds) == 3
+
+
+def test_template_output_opens_in_python_docx(tmp_path: Path) -> None:
+    path = _render_chunk(tmp_path / "jobs-001.docx", [_record(0)], engine="template").filename
+    document = Document(str(path))
+    assert document.paragraphs[0].style.name == "Heading 1"
+    assert document.paragraphs[0].text == " Lead & <Co> 0 "
+    tail = [paragraph.text for paragraph in document.paragraphs[-3:]]
+    assert tail == ["a & b", "padded", "time: 2024-01-01T00:00:00Z"]
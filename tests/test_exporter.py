@@ -2,9 +2,10 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
 from docx import Document
 
-from moledao_spider.exporter import DocxExporter
+from moledao_spider.exporter import DocxExporter, RecordExporter
 from moledao_spider.models import CareerRecord
 
 
@@ -33,3 +34,48 @@ def test_docx_exporter_writes_heading_and_content(tmp_path: Path) -> None:
     assert "Test Co" in texts[0]
     assert any("Hello" in text for text in texts)
     assert not any("alert(1)" in text for text in texts)
+
+
+def test_docx_exporter_process_pool_keeps_numbering(tmp_path: Path) -> None:
+    jobs = []
+    for idx in range(5):
+        record = _sample_record()
+        record.job_id = f"job-{idx}"
+        record.company = f"Company {idx}"
+        jobs.append(record)
+    (tmp_path / "jobs-004.docx").write_bytes(b"")
+
+    exporter = DocxExporter(output_dir=tmp_path, batch_size=2, append=True, render_workers=2)
+    files = exporter.export(jobs)
+    assert [path.name for path in files] == ["jobs-005.docx", "jobs-006.docx", "jobs-007.docx"]
+    headings = [Document(path).paragraphs[0].text for path in files]
+    assert headings == ["Company 0", "Company 2", "Company 4"]
+
+
+def test_docx_exporter_flushes_batches_while_streaming(tmp_path: Path) -> None:
+    exporter = DocxExporter(output_dir=tmp_path, batch_size=2)
+    seen_on_disk: list[bool] = []
+
+    def jobs():
+        for idx in range(5):
+            seen_on_disk.append((tmp_path / "jobs-001.docx").exists())
+            if idx == 4:
+                raise RuntimeError("network went away")
+            yield _sample_record()
+
+    with pytest.raises(RuntimeError):
+        exporter.export(jobs())
+    assert seen_on_disk == [False, False, True, True, True]
+    assert sorted(path.name for path in tmp_path.glob("*.docx")) == [
+        "jobs-001.docx",
+        "jobs-002.docx",
+    ]
+
+
+def test_record_exporter_subclass_missing_close_fails_on_creation() -> None:
+    class _WriteOnly(RecordExporter):
+        def write(self, job: CareerRecord) -> None:
+            pass
+
+    with pytest.raises(TypeError, match="close"):
+        _WriteOnly()
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from moledao_spider.cli import main
+from moledao_spider.clients import _has_next_page, _list_params
+from moledao_spider.filters import JobFilter, resolve_code, resolve_country
+from moledao_spider.models import TYPE_LOOKUP
+
+
+def _summary(type_: int, country: str, update_date: str) -> dict:
+    base = json.dumps([{"value": {"city": None, "country": country}}])
+    return {
+        "id": f"{type_}-{country}",
+        "updateDate": update_date,
+        "career": {"type": type_, "preferences": 1, "base": base},
+    }
+
+
+def test_resolves_friendly_names_and_codes() -> None:
+    assert resolve_code("internship", TYPE_LOOKUP) == 2
+    assert resolve_code("4", TYPE_LOOKUP) == 4
+    assert resolve_country("Singapore") == "SG"
+    assert resolve_country("us") == "US"
+    with pytest.raises(ValueError, match="Full-time"):
+        resolve_code("contract", TYPE_LOOKUP)
+
+
+def test_matches_summaries_then_details() -> None:
+    job_filter = JobFilter(tags=("Rust",), countries=("SG",), types=(1,), experiences=(2,))
+    summaries = [
+        _summary(1, "SG", "2024-05-01T00:00:00Z"),
+        _summary(1, "US", "2024-05-01T00:00:00Z"),
+        _summary(2, "SG", "2024-05-01T00:00:00Z"),
+    ]
+    kept = list(job_filter.summaries(summaries))
+    assert [summary["id"] for summary in kept] == ["1-SG"]
+    detail = {"tags": [{"name": "rust"}], "career": {"experience": 2}}
+    assert job_filter.match_detail(kept[0], detail)
+    assert not job_filter.match_detail(kept[0], {**detail, "tags": [{"name": "Go"}]})
+    assert not job_filter.match_detail(kept[0], {**detail, "career": {"experience": 3}})
+
+
+def test_country_falls_back_to_the_detail_base() -> None:
+    job_filter = JobFilter(countries=("SG",))
+    summary = {"id": "1", "career": {"type": 1}}
+    assert job_filter.match_summary(summary)
+    assert job_filter.match_detail(summary, _summary(1, "SG", "2024-05-01T00:00:00Z"))
+    assert not job_filter.match_detail(summary, _summary(1, "US", "2024-05-01T00:00:00Z"))
+    assert not job_filter.match_detail(summary, {"id": "1"})
+
+
+def test_live_list_params_and_early_stop() -> None:
+    job_filter = JobFilter(
+        countries=("SG", "US"), types=(1,), updated_since=datetime(2024, 3, 1)
+    )
+    params = _list_params(2, 10, job_filter)
+    assert params["location"] == "SG,US"
+    assert params["workType"] == "1"
+    assert params["current"] == 2
+    newer = [_summary(1, "SG", "2024-04-01T00:00:00Z")] * 10
+    older = newer[:9] + [_summary(1, "SG", "2024-02-01T00:00:00Z")]
+    assert _has_next_page(newer, 10, 10, 100, job_filter)
+    assert not _has_next_page(older, 10, 10, 100, job_filter)
+    assert not job_filter.match_summary(older[-1])
+
+
+def test_cli_filters_har_summaries_before_detail_lookup(tmp_path: Path) -> None:
+    runner = CliRunner()
+    args = ["--output-dir", str(tmp_path), "--format", "jsonl", "--type", "Freelancer"]
+    result = runner.invoke(main, args, catch_exceptions=False)
+    assert result.exit_code == 0
+    records = [
+        json.loads(line) for line in (tmp_path / "jobs.jsonl").read_text().splitlines()
+    ]
+    assert records and all(record["type_text"] == "Freelancer" for record in records)
+    result = runner.invoke(main, ["--output-dir", str(tmp_path), "--country", "Atlantis"])
+    assert result.exit_code != 0
+    assert "Unknown country" in result.output
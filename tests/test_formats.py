@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import csv
+import json
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from moledao_spider.cli import main
+from moledao_spider.formats import (
+    FIELDS,
+    CsvExporter,
+    JsonlExporter,
+    MultiExporter,
+    ParquetExporter,
+    _TextFileExporter,
+)
+from moledao_spider.models import CareerRecord
+
+
+def _record(idx: int) -> CareerRecord:
+    return CareerRecord(
+        job_id=str(idx),
+        company=f"Company {idx}",
+        role="Engineer, \"Core\"",
+        type_text="Full-time",
+        preference_text="Fully Remote",
+        experience_text="1-3 Yrs Exp",
+        location="Singapore",
+        relative_time="1 day ago",
+        update_date="2024-01-01T00:00:00Z",
+        tag_text="Python, Rust",
+        html_content="<p>line one</p>\n<p>line two</p>",
+    )
+
+
+def test_multi_exporter_streams_jsonl_and_csv(tmp_path: Path) -> None:
+    exporter = MultiExporter([JsonlExporter(tmp_path), CsvExporter(tmp_path)])
+    written = exporter.export(_record(idx) for idx in range(3))
+    assert written == [tmp_path / "jobs.jsonl", tmp_path / "jobs.csv"]
+
+    rows = [json.loads(line) for line in (tmp_path / "jobs.jsonl").read_text().splitlines()]
+    assert [row["job_id"] for row in rows] == ["0", "1", "2"]
+    assert rows[0]["html_content"] == _record(0).html_content
+
+    with (tmp_path / "jobs.csv").open(newline="", encoding="utf-8") as handle:
+        table = list(csv.reader(handle))
+    assert tuple(table[0]) == FIELDS
+    assert table[1][2] == "Engineer, \"Core\""
+
+
+def test_csv_append_keeps_single_header(tmp_path: Path) -> None:
+    CsvExporter(tmp_path).export([_record(0)])
+    CsvExporter(tmp_path, append=True).export([_record(1)])
+    with (tmp_path / "jobs.csv").open(newline="", encoding="utf-8") as handle:
+        table = list(csv.reader(handle))
+    assert [row[0] for row in table] == ["job_id", "0", "1"]
+
+
+def test_parquet_exporter_writes_columns(tmp_path: Path) -> None:
+    pq = pytest.importorskip("pyarrow.parquet")
+    ParquetExporter(tmp_path).export(_record(idx) for idx in range(3))
+    table = pq.read_table(tmp_path / "jobs-001.parquet")
+    assert table.column_names == list(FIELDS)
+    assert table.column("job_id").to_pylist() == ["0", "1", "2"]
+
+
+def test_cli_writes_several_formats_in_one_pass(tmp_path: Path) -> None:
+    result = CliRunner().invoke(
+        main,
+        ["--output-dir", str(tmp_path), "--format", "docx", "--format", "jsonl"],
+        catch_exceptions=False,
+    )
+    assert result.exit_code == 0
+    assert (tmp_path / "jobs-001.docx").exists()
+    assert (tmp_path / "jobs.jsonl").read_text().count("\n") > 0
+
+
+def test_text_exporter_without_write_rows_fails_on_creation(tmp_path: Path) -> None:
+    class _NoRows(_TextFileExporter):
+        suffix = ".txt"
+
+    with pytest.raises(TypeError, match="_write_rows"):
+        _NoRows(tmp_path)
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from moledao_spider.clients import HarCareerDetailsClient
+from moledao_spider.har import iter_entry_spans, iter_har_entries
+
+DETAIL_HARS = [
+    Path("har/moledao.io_api_career_details1.har"),
+    Path("har/moledao.io_api_career_details2.har"),
+]
+
+
+def test_streamed_entries_match_full_parse_with_tiny_chunks() -> None:
+    for path in [Path("har/moledao.io_api_career_list.har"), *DETAIL_HARS]:
+        expected = json.loads(path.read_text())["log"]["entries"]
+        assert list(iter_har_entries(path, chunk_size=7)) == expected
+
+
+def test_entry_spans_are_byte_offsets(tmp_path: Path) -> None:
+    har = tmp_path / "unicode.har"
+    entries = [{"n": 1, "text": "上海 office"}, {"n": 2.5e3, "text": "né"}]
+    document = {"log": {"version": "1.2", "pages": [{"title": "职位"}], "entries": entries}}
+    har.write_text("\ufeff" + json.dumps(document, ensure_ascii=False, indent=1), "utf-8")
+
+    spans = list(iter_entry_spans(har, chunk_size=5))
+    assert [entry for entry, _ in spans] == entries
+    assert [span.load() for _, span in spans] == entries
+
+
+def test_lazy_details_client_matches_eager() -> None:
+    eager = HarCareerDetailsClient(DETAIL_HARS)
+    lazy = HarCareerDetailsClient(DETAIL_HARS, lazy=True)
+    assert not lazy._cache
+    for job_id in eager._cache:
+        assert lazy.fetch(job_id) == eager.fetch(job_id)
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import base64
+import copy
+import json
+import os
+import shutil
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from moledao_spider import clients
+from moledao_spider.cli import main
+from moledao_spider.clients import HarCareerDetailsClient, HarCareerListClient
+from moledao_spider.har_index import build_har_index, index_path_for, load_index_for
+
+
+def _copy_hars(tmp_path: Path) -> list[Path]:
+    copies = []
+    for path in sorted(Path("har").glob("*.har")):
+        target = tmp_path / path.name
+        shutil.copy(path, target)
+        copies.append(target)
+    return copies
+
+
+def test_har_index_command_builds_sidecars_used_by_clients(tmp_path: Path, monkeypatch) -> None:
+    hars = _copy_hars(tmp_path)
+    list_har = tmp_path / "moledao.io_api_career_list.har"
+    detail_hars = [path for path in hars if path != list_har]
+    expected_list = HarCareerListClient(list_har).fetch()
+    eager = HarCareerDetailsClient(detail_hars)
+
+    result = CliRunner().invoke(main, ["har-index", *map(str, hars)], catch_exceptions=False)
+    assert result.exit_code == 0
+    assert all(index_path_for(path).exists() for path in hars)
+
+    def fail(*_args, **_kwargs):
+        raise AssertionError("HAR should not be parsed when an index exists")
+
+    monkeypatch.setattr(clients, "iter_har_entries", fail)
+    monkeypatch.setattr(clients, "iter_entry_spans", fail)
+    assert HarCareerListClient(list_har).fetch() == expected_list
+    indexed = HarCareerDetailsClient(detail_hars)
+    for job_id in eager._cache:
+        assert indexed.fetch(job_id) == eager.fetch(job_id)
+
+
+def test_stale_index_is_ignored(tmp_path: Path) -> None:
+    har = _copy_hars(tmp_path)[0]
+    CliRunner().invoke(main, ["har-index", str(har)], catch_exceptions=False)
+    stat = index_path_for(har).stat()
+    os.utime(har, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert load_index_for(har) is None
+
+
+def test_index_keeps_newest_duplicate_like_the_har_client(tmp_path: Path) -> None:
+    source = json.loads(Path("har/moledao.io_api_career_details1.har").read_text())
+    entry = source["log"]["entries"][0]
+    content = entry["response"]["content"]
+    text = content.pop("text")
+    if content.pop("encoding", None) == "base64":
+        text = base64.b64decode(text).decode("utf-8")
+    entries = []
+    for update_date in ("2025-06-01T00:00:00.000Z", "2024-06-01T00:00:00.000Z"):
+        payload = json.loads(text)
+        payload["data"]["updateDate"] = update_date
+        duplicate = copy.deepcopy(entry)
+        duplicate["response"]["content"]["text"] = json.dumps(payload)
+        entries.append(duplicate)
+    har = tmp_path / "duplicates.har"
+    har.write_text(json.dumps({"log": {"entries": entries}}))
+    job_id = str(payload["data"]["id"])
+
+    eager = HarCareerDetailsClient([har], use_index=False).fetch(job_id)
+    build_har_index(har)
+    indexed = HarCareerDetailsClient([har]).fetch(job_id)
+    assert indexed == eager
+    assert indexed["updateDate"] == "2025-06-01T00:00:00.000Z"
+
+
+def test_index_skips_list_pages_of_other_endpoints(tmp_path: Path) -> None:
+    source = json.loads(Path("har/moledao.io_api_career_list.har").read_text())
+    entries = source["log"]["entries"]
+    other = copy.deepcopy(next(e for e in entries if "/career/list" in e["request"]["url"]))
+    other["request"]["url"] = other["request"]["url"].replace("/career/list", "/career/hot")
+    source["log"]["entries"] = [other, *entries]
+    har = tmp_path / "list.har"
+    har.write_text(json.dumps(source))
+
+    eager = list(HarCareerListClient(har, use_index=False).iter_summaries())
+    build_har_index(har)
+    assert list(HarCareerListClient(har).iter_summaries()) == eager
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import pytest
+
+from moledao_spider.html_text import _CONVERTERS, HtmlConverter, _available
+
+BACKENDS = [name for name in _CONVERTERS if _available(name)]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_backends_emit_each_block_once(backend: str) -> None:
+    convert = HtmlConverter(backend, memo_size=0)
+    html = (
+        "<div>Intro<p>A &amp; <b>B</b></p><!-- note --><style>p{}</style>"
+        "<ul><li>one<br/>two</li></ul>Outro</div>"
+    )
+    assert convert(html) == ["Intro", "A & B", "one two", "Outro"]
+    assert convert("") == ["N/A"]
+    assert convert("<script>alert(1)</script>") == ["N/A"]
+
+
+def test_converter_memoizes_by_content() -> None:
+    convert = HtmlConverter("html.parser", memo_size=1)
+    calls: list[str] = []
+    original = convert._convert
+    convert._convert = lambda html: calls.append(html) or original(html)
+
+    first = convert("<p>Same</p>")
+    first.append("mutated")
+    assert convert("<p>Same</p>") == ["Same"]
+    convert("<p>Other</p>")
+    convert("<p>Same</p>")
+    assert calls == ["<p>Same</p>", "<p>Other</p>", "<p>Same</p>"]
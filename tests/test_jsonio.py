@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from moledao_spider import clients
+from moledao_spider.clients import HarCareerDetailsClient, HarCareerListClient
+from moledao_spider.har import extract_entry_json, iter_har_entries
+from moledao_spider.jsonio import DETAIL_SCHEMA, loads_detail, project
+from moledao_spider.models import build_career_record
+
+DETAIL_HAR = Path("har/moledao.io_api_career_details1.har")
+
+
+def test_project_keeps_only_selected_fields() -> None:
+    detail = {
+        "id": "1",
+        "forms": [{"question": "why"}],
+        "belonging": {"name": "Co", "logo": "/x.png"},
+        "career": {"experience": 4, "base": "[]", "salaryFrom": 0},
+        "tags": [{"name": "Rust", "id": 7}, "odd"],
+        "content": None,
+    }
+    assert project(detail, DETAIL_SCHEMA) == {
+        "id": "1",
+        "belonging": {"name": "Co"},
+        "career": {"experience": 4, "base": "[]"},
+        "tags": [{"name": "Rust"}, "odd"],
+        "content": None,
+    }
+
+
+def test_slim_details_build_the_same_records() -> None:
+    list_client = HarCareerListClient(Path("har/moledao.io_api_career_list.har"))
+    summaries = {summary["id"]: summary for summary in list_client.iter_summaries()}
+    entries = list(iter_har_entries(DETAIL_HAR))
+    assert entries
+    for entry in entries:
+        full = extract_entry_json(entry)["data"]
+        slim = project(full, DETAIL_SCHEMA)
+        assert "forms" in full and "forms" not in slim
+        summary = summaries[full["id"]]
+        assert build_career_record(summary, slim) == build_career_record(summary, full)
+
+
+def test_msgspec_detail_decoding_matches_the_schema() -> None:
+    pytest.importorskip("msgspec")
+    for entry in iter_har_entries(DETAIL_HAR):
+        full = extract_entry_json(entry)
+        typed = extract_entry_json(entry, loads_detail)
+        assert typed["data"] == project(full["data"], DETAIL_SCHEMA)
+
+
+def test_har_details_skip_non_api_entries_without_decoding(tmp_path: Path, monkeypatch) -> None:
+    har = json.loads(DETAIL_HAR.read_text())
+    detail_entry = har["log"]["entries"][0]
+    noise = {
+        "request": {"url": "https://moledao.io/static/app.js"},
+        "response": {"content": {"text": "{\"data\": {\"id\": \"not-a-job\"}}"}},
+    }
+    har["log"]["entries"] = [noise, detail_entry]
+    path = tmp_path / "mixed.har"
+    path.write_text(json.dumps(har))
+
+    decoded: list[str] = []
+
+    def tracking(data):
+        decoded.append(data)
+        return loads_detail(data)
+
+    monkeypatch.setattr(clients, "loads_detail", tracking)
+    client = HarCareerDetailsClient([path], use_index=False)
+    assert len(decoded) == 1
+    assert client.fetch(extract_entry_json(detail_entry)["data"]["id"])
+
+
+def test_stdlib_fallback_when_no_fast_decoder_is_installed() -> None:
+    script = (
+        "import sys\n"
+        "sys.modules['orjson'] = sys.modules['msgspec'] = None\n"
+        "from moledao_spider import jsonio\n"
+        "body = b'{\"code\": 200, \"data\": {\"id\": \"1\", \"link\": \"x\"}}'\n"
+        "payload = jsonio.loads_detail(body)\n"
+        "print(jsonio.BACKEND, payload['data'])\n"
+    )
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True)
+    assert result.stdout.strip() == "json {'id': '1', 'link': 'x'}", result.stderr
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from moledao_spider.cli import main
+from moledao_spider.metrics import RunMetrics, percentile
+
+
+def test_percentile_uses_nearest_rank() -> None:
+    values = [float(idx) for idx in range(1, 101)]
+    assert percentile(values, 0.5) == 50.0
+    assert percentile(values, 0.99) == 99.0
+    assert percentile([], 0.9) == 0.0
+
+
+def test_run_metrics_prometheus_textfile(tmp_path: Path) -> None:
+    metrics = RunMetrics()
+    metrics.observe("detail_fetch", 0.25)
+    metrics.incr("retries", 2)
+    path = tmp_path / "run.prom"
+    metrics.write_prometheus(path)
+    text = path.read_text()
+    assert 'moledao_spider_stage_seconds{stage="detail_fetch",quantile="0.5"} 0.250000' in text
+    assert "moledao_spider_retries_total 2" in text
+
+
+def test_cli_writes_run_report(tmp_path: Path) -> None:
+    report_path = tmp_path / "run.json"
+    result = CliRunner().invoke(
+        main,
+        ["--output-dir", str(tmp_path / "out"), "--metrics-out", str(report_path)],
+        catch_exceptions=False,
+    )
+    assert result.exit_code == 0
+    report = json.loads(report_path.read_text())
+    stages = report["stages"]
+    for stage in ("list_fetch", "detail_fetch", "record_build", "html_convert", "document_save"):
+        assert stages[stage]["count"] >= 1
+    assert report["counters"]["jobs_exported"] == stages["record_build"]["count"]
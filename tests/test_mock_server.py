@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+import requests
+from tenacity import stop_after_attempt
+
+from moledao_spider.live_clients import LiveCareerDetailsClient, LiveCareerListClient
+from moledao_spider.loadtest import run_load_test
+from moledao_spider.mock_server import MockBehavior, MockCareerApi
+
+LIST_HAR = Path("har/moledao.io_api_career_list.har")
+DETAIL_HARS = (
+    Path("har/moledao.io_api_career_details1.har"),
+    Path("har/moledao.io_api_career_details2.har"),
+)
+
+
+def test_har_backed_mock_pages_list_and_serves_every_detail() -> None:
+    behavior = MockBehavior(max_page_size=50)
+    with MockCareerApi.from_har(LIST_HAR, DETAIL_HARS, behavior=behavior) as api:
+        summaries = LiveCareerListClient(base_url=api.base_url, page_size=300).fetch()
+        assert [summary["id"] for summary in summaries] == [s["id"] for s in api.summaries]
+        details = LiveCareerDetailsClient(base_url=api.base_url)
+        assert details.fetch(summaries[-1]["id"])["id"] == summaries[-1]["id"]
+        with pytest.raises(RuntimeError, match="Career not found"):
+            details._request.retry_with(stop=stop_after_attempt(1))(details, "missing")
+    assert api.served[200] == 3 + 1 + 1
+
+
+def test_mock_faults_carry_retry_after() -> None:
+    behavior = MockBehavior(throttle_rate=1.0, retry_after=7)
+    with MockCareerApi.synthetic(3, behavior=behavior) as api:
+        response = requests.get(f"{api.base_url}/career/list", timeout=5)
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "7"
+
+
+@pytest.mark.parametrize("backend", ["requests", "httpx"])
+def test_load_test_reports_throughput_and_retries(backend: str) -> None:
+    if backend == "httpx":
+        pytest.importorskip("httpx")
+    behavior = MockBehavior(throttle_rate=0.1, retry_after=0, seed=3)
+    with MockCareerApi.synthetic(60, behavior=behavior) as api:
+        report = run_load_test(api.base_url, backend, concurrency=4, page_size=25)
+        throttled = api.served[429]
+    assert report.jobs + report.failures == 60
+    assert report.requests == sum(api.served.values())
+    # A job throttled on every attempt fails after its last try, which is not retried.
+    assert 0 < report.retries <= throttled
+    assert report.requests_per_second > 0
+    assert set(report.latency) == {"p50", "p90", "p99"}
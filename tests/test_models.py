@@ -6,6 +6,7 @@ from pathlib import Path
 from moledao_spider.models import (
     CareerRecord,
     build_career_record,
+    build_career_records,
     format_relative_time,
     parse_location,
 )
@@ -46,3 +47,27 @@ def test_format_relative_time_outputs_expected_strings() -> None:
     assert format_relative_time("2024-01-02T00:00:00+00:00", now=now) == "just now"
     future = now + timedelta(hours=5)
     assert format_relative_time(future.isoformat(), now=now) == "in 5 hours"
+
+
+def test_build_career_records_shares_now_and_skips_missing_details() -> None:
+    summaries = load_har_payload(Path("har/moledao.io_api_career_list.har"))["data"]["list"]
+    details = {
+        str(payload["data"]["id"]): payload["data"]
+        for payload in (
+            load_har_payload(Path("har/moledao.io_api_career_details1.har")),
+            load_har_payload(Path("har/moledao.io_api_career_details2.har")),
+        )
+    }
+    now = datetime(2026, 1, 1, tzinfo=UTC)
+
+    records = build_career_records(summaries, details, now=now)
+
+    assert [record.job_id for record in records] == [
+        str(summary["id"]) for summary in summaries if str(summary["id"]) in details
+    ]
+    for record in records:
+        expected = build_career_record(
+            next(s for s in summaries if str(s["id"]) == record.job_id), details[record.job_id]
+        )
+        assert record.location == expected.location
+        assert record.relative_time == format_relative_time(record.update_date, now=now)
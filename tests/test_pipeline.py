@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from moledao_spider.pipeline import fetch_details
+
+
+class _SlowDetails:
+    def __init__(self) -> None:
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def fetch(self, job_id: str) -> dict:
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        # Later ids finish first so ordering has to be restored by the pipeline.
+        time.sleep(0.01 * (10 - int(job_id)))
+        with self._lock:
+            self.active -= 1
+        if job_id == "3":
+            raise RuntimeError("boom")
+        return {"id": job_id}
+
+
+def test_fetch_details_keeps_order_and_skips_failures() -> None:
+    client = _SlowDetails()
+    summaries = [{"id": str(idx)} for idx in range(10)] + [{"name": "no id"}]
+    pairs = list(fetch_details(client, summaries, concurrency=4))
+    assert [detail["id"] for _, detail in pairs] == [str(i) for i in range(10) if i != 3]
+    assert 1 < client.peak <= 4
+
+
+def test_fetch_details_sequential_matches_concurrent() -> None:
+    summaries = [{"id": str(idx)} for idx in range(5)]
+    sequential = list(fetch_details(_SlowDetails(), summaries))
+    concurrent = list(fetch_details(_SlowDetails(), summaries, concurrency=3))
+    assert sequential == concurrent
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import pstats
+import threading
+import time
+from pathlib import Path
+
+from moledao_spider.metrics import RunMetrics
+from moledao_spider.models import build_career_record
+from moledao_spider.profiling import RunProfiler, collapsed_path_for
+
+from tests.utils import load_har_payload
+
+
+def _busy_worker(metrics: RunMetrics) -> None:
+    with metrics.stage("detail_fetch"):
+        deadline = time.perf_counter() + 0.1
+        while time.perf_counter() < deadline:
+            pass
+
+
+def test_profiler_samples_worker_threads_by_stage(tmp_path: Path) -> None:
+    metrics = RunMetrics()
+    output = tmp_path / "run.prof"
+    with RunProfiler(output, metrics=metrics, by_stage=True, interval=0.001):
+        worker = threading.Thread(target=_busy_worker, args=(metrics,))
+        worker.start()
+        worker.join()
+
+    assert pstats.Stats(str(output)).total_calls > 0
+    stacks = collapsed_path_for(output).read_text().splitlines()
+    assert any(
+        line.startswith("stage:detail_fetch;") and "_busy_worker (test_profiling.py" in line
+        for line in stacks
+    )
+
+
+def test_memory_profile_reports_model_allocations(tmp_path: Path) -> None:
+    summary = load_har_payload(Path("har/moledao.io_api_career_list.har"))["data"]["list"][0]
+    detail = load_har_payload(Path("har/moledao.io_api_career_details1.har"))["data"]
+    report = tmp_path / "memory.txt"
+    with RunProfiler(memory_output=report):
+        records = [build_career_record(summary, detail) for _ in range(500)]
+
+    text = report.read_text()
+    assert text.startswith("Peak traced memory:")
+    assert "models.py:" in text
+    assert len(records) == 500
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from moledao_spider.exporter import DocxExporter
+from moledao_spider.formats import JsonlExporter
+from moledao_spider.models import build_career_record
+from moledao_spider.record_batch import CareerRecordBatch
+
+from tests.utils import load_har_payload
+
+
+def _pairs() -> tuple[list[dict], list[dict]]:
+    summaries = load_har_payload(Path("har/moledao.io_api_career_list.har"))["data"]["list"]
+    details = [
+        load_har_payload(Path("har/moledao.io_api_career_details1.har"))["data"],
+        load_har_payload(Path("har/moledao.io_api_career_details2.har"))["data"],
+    ]
+    return summaries[:2] * 50, details * 50
+
+
+def test_batch_rows_match_career_records() -> None:
+    summaries, details = _pairs()
+    batch = CareerRecordBatch.from_pairs(summaries, details)
+    expected = [build_career_record(s, d) for s, d in zip(summaries, details)]
+
+    assert len(batch) == 100
+    assert [batch.record(idx) for idx in range(len(batch))] == expected
+    views = list(batch)
+    assert all(view is views[0] for view in views)
+    assert batch[-1].detach() == expected[-1]
+    # 100 rows of repeated companies still intern to a handful of table entries.
+    assert len(batch._tables["company"].values) <= 3
+
+
+def test_exporters_consume_batches(tmp_path: Path) -> None:
+    summaries, details = _pairs()
+    batch = CareerRecordBatch.from_pairs(summaries[:4], details[:4])
+
+    JsonlExporter(tmp_path).export(batch)
+    rows = [json.loads(line) for line in (tmp_path / "jobs.jsonl").read_text().splitlines()]
+    assert [row["job_id"] for row in rows] == [view.job_id for view in batch]
+
+    written = DocxExporter(tmp_path, batch_size=2, engine="template").export(batch)
+    assert [path.name for path in written] == ["jobs-001.docx", "jobs-002.docx"]
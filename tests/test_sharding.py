@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from moledao_spider.cli import main
+from moledao_spider.sharding import (
+    CLAIMED,
+    DONE,
+    FAILED,
+    SqliteWorkQueue,
+    chunk_summaries,
+    open_queue,
+    run_worker,
+)
+
+
+def test_sqlite_queue_claims_each_shard_once_and_reclaims_expired_leases(tmp_path: Path) -> None:
+    now = [1000.0]
+    queue = SqliteWorkQueue(tmp_path / "queue.sqlite", lease_seconds=60, clock=lambda: now[0])
+    other = SqliteWorkQueue(tmp_path / "queue.sqlite", lease_seconds=60, clock=lambda: now[0])
+    summaries = [{"id": str(index)} for index in range(5)]
+    assert queue.publish(chunk_summaries(summaries, 2)) == 3
+
+    first, second = queue.claim("a"), other.claim("b")
+    assert (first.shard_id, second.shard_id) == (1, 2)
+    assert first.summaries == [{"id": "0"}, {"id": "1"}]
+    assert queue.complete(first.shard_id, "a", "out.jsonl")
+    assert queue.claim("a").shard_id == 3
+    assert queue.fail(3, "a", "boom")
+    assert queue.claim("a") is None
+
+    # Worker "b" went silent; its lease expires and the shard is handed out again.
+    now[0] += 61
+    assert queue.claim("c").shard_id == 2
+    assert queue.retry_failed() == 1
+    assert [(s.status, s.worker) for s in queue.status()] == [
+        (DONE, "a"),
+        (CLAIMED, "c"),
+        ("pending", None),
+    ]
+    # "b" comes back after losing its lease; only the new holder "c" may finish the shard.
+    assert not other.complete(2, "b", "stale.jsonl")
+    assert queue.status()[1].status == CLAIMED
+    assert queue.fail(2, "c", "again")
+    assert queue.status()[1].status == FAILED
+    queue.close()
+    other.close()
+    reopened = open_queue(f"sqlite://{tmp_path / 'queue.sqlite'}")
+    assert isinstance(reopened, SqliteWorkQueue) and len(reopened.status()) == 3
+    reopened.close()
+
+
+def test_shard_publish_work_merge_matches_a_single_run(tmp_path: Path) -> None:
+    runner = CliRunner()
+    sharded, single = tmp_path / "sharded", tmp_path / "single"
+    for args in (
+        ["shard", "publish", "--output-dir", str(sharded), "--shard-size", "25"],
+        ["shard", "work", "--output-dir", str(sharded), "--worker-id", "w1"],
+        ["shard", "merge", "--output-dir", str(sharded), "--format", "jsonl"],
+        ["run", "--output-dir", str(single), "--format", "jsonl"],
+    ):
+        result = runner.invoke(main, args, catch_exceptions=False)
+        assert result.exit_code == 0, result.output
+
+    merged = [json.loads(line) for line in (sharded / "jobs.jsonl").read_text().splitlines()]
+    expected = [json.loads(line) for line in (single / "jobs.jsonl").read_text().splitlines()]
+    assert merged and [row["job_id"] for row in merged] == [row["job_id"] for row in expected]
+    statuses = SqliteWorkQueue(sharded / ".moledao-queue.sqlite").status()
+    assert len(statuses) == 5 and {status.status for status in statuses} == {DONE}
+
+    republish = runner.invoke(main, ["shard", "publish", "--output-dir", str(sharded)])
+    assert republish.exit_code != 0 and "already holds shards" in republish.output
+
+
+def test_merge_refuses_unfinished_shards(tmp_path: Path) -> None:
+    queue = SqliteWorkQueue(tmp_path / ".moledao-queue.sqlite")
+    queue.publish([[{"id": "1"}]])
+    queue.close()
+    result = CliRunner().invoke(main, ["shard", "merge", "--output-dir", str(tmp_path)])
+    assert result.exit_code != 0
+    assert "1 shard(s) are not done" in result.output
+    assert not list(tmp_path.glob("jobs-*.docx"))
+
+
+def test_worker_discards_output_of_a_lost_lease(tmp_path: Path) -> None:
+    now = [1000.0]
+    queue = SqliteWorkQueue(tmp_path / "queue.sqlite", lease_seconds=60, clock=lambda: now[0])
+    queue.publish([[{"id": "1"}]])
+
+    class _SlowClient:
+        def fetch(self, job_id: str) -> dict:
+            # While "slow" works, its lease expires and "fast" takes the shard over.
+            now[0] += 61
+            assert queue.claim("fast").shard_id == 1
+            raise KeyError(job_id)
+
+    report = run_worker(queue, _SlowClient(), tmp_path, "slow")
+    assert (report.shards, report.failed, report.lost) == (0, 0, 1)
+    assert not (tmp_path / "shard-00001" / "slow").exists()
+    assert queue.status()[0].worker == "fast" and queue.status()[0].status == CLAIMED
+    queue.close()
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from moledao_spider.state import IncrementalFilter, StateStore
+
+
+def test_incremental_filter_reports_changes_across_runs(tmp_path: Path) -> None:
+    db = tmp_path / "state.sqlite"
+    first = [
+        {"id": "a", "updateDate": "2024-01-01"},
+        {"id": "b", "updateDate": "2024-01-01"},
+        {"id": "c", "updateDate": "2024-01-01"},
+    ]
+    with StateStore(db) as store:
+        changes = IncrementalFilter(store)
+        for summary in changes(first):
+            store.mark(summary)
+        store.commit()
+        assert changes.report.new == 3
+
+    second = [
+        {"id": "a", "updateDate": "2024-01-01"},
+        {"id": "b", "updateDate": "2024-01-02"},
+        {"id": "d", "updateDate": "2024-01-02"},
+    ]
+    with StateStore(db) as store:
+        changes = IncrementalFilter(store)
+        fetched = [summary["id"] for summary in changes(second)]
+        removed = store.missing(changes.seen_ids)
+        store.commit(removed)
+        assert fetched == ["b", "d"]
+        assert removed == {"c"}
+        assert (changes.report.new, changes.report.changed, changes.report.unchanged) == (1, 1, 1)
+
+    with StateStore(db) as store:
+        # b and d were never marked as exported, so both are fetched again.
+        assert len(store) == 2
+        assert [s["id"] for s in IncrementalFilter(store)(second)] == ["b", "d"]